@@ -3,9 +3,7 @@ Enhanced security module for authentication
 Implements secure JWT handling, rate limiting, and validation
 """
 
-import os
 import time
-import hashlib
 import secrets
 import jwt
 import aiohttp
@@ -16,8 +14,10 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import structlog
 from google.oauth2 import id_token
 from google.auth.transport import requests
-import redis
-from collections import defaultdict
+import requests as http_requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict, deque
 import asyncio
 
 from config import settings
@@ -26,20 +26,24 @@ logger = structlog.get_logger()
 
 # Rate limiting storage (use Redis in production)
 class RateLimiter:
+    # Upper bound on remembered attempts per identifier; well above any max_attempts in use
+    MAX_TRACKED_ATTEMPTS = 1000
+
     def __init__(self):
-        self.attempts = defaultdict(list)
+        # Oldest attempt on the left, so expiry only pops from the front
+        self.attempts = defaultdict(lambda: deque(maxlen=self.MAX_TRACKED_ATTEMPTS))
         self.blocked_ips = {}
         
     def is_rate_limited(self, identifier: str, max_attempts: int = 100, window_minutes: int = 1) -> bool:
         """Check if identifier is rate limited"""
-        now = time.time()
+        # Monotonic so wall-clock adjustments can't shorten or extend a window
+        now = time.monotonic()
         window_start = now - (window_minutes * 60)
         
         # Clean old attempts
-        self.attempts[identifier] = [
-            attempt_time for attempt_time in self.attempts[identifier] 
-            if attempt_time > window_start
-        ]
+        attempts = self.attempts[identifier]
+        while attempts and attempts[0] <= window_start:
+            attempts.popleft()
         
         # Check if blocked
         if identifier in self.blocked_ips:
@@ -49,7 +53,7 @@ class RateLimiter:
                 del self.blocked_ips[identifier]
         
         # Check rate limit
-        if len(self.attempts[identifier]) >= max_attempts:
+        if len(attempts) >= max_attempts:
             # Block for 5 minutes
             self.blocked_ips[identifier] = now + (5 * 60)
             return True
@@ -58,7 +62,7 @@ class RateLimiter:
     
     def record_attempt(self, identifier: str):
         """Record an authentication attempt"""
-        self.attempts[identifier].append(time.time())
+        self.attempts[identifier].append(time.monotonic())
 
 # Global rate limiter
 rate_limiter = RateLimiter()
@@ -177,16 +181,46 @@ class GoogleOAuthValidator:
         self.client_id = settings.google_client_id
         if not self.client_id:
             raise ValueError("Google Client ID not configured")
+        # Reused across validations so Google cert fetches and userinfo calls keep their connections alive
+        self._google_request = requests.Request(session=self._build_google_session())
+        self._http_session: Optional[aiohttp.ClientSession] = None
+    
+    @staticmethod
+    def _build_google_session() -> http_requests.Session:
+        """Build the pooled session used to fetch Google's signing certificates"""
+        session = http_requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, allowed_methods=frozenset({"GET"}))
+        ))
+        return session
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._http_session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
     
     async def validate_google_token(self, token: str) -> Dict[str, Any]:
         """Validate Google OAuth token and extract user info"""
         try:
             # First try as ID token (JWT format)
             try:
-                idinfo = id_token.verify_oauth2_token(
-                    token, 
-                    requests.Request(), 
-                    self.client_id
+                # Certificate fetch and signature check are blocking; keep them off the event loop
+                # so concurrent logins share the pooled session instead of queueing behind each other
+                idinfo = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: id_token.verify_oauth2_token(token, self._google_request, self.client_id)
                 )
                 
                 # Verify the issuer
@@ -209,33 +243,32 @@ class GoogleOAuthValidator:
                 logger.info(f"Token is not a valid ID token, trying as access token: {str(jwt_error)}")
                 
                 # Validate access token by calling Google's userinfo endpoint
-                import aiohttp
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        'https://www.googleapis.com/oauth2/v2/userinfo',
-                        headers={'Authorization': f'Bearer {token}'}
-                    ) as response:
-                        if response.status != 200:
-                            raise ValueError(f"Invalid access token: {response.status}")
-                        
-                        user_data = await response.json()
-                        
-                        # Validate that this token belongs to our client
-                        # Check if the token is valid by making sure we get user data
-                        if not user_data.get('id'):
-                            raise ValueError("Invalid token: no user ID returned")
-                        
-                        # Return standardized user info
-                        return {
-                            "sub": user_data.get("id"),
-                            "email": user_data.get("email"),
-                            "name": user_data.get("name"),
-                            "picture": user_data.get("picture"),
-                            "email_verified": user_data.get("verified_email", False),
-                            "locale": user_data.get("locale"),
-                            "family_name": user_data.get("family_name"),
-                            "given_name": user_data.get("given_name"),
-                        }
+                session = self._get_http_session()
+                async with session.get(
+                    'https://www.googleapis.com/oauth2/v2/userinfo',
+                    headers={'Authorization': f'Bearer {token}'}
+                ) as response:
+                    if response.status != 200:
+                        raise ValueError(f"Invalid access token: {response.status}")
+                    
+                    user_data = await response.json()
+                    
+                    # Validate that this token belongs to our client
+                    # Check if the token is valid by making sure we get user data
+                    if not user_data.get('id'):
+                        raise ValueError("Invalid token: no user ID returned")
+                    
+                    # Return standardized user info
+                    return {
+                        "sub": user_data.get("id"),
+                        "email": user_data.get("email"),
+                        "name": user_data.get("name"),
+                        "picture": user_data.get("picture"),
+                        "email_verified": user_data.get("verified_email", False),
+                        "locale": user_data.get("locale"),
+                        "family_name": user_data.get("family_name"),
+                        "given_name": user_data.get("given_name"),
+                    }
             
         except ValueError as e:
             logger.error("Google token validation failed", error=str(e))
@@ -8,6 +8,9 @@ from config import settings
 
 logger = structlog.get_logger()
 
+# Actions returned by _process_environment_for_shutdown that have their own counter in the stats
+COUNTED_SHUTDOWN_ACTIONS = frozenset({"shutdown", "warned", "skipped_subscribed"})
+
 class AutoShutdownManager:
     """Manages automatic shutdown of environments based on uptime and subscription tiers"""
     
@@ -41,12 +44,8 @@ class AutoShutdownManager:
                 try:
                     action = await self._process_environment_for_shutdown(environment, user, uptime_minutes)
                     
-                    if action == "shutdown":
-                        stats["shutdown"] += 1
-                    elif action == "warned":
-                        stats["warned"] += 1
-                    elif action == "skipped_subscribed":
-                        stats["skipped_subscribed"] += 1
+                    if action in COUNTED_SHUTDOWN_ACTIONS:
+                        stats[action] += 1
                         
                 except Exception as e:
                     logger.error("Error processing environment for shutdown", 
@@ -1,3 +1,4 @@
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 from typing import Optional, List
 import os
@@ -100,8 +101,14 @@ class Settings(BaseSettings):
     ]
     first_user_is_admin: bool = True  # First user automatically becomes admin
     
+    # Resolved admin email list, computed on first use (checked on every login)
+    _admin_emails_cache: Optional[List[str]] = PrivateAttr(default=None)
+    
     def get_admin_emails(self) -> List[str]:
         """Get admin emails from config and environment variables"""
+        if self._admin_emails_cache is not None:
+            return self._admin_emails_cache
+        
         emails = list(self.admin_emails)  # Start with configured emails
         
         # Add emails from environment variable (comma-separated)
@@ -119,6 +126,7 @@ class Settings(BaseSettings):
                 unique_emails.append(email)
                 seen.add(email_lower)
         
+        self._admin_emails_cache = unique_emails
         return unique_emails
     
     def get_allowed_origins(self) -> List[str]:
@@ -5,6 +5,7 @@ import structlog
 import json
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -16,6 +17,11 @@ from config import settings
 
 logger = structlog.get_logger()
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored ISO timestamp; rows are re-read on every poll, so reuse the parsed values"""
+    return datetime.fromisoformat(value)
+
 class DatabaseManager:
     # User environment variable management
     async def get_user_env_vars(self, user_id: str) -> Dict[str, str]:
@@ -122,8 +128,8 @@ class DatabaseManager:
                     environment_variable_name=row['environment_variable_name'],
                     container_path=row['container_path'],
                     file_size=row['file_size'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                    created_at=_parse_timestamp(row['created_at']),
+                    updated_at=_parse_timestamp(row['updated_at']) if row['updated_at'] else None
                 )
                 files.append(user_file)
             
@@ -158,8 +164,8 @@ class DatabaseManager:
                 environment_variable_name=row['environment_variable_name'],
                 container_path=row['container_path'],
                 file_size=row['file_size'],
-                created_at=datetime.fromisoformat(row['created_at']),
-                updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                created_at=_parse_timestamp(row['created_at']),
+                updated_at=_parse_timestamp(row['updated_at']) if row['updated_at'] else None
             )
 
     async def update_user_file(self, user_id: str, file_id: str, **updates) -> bool:
@@ -644,11 +650,11 @@ class DatabaseManager:
                         email=row['email'],
                         name=row['name'],
                         role=UserRole(row['role']),
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
+                        created_at=_parse_timestamp(row['created_at']),
+                        last_login=_parse_timestamp(row['last_login']) if row['last_login'] else None,
                         is_active=bool(row['is_active']),
                         subscription_tier=SubscriptionTier(row_dict.get('subscription_tier', 'free') or 'free'),
-                        subscription_expires_at=datetime.fromisoformat(row_dict['subscription_expires_at']) if row_dict.get('subscription_expires_at') else None,
+                        subscription_expires_at=_parse_timestamp(row_dict['subscription_expires_at']) if row_dict.get('subscription_expires_at') else None,
                         max_uptime_minutes=row_dict.get('max_uptime_minutes', 60) or 60,
                         auto_shutdown_enabled=bool(row_dict.get('auto_shutdown_enabled', True))
                     )
@@ -661,8 +667,8 @@ class DatabaseManager:
                         email=row['email'],
                         name=row['name'],
                         role=UserRole(row['role']),
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
+                        created_at=_parse_timestamp(row['created_at']),
+                        last_login=_parse_timestamp(row['last_login']) if row['last_login'] else None,
                         is_active=bool(row['is_active']),
                         subscription_tier=SubscriptionTier.FREE,
                         subscription_expires_at=None,
@@ -731,14 +737,41 @@ class DatabaseManager:
                     pod_name=row['pod_name'],
                     status=PodStatus(row['status']),
                     url=row['url'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    last_activity=datetime.fromisoformat(row['last_activity']) if row['last_activity'] else None,
+                    created_at=_parse_timestamp(row['created_at']),
+                    last_activity=_parse_timestamp(row['last_activity']) if row['last_activity'] else None,
                     resource_config=resource_config
                 )
                 environments.append(env)
             
             return environments
     
+    async def get_latest_user_environment(self, user_id: str) -> Optional[Environment]:
+        """Get the most recently created environment for a user"""
+        async with self.get_connection() as conn:
+            row = await asyncio.get_event_loop().run_in_executor(
+                None,
+                lambda: conn.execute(
+                    "SELECT * FROM environments WHERE user_id = ? ORDER BY created_at DESC LIMIT 1",
+                    (user_id,)
+                ).fetchone()
+            )
+            
+            if row:
+                resource_config = json.loads(row['resource_config']) if row['resource_config'] else {}
+                return Environment(
+                    id=row['id'],
+                    user_id=row['user_id'],
+                    user_email=row['user_email'],
+                    env_id=row['env_id'],
+                    pod_name=row['pod_name'],
+                    status=PodStatus(row['status']),
+                    url=row['url'],
+                    created_at=_parse_timestamp(row['created_at']),
+                    last_activity=_parse_timestamp(row['last_activity']) if row['last_activity'] else None,
+                    resource_config=resource_config
+                )
+            return None
+    
     async def get_environment(self, user_id: str, env_id: str) -> Optional[Environment]:
         """Get specific environment by user_id and env_id"""
         async with self.get_connection() as conn:
@@ -760,8 +793,8 @@ class DatabaseManager:
                     pod_name=row['pod_name'],
                     status=PodStatus(row['status']),
                     url=row['url'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    last_activity=datetime.fromisoformat(row['last_activity']) if row['last_activity'] else None,
+                    created_at=_parse_timestamp(row['created_at']),
+                    last_activity=_parse_timestamp(row['last_activity']) if row['last_activity'] else None,
                     resource_config=resource_config
                 )
             return None
@@ -917,8 +950,8 @@ class DatabaseManager:
                     display_name=row['display_name'],
                     storage_type=StorageType(row['storage_type']),
                     status=StorageStatus(row['status']),
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    last_accessed=datetime.fromisoformat(row['last_accessed']) if row['last_accessed'] else None,
+                    created_at=_parse_timestamp(row['created_at']),
+                    last_accessed=_parse_timestamp(row['last_accessed']) if row['last_accessed'] else None,
                     size_bytes=row['size_bytes'],
                     object_count=row['object_count'],
                     location=row['location'],
@@ -951,8 +984,8 @@ class DatabaseManager:
                 display_name=row['display_name'],
                 storage_type=StorageType(row['storage_type']),
                 status=StorageStatus(row['status']),
-                created_at=datetime.fromisoformat(row['created_at']),
-                last_accessed=datetime.fromisoformat(row['last_accessed']) if row['last_accessed'] else None,
+                created_at=_parse_timestamp(row['created_at']),
+                last_accessed=_parse_timestamp(row['last_accessed']) if row['last_accessed'] else None,
                 size_bytes=row['size_bytes'],
                 object_count=row['object_count'],
                 location=row['location'],
@@ -1066,8 +1099,8 @@ class DatabaseManager:
                     pod_name=row['pod_name'],
                     status=PodStatus(row['status']),
                     url=row['url'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    last_activity=datetime.fromisoformat(row['last_activity']) if row['last_activity'] else None,
+                    created_at=_parse_timestamp(row['created_at']),
+                    last_activity=_parse_timestamp(row['last_activity']) if row['last_activity'] else None,
                     resource_config=resource_config
                 )
                 environments.append(env)
@@ -1126,7 +1159,7 @@ class DatabaseManager:
                         working_dir=row_dict.get('working_dir', '/cmbagent'),
                         icon_url=row_dict.get('icon_url'),
                         category=row_dict.get('category', 'research'),
-                        created_at=datetime.fromisoformat(row['created_at']),
+                        created_at=_parse_timestamp(row['created_at']),
                         created_by=row['created_by'],
                         is_active=bool(row_dict.get('is_active', True)),
                         tags=tags
@@ -1166,7 +1199,7 @@ class DatabaseManager:
                     working_dir=row_dict.get('working_dir', '/cmbagent'),
                     icon_url=row['icon_url'],
                     category=row['category'],
-                    created_at=datetime.fromisoformat(row['created_at']),
+                    created_at=_parse_timestamp(row['created_at']),
                     created_by=row['created_by'],
                     is_active=bool(row['is_active']),
                     tags=json.loads(row['tags']) if row['tags'] else []
@@ -1225,7 +1258,7 @@ class DatabaseManager:
                     try:
                         promoted_by = row_dict.get('promoted_by')
                         if row_dict.get('promoted_at'):
-                            promoted_at = datetime.fromisoformat(row_dict['promoted_at'])
+                            promoted_at = _parse_timestamp(row_dict['promoted_at'])
                     except (KeyError, TypeError):
                         # Columns don't exist or are malformed, use defaults
                         promoted_by = None
@@ -1236,8 +1269,8 @@ class DatabaseManager:
                         email=row['email'],
                         name=row['name'],
                         role=UserRole(row['role']),
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
+                        created_at=_parse_timestamp(row['created_at']),
+                        last_login=_parse_timestamp(row['last_login']) if row['last_login'] else None,
                         is_active=bool(row['is_active']),
                         promoted_by=promoted_by,
                         promoted_at=promoted_at
@@ -1321,7 +1354,7 @@ class DatabaseManager:
                     old_role=row['old_role'],
                     new_role=row['new_role'],
                     reason=row['reason'],
-                    changed_at=datetime.fromisoformat(row['changed_at'])
+                    changed_at=_parse_timestamp(row['changed_at'])
                 )
                 history.append(record)
             return history
@@ -1,19 +1,18 @@
 import asyncio
 import json
 import uuid
-import tempfile
+import zlib
 import os
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Response, status
 import structlog
 
 from auth import get_current_user
 from database import get_database
 from file_models import (
     UserFile, UserFileRequest, UserFileResponse, UserFileUpdate, 
-    FileType
+    FileType, ENV_VAR_NAME_ERROR, is_valid_env_var_name
 )
 from file_encryption import get_file_encryption
 from models import User
@@ -25,12 +24,49 @@ router = APIRouter(prefix="/user-files", tags=["user-files"])
 # File size limit (1MB)
 MAX_FILE_SIZE = 1024 * 1024
 
+# Bytes allowed in JSON text: tab/newline/CR, printable ASCII and any byte >= 0x80 (UTF-8
+# multi-byte sequences); whatever remains after deleting these from a sample is treated as binary
+_PRINTABLE_BYTES = b'\t\n\r' + bytes(range(0x20, 0x7f)) + bytes(range(0x80, 0x100))
+
+def _looks_like_json(content: bytes) -> bool:
+    """Cheap pre-check so binary or non-JSON uploads are rejected before decoding"""
+    head = content[:256].lstrip()
+    if not head or head[:1] not in (b'{', b'['):
+        return False
+    sample = content[:1024]
+    non_printable = len(sample.translate(None, _PRINTABLE_BYTES))
+    return non_printable <= len(sample) // 10
+
+def _decompress_gzip(data: bytes) -> bytes:
+    """Decompress a gzip upload, refusing anything that inflates past MAX_FILE_SIZE"""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        content = decompressor.decompress(data, MAX_FILE_SIZE + 1)
+    except zlib.error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is not valid gzip data"
+        )
+    if len(content) > MAX_FILE_SIZE or decompressor.unconsumed_tail:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size must be less than {MAX_FILE_SIZE / 1024 / 1024}MB"
+        )
+    if not decompressor.eof:
+        # Truncated stream: zlib returns what it could inflate without raising
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is not valid gzip data"
+        )
+    return content
+
 @router.post("/upload", response_model=UserFileResponse)
 async def upload_user_file(
     file: UploadFile = File(...),
     file_type: str = Form(...),
     environment_variable_name: str = Form(...),  # Now required
     container_path: Optional[str] = Form(None),
+    content_encoding: Optional[str] = Form(None),
     current_user: Dict = Depends(get_current_user)
 ):
     """Upload a JSON file with encryption and validation"""
@@ -53,11 +89,24 @@ async def upload_user_file(
             detail=f"File size must be less than {MAX_FILE_SIZE / 1024 / 1024}MB"
         )
     
-    # Validate JSON content
+    # Clients may gzip the JSON before upload to save bandwidth
+    if content_encoding:
+        if content_encoding.lower() != "gzip":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported content encoding. Only gzip is accepted"
+            )
+        content = _decompress_gzip(content)
+    
+    # Cheap structural check and UTF-8 decode; UserFileRequest parses the JSON once below
+    if not _looks_like_json(content):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must contain a JSON object or array"
+        )
     try:
         json_content = content.decode('utf-8')
-        parsed_json = json.loads(json_content)
-    except (UnicodeDecodeError, json.JSONDecodeError):
+    except UnicodeDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must contain valid JSON"
@@ -90,14 +139,13 @@ async def upload_user_file(
     # Check for duplicate environment variable names for this user
     db = get_database()
     existing_files = await db.get_user_files(user_id)
+    existing_env_vars = {f.environment_variable_name for f in existing_files if f.environment_variable_name}
     
-    for existing_file in existing_files:
-        if (existing_file.environment_variable_name and 
-            existing_file.environment_variable_name == file_request.environment_variable_name):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Environment variable '{file_request.environment_variable_name}' is already used by another file"
-            )
+    if file_request.environment_variable_name in existing_env_vars:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Environment variable '{file_request.environment_variable_name}' is already used by another file"
+        )
     
     # Encrypt file content
     encryption = get_file_encryption()
@@ -151,8 +199,13 @@ async def upload_user_file(
     )
 
 @router.get("", response_model=List[UserFileResponse])
-async def list_user_files(current_user: Dict = Depends(get_current_user)):
-    """List all files for the current user"""
+async def list_user_files(
+    response: Response,
+    offset: int = Query(0, ge=0, description="Number of files to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of files to return (all if omitted)"),
+    current_user: Dict = Depends(get_current_user)
+):
+    """List files for the current user, optionally paginated"""
     db = get_database()
     
     # Get user ID from the token dictionary
@@ -160,6 +213,8 @@ async def list_user_files(current_user: Dict = Depends(get_current_user)):
     
     try:
         files = await db.get_user_files(user_id)
+        response.headers["X-Total-Count"] = str(len(files))
+        files = files[offset:offset + limit] if limit is not None else files[offset:]
         return [
             UserFileResponse(
                 id=file.id,
@@ -244,33 +299,31 @@ async def update_user_file(
     if file_update.file_name is not None:
         updates['file_name'] = file_update.file_name
     
-    if file_update.environment_variable_name is not None:
+    if (file_update.environment_variable_name is not None
+            and file_update.environment_variable_name != existing_file.environment_variable_name):
+        if not is_valid_env_var_name(file_update.environment_variable_name):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ENV_VAR_NAME_ERROR
+            )
         # Check for conflicts with other files
         existing_files = await db.get_user_files(user_id)
-        for file in existing_files:
-            if (file.id != file_id and 
-                file.environment_variable_name and
-                file.environment_variable_name == file_update.environment_variable_name):
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Environment variable '{file_update.environment_variable_name}' is already used by another file"
-                )
+        other_env_vars = {
+            f.environment_variable_name for f in existing_files
+            if f.id != file_id and f.environment_variable_name
+        }
+        if file_update.environment_variable_name in other_env_vars:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Environment variable '{file_update.environment_variable_name}' is already used by another file"
+            )
         updates['environment_variable_name'] = file_update.environment_variable_name
     
     if file_update.container_path is not None:
         updates['container_path'] = file_update.container_path
     
     if file_update.content is not None:
-        # Validate and encrypt new content
-        try:
-            json.loads(file_update.content)  # Validate JSON
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Content must be valid JSON"
-            )
-        
-        # Encrypt new content
+        # Content was already validated as JSON by UserFileUpdate; just encrypt it
         encryption = get_file_encryption()
         try:
             encrypted_content = encryption.encrypt_content(file_update.content)
@@ -381,13 +434,16 @@ async def download_user_file(
                 detail="Failed to decrypt file content"
             )
         
-        # Return as JSON response
-        return JSONResponse(
-            content={
-                "file_name": file.file_name,
-                "file_type": file.file_type.value,
-                "content": json.loads(decrypted_content)
-            },
+        # Content was validated as JSON on upload, so splice the stored text in
+        # rather than parsing it and serializing it straight back
+        body = (
+            f'{{"file_name": {json.dumps(file.file_name)}, '
+            f'"file_type": {json.dumps(file.file_type.value)}, '
+            f'"content": {decrypted_content}}}'
+        )
+        return Response(
+            content=body,
+            media_type="application/json",
             headers={
                 "Content-Disposition": f"attachment; filename={file.file_name}"
             }
@@ -3,6 +3,15 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 import json
+import re
+
+# Shell-safe environment variable names: upper-case letters, digits and underscores
+_ENV_VAR_RE = re.compile(r'^[A-Z_][A-Z0-9_]{0,63}$')
+ENV_VAR_NAME_ERROR = 'Environment variable name must match [A-Z_][A-Z0-9_]* (max 64 characters)'
+
+def is_valid_env_var_name(name: str) -> bool:
+    """Whether a name is safe to export as a shell environment variable"""
+    return bool(_ENV_VAR_RE.match(name))
 
 class FileType(str, Enum):
     GCP_SERVICE_ACCOUNT = "gcp_service_account"
@@ -39,7 +48,10 @@ class UserFileRequest(BaseModel):
             # For custom JSON files, environment variable is required
             if not v or not v.strip():
                 raise ValueError('Environment variable name is required for custom JSON files')
-            return v.strip()
+            v = v.strip()
+            if not is_valid_env_var_name(v):
+                raise ValueError(ENV_VAR_NAME_ERROR)
+            return v
 
     @validator('container_path')
     def set_container_path(cls, v, values):
@@ -56,34 +68,30 @@ class UserFileRequest(BaseModel):
         return v
 
     @validator('content')
-    def validate_json_content(cls, v):
-        """Validate that content is valid JSON"""
+    def validate_json_content(cls, v, values):
+        """Validate that content is valid JSON and, for GCP keys, a service account"""
         try:
-            json.loads(v)
+            data = json.loads(v)
         except json.JSONDecodeError:
+            if values.get('file_type') == FileType.GCP_SERVICE_ACCOUNT:
+                raise ValueError('Invalid JSON content for GCP service account')
             raise ValueError('Content must be valid JSON')
-        return v
-
-    @validator('content')
-    def validate_gcp_service_account(cls, v, values):
-        """Validate GCP service account key structure"""
+        
         if values.get('file_type') == FileType.GCP_SERVICE_ACCOUNT:
-            try:
-                data = json.loads(v)
-                required_fields = [
-                    'type', 'project_id', 'private_key_id', 'private_key',
-                    'client_email', 'client_id', 'auth_uri', 'token_uri'
-                ]
-                
-                missing_fields = [field for field in required_fields if field not in data]
-                if missing_fields:
-                    raise ValueError(f'Missing required GCP service account fields: {missing_fields}')
-                
-                if data.get('type') != 'service_account':
-                    raise ValueError('GCP service account type must be "service_account"')
-                    
-            except json.JSONDecodeError:
-                raise ValueError('Invalid JSON content for GCP service account')
+            required_fields = [
+                'type', 'project_id', 'private_key_id', 'private_key',
+                'client_email', 'client_id', 'auth_uri', 'token_uri'
+            ]
+            
+            if not isinstance(data, dict):
+                raise ValueError('GCP service account key must be a JSON object')
+            
+            missing_fields = [field for field in required_fields if field not in data]
+            if missing_fields:
+                raise ValueError(f'Missing required GCP service account fields: {missing_fields}')
+            
+            if data.get('type') != 'service_account':
+                raise ValueError('GCP service account type must be "service_account"')
         return v
 
 class UserFileResponse(BaseModel):
@@ -104,7 +112,11 @@ class UserFileUpdate(BaseModel):
 
     @validator('environment_variable_name')
     def validate_env_var_name(cls, v):
-        """Validate environment variable name if provided"""
+        """Validate environment variable name if provided.
+
+        The shell-safe pattern is checked by the update endpoint, and only when the name
+        changes, so files stored under older, looser names stay editable.
+        """
         if v is not None and not v.strip():
             raise ValueError('Environment variable name cannot be empty')
         return v.strip() if v else None
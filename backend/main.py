@@ -55,7 +55,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting CMBCluster API", version="1.0.0")
-    app_state["start_time"] = time.time()
+    app_state["start_time"] = time.monotonic()
     
     # Initialize database
     from database import get_database
@@ -80,6 +80,8 @@ async def lifespan(app: FastAPI):
     shutdown_task.cancel()
     if app_state.get("pod_manager"):
         await app_state["pod_manager"].cleanup_all()
+    from auth_security import google_validator
+    await google_validator.close()
 
 app = FastAPI(
     title="CMBCluster API",
@@ -94,10 +96,10 @@ app = FastAPI(
 allowed_origins = settings.get_allowed_origins()
 
 # Emergency fallback for production CORS issues
-# If we have frontend_url and api_url from environment but they're not in allowed_origins, add them
-import os
-frontend_url = os.getenv('FRONTEND_URL')
-api_url = os.getenv('API_URL')
+# If frontend_url and api_url were set in the environment but are not in allowed_origins, add them.
+# Settings already parsed these variables; only explicitly configured values count.
+frontend_url = settings.frontend_url if "frontend_url" in settings.model_fields_set else None
+api_url = settings.api_url if "api_url" in settings.model_fields_set else None
 
 if frontend_url and frontend_url not in allowed_origins:
     allowed_origins.append(frontend_url)
@@ -142,8 +144,6 @@ app.include_router(oauth_router, prefix="/auth")
  # storage_api.router already has prefix="/storage"
 
 # Files endpoints: /user-files/* (not /api/user/files/*)
-import file_api
-app.include_router(oauth_router, prefix="/auth")
 app.include_router(storage_api.router)
 app.include_router(file_api.router)
 
@@ -166,39 +166,28 @@ app.include_router(applications_api.router)
 # app.include_router(env_vars_api.router, prefix="/api/user") 
 # app.include_router(user_api.router, prefix="/api/user")
 
-@app.middleware("http")
-async def security_headers_middleware(request: Request, call_next):
-    """Add security headers to all responses"""
-    response = await call_next(request)
-    
-    if settings.enable_security_headers:
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        
-        # HSTS for HTTPS
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Content Security Policy
-        if settings.csp_enabled:
-            csp_parts = [
-                f"default-src 'self'",
-                f"script-src {' '.join(settings.csp_script_src)}",
-                f"style-src {' '.join(settings.csp_style_src)}",
-                f"font-src {' '.join(settings.csp_font_src)}",
-                f"img-src {' '.join(settings.csp_img_src)}",
-                f"connect-src {' '.join(settings.csp_connect_src)}",
-                f"frame-ancestors 'none'",
-                f"base-uri 'self'",
-                f"form-action 'self'"
-            ]
-            response.headers["Content-Security-Policy"] = "; ".join(csp_parts)
-    
-    return response
+# Security headers depend only on settings, so build them once at import
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+}
+
+# Content Security Policy
+if settings.csp_enabled:
+    SECURITY_HEADERS["Content-Security-Policy"] = "; ".join([
+        "default-src 'self'",
+        f"script-src {' '.join(settings.csp_script_src)}",
+        f"style-src {' '.join(settings.csp_style_src)}",
+        f"font-src {' '.join(settings.csp_font_src)}",
+        f"img-src {' '.join(settings.csp_img_src)}",
+        f"connect-src {' '.join(settings.csp_connect_src)}",
+        "frame-ancestors 'none'",
+        "base-uri 'self'",
+        "form-action 'self'"
+    ])
 
 @app.middleware("http")
 async def security_headers_middleware(request: Request, call_next):
@@ -206,38 +195,18 @@ async def security_headers_middleware(request: Request, call_next):
     response = await call_next(request)
     
     if settings.enable_security_headers:
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        response.headers.update(SECURITY_HEADERS)
         
         # HSTS for HTTPS
         if request.url.scheme == "https":
             response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Content Security Policy
-        if settings.csp_enabled:
-            csp_parts = [
-                f"default-src 'self'",
-                f"script-src {' '.join(settings.csp_script_src)}",
-                f"style-src {' '.join(settings.csp_style_src)}",
-                f"font-src {' '.join(settings.csp_font_src)}",
-                f"img-src {' '.join(settings.csp_img_src)}",
-                f"connect-src {' '.join(settings.csp_connect_src)}",
-                f"frame-ancestors 'none'",
-                f"base-uri 'self'",
-                f"form-action 'self'"
-            ]
-            response.headers["Content-Security-Policy"] = "; ".join(csp_parts)
     
     return response
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all HTTP requests with security context"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Get client info for security logging
     client_ip = request.headers.get("X-Forwarded-For", 
@@ -245,10 +214,10 @@ async def log_requests(request: Request, call_next):
                                    request.client.host if request.client else "unknown"))
     user_agent = request.headers.get("User-Agent", "unknown")
     
-    # Special logging for OPTIONS requests to debug CORS issues
-    if request.method == "OPTIONS":
+    # Dump full preflight headers only when debugging CORS issues; every browser call sends one
+    if settings.debug and request.method == "OPTIONS":
         headers_dict = dict(request.headers)
-        logger.warning("OPTIONS preflight request received", 
+        logger.debug("OPTIONS preflight request received",
                       method=request.method,
                       url=str(request.url),
                       headers=headers_dict,
@@ -256,7 +225,7 @@ async def log_requests(request: Request, call_next):
     
     response = await call_next(request)
     
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     
     # Enhanced logging for security events
     log_data = {
@@ -296,7 +265,8 @@ async def root():
 @app.get("/health", response_model=HealthCheck, tags=["health"])
 async def health_check():
     """Health check endpoint"""
-    uptime = time.time() - app_state.get("start_time", time.time())
+    now = time.monotonic()
+    uptime = now - app_state.get("start_time", now)
     return HealthCheck(
         status="healthy",
         timestamp=datetime.utcnow(),
@@ -440,9 +410,13 @@ async def get_environment_info(
     user_id = current_user["sub"]
     
     try:
-        # Get environment
+        # Get environment and user data (for subscription info) concurrently;
+        # each lookup opens its own connection
         db_manager = app_state.get("db_manager")
-        environment = await db_manager.get_environment(user_id, env_id)
+        environment, user = await asyncio.gather(
+            db_manager.get_environment(user_id, env_id),
+            db_manager.get_user(user_id)
+        )
         
         if not environment:
             raise HTTPException(
@@ -450,9 +424,6 @@ async def get_environment_info(
                 detail="Environment not found"
             )
         
-        # Get user data for subscription info
-        user = await db_manager.get_user(user_id)
-        
         # Calculate uptime
         uptime_minutes = 0
         if environment.created_at:
@@ -627,15 +598,8 @@ async def list_user_environments(current_user: Dict = Depends(get_current_user))
         # Use the new method to get all environments with updated status
         envs = await pod_manager.get_user_environments(user_id)
         
-        # Convert Environment objects to dicts for JSON serialization
-        env_dicts = []
-        for env in envs:
-            env_dict = env.dict() if hasattr(env, 'dict') else env.__dict__
-            # Ensure both 'id' and 'env_id' are available for frontend compatibility
-            if 'env_id' in env_dict and 'id' not in env_dict:
-                env_dict['id'] = env_dict['env_id']
-            logger.info("Environment serialized", env_dict=env_dict)
-            env_dicts.append(env_dict)
+        # Environment always carries both 'id' and 'env_id', which the frontend relies on
+        env_dicts = [env.dict() for env in envs]
         
         logger.info("Returning environments", count=len(env_dicts), user_id=user_id)
         return {"environments": env_dicts}
@@ -2,26 +2,26 @@ import asyncio
 import time
 import re
 import uuid
-import tempfile
 import os
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import structlog
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
-import subprocess
-import re as regex
 
 from config import settings
 from models import Environment, EnvironmentRequest, PodStatus
 from storage_models import StorageType, StorageStatus, UserStorage
-from storage_manager import StorageManager
+from storage_manager import get_storage_manager
 from database import get_database
 from file_encryption import get_file_encryption
 
 logger = structlog.get_logger()
 
+# How long a user's environment list may be served from memory; several open tabs polling
+# /environments/list then share one database and Kubernetes read per window
+ENVIRONMENT_LIST_TTL_SECONDS = 5.0
+
 def _sanitize_for_dns(name: str) -> str:
     """Sanitizes a string to be a valid DNS-1123 subdomain.
     Must be lowercase, max 63 chars, start/end with alphanum, and contain only a-z, 0-9, and -.
@@ -236,7 +236,10 @@ class PodManager:
     
     def __init__(self):
         self.db = get_database()
-        self.storage_manager = StorageManager()
+        self.storage_manager = get_storage_manager()
+        # user_id -> (monotonic fetch time, environments)
+        self._environment_list_cache: Dict[str, tuple[float, List[Environment]]] = {}
+        self._environment_list_locks: Dict[str, asyncio.Lock] = {}
         self._setup_kubernetes()
     
     def _setup_kubernetes(self):
@@ -254,9 +257,11 @@ class PodManager:
                 logger.error("Failed to load Kubernetes config", error=str(e))
                 raise
         
-        self.k8s_client = client.CoreV1Api()
-        self.apps_client = client.AppsV1Api()
-        self.networking_client = client.NetworkingV1Api()
+        # One ApiClient so the core, apps and networking APIs share a single connection pool
+        api_client = client.ApiClient()
+        self.k8s_client = client.CoreV1Api(api_client)
+        self.apps_client = client.AppsV1Api(api_client)
+        self.networking_client = client.NetworkingV1Api(api_client)
         
         # Validate permissions on startup
         self._validate_permissions()
@@ -314,14 +319,17 @@ class PodManager:
                     pod_name=pod_name)
         
         try:
+            # Env vars, mounted files and the image config are independent reads, so fetch them concurrently
+            user_env_vars, user_files, (image_path, container_port, working_dir, app_name) = await asyncio.gather(
+                self.db.get_user_env_vars(user_id),
+                self.db.get_user_files_for_environment(user_id),
+                self._resolve_image_config(config),
+            )
+
             # Ensure default OPENAI_API_KEY env var exists for user
-            user_env_vars = await self.db.get_user_env_vars(user_id)
             if "OPENAI_API_KEY" not in user_env_vars:
                 await self.db.set_user_env_var(user_id, "OPENAI_API_KEY", "")
                 user_env_vars["OPENAI_API_KEY"] = ""
-
-            # Get user files for environment variables and mounting
-            user_files = await self.db.get_user_files_for_environment(user_id)
             
             # Add file-based environment variables to merged env vars
             for env_var_name, user_file in user_files.items():
@@ -335,9 +343,6 @@ class PodManager:
             # Handle storage selection/creation
             storage = await self._handle_storage_selection(user_id, config)
 
-            # Resolve image path, port, working directory, and app name from application ID if provided
-            image_path, container_port, working_dir, app_name = await self._resolve_image_config(config)
-
             # Create secret for env vars
             secret_name = await self._create_env_secret(safe_user_id, env_id, merged_env_vars)
 
@@ -403,6 +408,7 @@ class PodManager:
 
             # Store environment in database
             await self.db.create_environment(environment)
+            self._invalidate_environment_list(user_id)
 
             # Link environment to storage
             await self.db.link_environment_storage(environment.id, storage.id)
@@ -970,50 +976,53 @@ class PodManager:
     
     async def user_has_active_pod(self, user_id: str) -> bool:
         """Check if user has an active pod"""
-        user_envs = await self.db.get_user_environments(user_id)
-        if not user_envs:
-            return False
-        
-        # Check if any environment is active
-        for environment in user_envs:
-            try:
-                pod = self.k8s_client.read_namespaced_pod(
-                    name=environment.pod_name,
-                    namespace=settings.namespace
-                )
-                
-                # Update environment status in database
-                pod_status = PodStatus(pod.status.phase.lower())
-                await self.db.update_environment_status(environment.env_id, pod_status)
-                
-                if pod.status.phase in ["Running", "Pending"]:
-                    return True
-                    
-            except ApiException as e:
-                if e.status == 404:
-                    # Pod doesn't exist, update status to failed in database
-                    await self.db.update_environment_status(environment.env_id, PodStatus.FAILED)
-                else:
-                    raise
-        
-        return False
+        # Status polls reuse the short-lived environment list instead of reading every pod again
+        user_envs = await self.get_user_environments(user_id)
+        # UNKNOWN means the pod read failed (not a 404); assume it may still be running rather
+        # than letting a transient API error launch a second environment
+        return any(
+            env.status in (PodStatus.RUNNING, PodStatus.PENDING, PodStatus.UNKNOWN)
+            for env in user_envs
+        )
     
     async def get_user_environment(self, user_id: str) -> Optional[Environment]:
         """Get user environment info - returns the first active environment for the user"""
-        # Find the most recent environment for this user
-        user_envs = await self.db.get_user_environments(user_id)
-        
-        if not user_envs:
-            return None
-        
-        # Get the most recent environment (already sorted by created_at DESC in database query)
-        environment = user_envs[0]
-        
-        # Update pod status
+        # Callers usually just ran user_has_active_pod, so the short-lived list already holds
+        # every environment with fresh pod status; pick the most recent from it
+        user_envs = await self.get_user_environments(user_id)
+        return max(user_envs, key=lambda env: env.created_at, default=None)
+    
+    async def get_user_environments(self, user_id: str) -> List[Environment]:
+        """Get all environments for a user"""
+        # Concurrent requests for the same user wait here and reuse the first one's result
+        lock = self._environment_list_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            cached = self._environment_list_cache.get(user_id)
+            if cached and time.monotonic() - cached[0] < ENVIRONMENT_LIST_TTL_SECONDS:
+                return list(cached[1])
+            
+            user_envs = await self.db.get_user_environments(user_id)
+            
+            # Read every pod concurrently so listing costs one Kubernetes round trip, not one per environment
+            await asyncio.gather(*(self._refresh_environment_status(env) for env in user_envs))
+            
+            self._environment_list_cache[user_id] = (time.monotonic(), user_envs)
+            return list(user_envs)
+    
+    def _invalidate_environment_list(self, user_id: str):
+        """Drop the cached list so the next request sees a created or deleted environment"""
+        self._environment_list_cache.pop(user_id, None)
+    
+    async def _refresh_environment_status(self, environment: Environment):
+        """Update an environment's status from its pod, off the event loop"""
+        loop = asyncio.get_event_loop()
         try:
-            pod = self.k8s_client.read_namespaced_pod(
-                name=environment.pod_name,
-                namespace=settings.namespace
+            pod = await loop.run_in_executor(
+                None,
+                lambda: self.k8s_client.read_namespaced_pod(
+                    name=environment.pod_name,
+                    namespace=settings.namespace
+                )
             )
             pod_status = PodStatus(pod.status.phase.lower())
             await self.db.update_environment_status(environment.env_id, pod_status)
@@ -1024,31 +1033,6 @@ class PodManager:
                 environment.status = PodStatus.FAILED
             else:
                 environment.status = PodStatus.UNKNOWN
-        
-        return environment
-    
-    async def get_user_environments(self, user_id: str) -> List[Environment]:
-        """Get all environments for a user"""
-        user_envs = await self.db.get_user_environments(user_id)
-        
-        # Update pod statuses
-        for environment in user_envs:
-            try:
-                pod = self.k8s_client.read_namespaced_pod(
-                    name=environment.pod_name,
-                    namespace=settings.namespace
-                )
-                pod_status = PodStatus(pod.status.phase.lower())
-                await self.db.update_environment_status(environment.env_id, pod_status)
-                environment.status = pod_status
-            except ApiException as e:
-                if e.status == 404:
-                    await self.db.update_environment_status(environment.env_id, PodStatus.FAILED)
-                    environment.status = PodStatus.FAILED
-                else:
-                    environment.status = PodStatus.UNKNOWN
-        
-        return user_envs
     
     async def delete_user_environment(self, user_id: str, user_email: str = None, env_id: str = None):
         """Delete user environment and associated resources. If env_id is provided, delete that environment, else delete the most recent."""
@@ -1061,11 +1045,10 @@ class PodManager:
                              env_id=env_id)
                 raise ValueError(f"Environment {env_id} not found for user {user_id}")
         else:
-            user_envs = await self.db.get_user_environments(user_id)
-            if not user_envs:
+            environment = await self.db.get_latest_user_environment(user_id)
+            if not environment:
                 logger.warning("No environments found for user", user_id=user_id)
                 raise ValueError(f"No environments found for user {user_id}")
-            environment = user_envs[0]  # Most recent (already sorted)
         
         # Use the correct user_email for DNS/subdomain naming
         if user_email is None:
@@ -1135,6 +1118,7 @@ class PodManager:
 
             # Remove from database
             deleted = await self.db.delete_environment(user_id, env_id)
+            self._invalidate_environment_list(user_id)
             if deleted:
                 logger.info("Environment removed from database", user_id=user_id, env_id=env_id)
             else:
@@ -1203,6 +1187,7 @@ class PodManager:
                                        env_id=environment.env_id)
                             
                             await self.db.delete_environment(environment.user_id, environment.env_id)
+                            self._invalidate_environment_list(environment.user_id)
                             
                             from main import log_activity
                             await log_activity(environment.user_id, "environment_cleanup_orphaned", 
@@ -1,18 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, UploadFile, File, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Dict, List, Optional
 import structlog
+import asyncio
 from datetime import datetime
 import uuid
-import io
 import os
 
 from auth import get_current_user
-from storage_manager import StorageManager
+from storage_manager import get_storage_manager
 from storage_models import (
     UserStorage, StorageRequest, StorageSelectionRequest,
     StorageListResponse, StorageCreationResponse, StorageUsageStats,
-    BucketOperationRequest, StorageMetadata, StorageStatus, StorageType
+    BucketOperationRequest, StorageMetadata, StorageStatus, StorageType,
+    BulkDeleteRequest
 )
 from database import get_database
 from config import settings
@@ -22,7 +23,7 @@ logger = structlog.get_logger()
 router = APIRouter(prefix="/storage", tags=["storage"])
 
 # Global storage manager instance
-storage_manager = StorageManager()
+storage_manager = get_storage_manager()
 
 @router.get("", response_model=StorageListResponse)
 async def list_user_storages(current_user: Dict = Depends(get_current_user)):
@@ -38,9 +39,12 @@ async def list_user_storages(current_user: Dict = Depends(get_current_user)):
         total_size = 0
         active_count = 0
         
-        for storage in storages:
-            # Get fresh metadata from cloud
-            bucket_metadata = await storage_manager.get_bucket_metadata(storage.bucket_name)
+        # Get fresh metadata from cloud for all buckets concurrently
+        all_metadata = await asyncio.gather(
+            *(storage_manager.get_bucket_metadata(storage.bucket_name) for storage in storages)
+        )
+        
+        for storage, bucket_metadata in zip(storages, all_metadata):
             if bucket_metadata:
                 # Update database with fresh metadata
                 await db.update_storage_metadata(
@@ -289,14 +293,18 @@ async def upload_file_to_storage(
                 detail="Storage not found"
             )
         
-        # Read file content
-        file_content = await file.read()
+        # Stream from the spooled upload instead of reading it into memory
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+            file.file.seek(0)
         
         # Log file details for debugging
         logger.info("Uploading file", 
                    filename=file.filename,
                    content_type=file.content_type,
-                   size=len(file_content))
+                   size=file_size)
         
         # Construct object path
         object_path = f"{path.strip('/')}/{file.filename}" if path else file.filename
@@ -309,8 +317,9 @@ async def upload_file_to_storage(
         success = await storage_manager.upload_object(
             bucket_name=storage.bucket_name,
             object_name=object_path,
-            file_content=file_content,
-            content_type=content_type
+            file_content=file.file,
+            content_type=content_type,
+            size=file_size
         )
         
         if success:
@@ -319,13 +328,13 @@ async def upload_file_to_storage(
                        storage_id=storage_id,
                        filename=file.filename,
                        object_path=object_path,
-                       size=len(file_content))
+                       size=file_size)
             
             return {
                 "status": "success",
                 "message": "File uploaded successfully",
                 "object_path": object_path,
-                "size": len(file_content),
+                "size": file_size,
                 "content_type": file.content_type
             }
         else:
@@ -366,32 +375,37 @@ async def download_file_from_storage(
                 detail="Storage not found"
             )
         
-        # Download from bucket
-        file_data = await storage_manager.download_object(
+        # Stream from bucket in chunks rather than buffering the whole object
+        stream = await storage_manager.open_object_stream(
             bucket_name=storage.bucket_name,
             object_name=object_path
         )
         
-        if file_data is None:
+        if stream is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found"
             )
+        chunks, size = stream
         
         # Get filename from path
         filename = os.path.basename(object_path)
         
-        logger.info("File downloaded successfully", 
+        logger.info("File download started", 
                    user_id=user_id,
                    storage_id=storage_id,
                    object_path=object_path,
-                   size=len(file_data))
+                   size=size)
+        
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+        if size is not None:
+            headers["Content-Length"] = str(size)
         
         # Return file as streaming response
         return StreamingResponse(
-            io.BytesIO(file_data),
+            chunks,
             media_type="application/octet-stream",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers=headers
         )
         
     except HTTPException:
@@ -407,13 +421,15 @@ async def download_file_from_storage(
             detail=f"Failed to download file: {str(e)}"
         )
 
-@router.get("/{storage_id}/files")
+@router.get("/{storage_id}/files", response_class=ORJSONResponse)
 async def list_storage_objects(
     storage_id: str,
     prefix: str = "",
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    page_token: Optional[str] = None,
     current_user: Dict = Depends(get_current_user)
 ):
-    """List objects in storage bucket"""
+    """List objects in storage bucket, one page at a time when a limit is given"""
     user_id = current_user["sub"]
     
     try:
@@ -427,10 +443,19 @@ async def list_storage_objects(
             )
         
         # List objects in bucket
-        objects = await storage_manager.list_objects(
-            bucket_name=storage.bucket_name,
-            prefix=prefix
-        )
+        next_page_token = None
+        if limit is not None:
+            objects, next_page_token = await storage_manager.list_objects_page(
+                bucket_name=storage.bucket_name,
+                prefix=prefix,
+                max_results=limit,
+                page_token=page_token
+            )
+        else:
+            objects = await storage_manager.list_objects(
+                bucket_name=storage.bucket_name,
+                prefix=prefix
+            )
         
         logger.info("Listed storage objects", 
                    user_id=user_id,
@@ -438,13 +463,15 @@ async def list_storage_objects(
                    prefix=prefix,
                    object_count=len(objects))
         
-        return {
+        # Object listings can be large and are already JSON-native; serialize them with orjson directly
+        return ORJSONResponse({
             "storage_id": storage_id,
             "bucket_name": storage.bucket_name,
             "prefix": prefix,
             "objects": objects,
-            "total_count": len(objects)
-        }
+            "total_count": len(objects),
+            "next_page_token": next_page_token
+        })
         
     except HTTPException:
         raise
@@ -459,6 +486,58 @@ async def list_storage_objects(
             detail=f"Failed to list objects: {str(e)}"
         )
 
+@router.post("/{storage_id}/files/bulk-delete")
+async def bulk_delete_storage_objects(
+    storage_id: str,
+    request: BulkDeleteRequest,
+    current_user: Dict = Depends(get_current_user)
+):
+    """Delete several objects from storage bucket in a single request"""
+    user_id = current_user["sub"]
+    
+    try:
+        db = get_database()
+        storage = await db.get_storage_by_id(storage_id)
+        
+        if not storage or storage.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Storage not found"
+            )
+        
+        # Preserve order while dropping duplicate paths
+        object_paths = list(dict.fromkeys(path for path in request.file_paths if path))
+        
+        deleted, failed = await storage_manager.delete_objects(
+            bucket_name=storage.bucket_name,
+            object_names=object_paths
+        )
+        
+        logger.info("Bulk delete completed", 
+                   user_id=user_id,
+                   storage_id=storage_id,
+                   deleted_count=len(deleted),
+                   failed_count=len(failed))
+        
+        return {
+            "status": "success" if not failed else "partial",
+            "message": f"Deleted {len(deleted)} of {len(object_paths)} objects",
+            "deleted": deleted,
+            "failed": failed
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to bulk delete objects", 
+                    storage_id=storage_id,
+                    user_id=user_id, 
+                    error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete objects: {str(e)}"
+        )
+
 @router.delete("/{storage_id}/files")
 async def delete_storage_object(
     storage_id: str,
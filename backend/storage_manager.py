@@ -3,7 +3,7 @@ import re
 import random
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 import structlog
 from google.cloud import storage
 from google.api_core import exceptions as gcp_exceptions
@@ -262,27 +262,11 @@ class StorageManager:
     async def get_bucket_metadata(self, bucket_name: str) -> Optional[Dict]:
         """Get metadata for a storage bucket"""
         try:
-            bucket = self.client.bucket(bucket_name)
-            bucket.reload()  # Fetch latest metadata
-            
-            # Calculate bucket size
-            total_size = 0
-            blob_count = 0
-            for blob in bucket.list_blobs():
-                total_size += blob.size or 0
-                blob_count += 1
-            
-            return {
-                "bucket_name": bucket_name,
-                "location": bucket.location,
-                "storage_class": bucket.storage_class,
-                "created_at": getattr(bucket, 'time_created', None),
-                "updated_at": getattr(bucket, 'updated', None),
-                "size_bytes": total_size,
-                "object_count": blob_count,
-                "versioning_enabled": getattr(bucket, 'versioning_enabled', False),
-                "lifecycle_rules": len(list(bucket.lifecycle_rules)) if hasattr(bucket, 'lifecycle_rules') else 0
-            }
+            # The GCS client is blocking; run it in the default executor so
+            # metadata for several buckets can be gathered concurrently
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self._fetch_bucket_metadata, bucket_name
+            )
             
         except gcp_exceptions.NotFound:
             logger.warning("Bucket not found", bucket_name=bucket_name)
@@ -294,6 +278,30 @@ class StorageManager:
                         error=str(e))
             return None
     
+    def _fetch_bucket_metadata(self, bucket_name: str) -> Dict:
+        """Blocking helper for get_bucket_metadata"""
+        bucket = self.client.bucket(bucket_name)
+        bucket.reload()  # Fetch latest metadata
+        
+        # Calculate bucket size
+        total_size = 0
+        blob_count = 0
+        for blob in bucket.list_blobs():
+            total_size += blob.size or 0
+            blob_count += 1
+        
+        return {
+            "bucket_name": bucket_name,
+            "location": bucket.location,
+            "storage_class": bucket.storage_class,
+            "created_at": getattr(bucket, 'time_created', None),
+            "updated_at": getattr(bucket, 'updated', None),
+            "size_bytes": total_size,
+            "object_count": blob_count,
+            "versioning_enabled": getattr(bucket, 'versioning_enabled', False),
+            "lifecycle_rules": len(list(bucket.lifecycle_rules)) if hasattr(bucket, 'lifecycle_rules') else 0
+        }
+    
     async def list_user_buckets(self, user_prefix: str) -> List[Dict]:
         """List all buckets for a user based on naming pattern"""
         try:
@@ -385,11 +393,10 @@ class StorageManager:
     
     def format_bucket_size(self, size_bytes: int) -> str:
         """Format bucket size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        units = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+        # Each unit is 2**10 of the previous one, so the index is bit_length // 10
+        unit = min(max(int(size_bytes), 1).bit_length() - 1, 10 * (len(units) - 1)) // 10
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {units[unit]}"
     
     def extract_cosmic_name_components(self, bucket_name: str) -> Tuple[str, str]:
         """Extract the cosmic theme components from bucket name for display"""
@@ -408,8 +415,12 @@ class StorageManager:
         constellation, cosmic_term = self.extract_cosmic_name_components(bucket_name)
         return f"{constellation} {cosmic_term}"
 
-    async def upload_object(self, bucket_name: str, object_name: str, file_content: bytes, content_type: str = None) -> bool:
-        """Upload an object to the storage bucket"""
+    async def upload_object(self, bucket_name: str, object_name: str, file_content: Union[bytes, BinaryIO],
+                            content_type: str = None, size: Optional[int] = None) -> bool:
+        """Upload an object to the storage bucket from bytes or a readable file object.
+
+        File objects are streamed to GCS without being loaded into memory.
+        """
         try:
             bucket = self.client.bucket(bucket_name)
             blob = bucket.blob(object_name)
@@ -426,19 +437,30 @@ class StorageManager:
                 else:
                     blob.content_type = 'application/octet-stream'
             
+            if isinstance(file_content, (bytes, bytearray)):
+                size = len(file_content)
+            
             logger.info("About to upload object", 
                        bucket_name=bucket_name,
                        object_name=object_name,
                        content_type=blob.content_type,
-                       size=len(file_content))
+                       size=size)
             
             # Upload the file content
-            blob.upload_from_string(file_content, content_type=blob.content_type)
+            if isinstance(file_content, (bytes, bytearray)):
+                blob.upload_from_string(file_content, content_type=blob.content_type)
+            else:
+                # The library already switches large files to a resumable upload with its own
+                # (large) chunk size. Streaming one can take minutes; keep it off the event loop
+                await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: blob.upload_from_file(file_content, rewind=True, size=size, content_type=blob.content_type)
+                )
             
             logger.info("Uploaded object to bucket", 
                        bucket_name=bucket_name,
                        object_name=object_name,
-                       size=len(file_content),
+                       size=size,
                        content_type=blob.content_type)
             
             return True
@@ -450,6 +472,50 @@ class StorageManager:
                         error=str(e))
             return False
 
+    async def open_object_stream(self, bucket_name: str, object_name: str,
+                                 chunk_size: int = 1024 * 1024) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """Open an object for chunked reading.
+
+        Returns an iterator over chunks of at most ``chunk_size`` bytes plus the object
+        size, or None if the object does not exist.
+        """
+        try:
+            bucket = self.client.bucket(bucket_name)
+            blob = bucket.get_blob(object_name)
+            
+            if blob is None:
+                logger.warning("Object not found for download", 
+                              bucket_name=bucket_name,
+                              object_name=object_name)
+                return None
+            
+            def iter_chunks() -> Iterator[bytes]:
+                with blob.open("rb", chunk_size=chunk_size) as reader:
+                    while True:
+                        chunk = reader.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            
+            logger.info("Streaming object from bucket", 
+                       bucket_name=bucket_name,
+                       object_name=object_name,
+                       size=blob.size)
+            
+            return iter_chunks(), blob.size
+            
+        except gcp_exceptions.NotFound:
+            logger.warning("Object not found for download", 
+                          bucket_name=bucket_name,
+                          object_name=object_name)
+            return None
+        except Exception as e:
+            logger.error("Failed to open object stream", 
+                        bucket_name=bucket_name,
+                        object_name=object_name,
+                        error=str(e))
+            return None
+
     async def download_object(self, bucket_name: str, object_name: str) -> Optional[bytes]:
         """Download an object from the storage bucket"""
         try:
@@ -485,25 +551,32 @@ class StorageManager:
                         error=str(e))
             return None
 
+    @staticmethod
+    def _blob_to_dict(blob, url_prefix: str) -> Dict:
+        """Convert a listed blob into the object summary returned by the API"""
+        name = blob.name
+        time_created = blob.time_created
+        updated = blob.updated
+        return {
+            "name": name,
+            "size": blob.size,
+            "content_type": blob.content_type,
+            "created": time_created.isoformat() if time_created else None,
+            "updated": updated.isoformat() if updated else None,
+            "etag": blob.etag,
+            "md5_hash": blob.md5_hash,
+            "generation": blob.generation,
+            "url": url_prefix + name
+        }
+
     async def list_objects(self, bucket_name: str, prefix: str = "") -> List[Dict]:
         """List objects in the storage bucket"""
         try:
             bucket = self.client.bucket(bucket_name)
             blobs = bucket.list_blobs(prefix=prefix)
             
-            objects = []
-            for blob in blobs:
-                objects.append({
-                    "name": blob.name,
-                    "size": blob.size,
-                    "content_type": blob.content_type,
-                    "created": blob.time_created.isoformat() if blob.time_created else None,
-                    "updated": blob.updated.isoformat() if blob.updated else None,
-                    "etag": blob.etag,
-                    "md5_hash": blob.md5_hash,
-                    "generation": blob.generation,
-                    "url": f"gs://{bucket_name}/{blob.name}"
-                })
+            url_prefix = f"gs://{bucket_name}/"
+            objects = [self._blob_to_dict(blob, url_prefix) for blob in blobs]
             
             logger.info("Listed objects in bucket", 
                        bucket_name=bucket_name,
@@ -519,6 +592,37 @@ class StorageManager:
                         error=str(e))
             return []
 
+    async def list_objects_page(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        max_results: int = 500,
+        page_token: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """List a single page of objects, returning the objects and the next page token"""
+        try:
+            bucket = self.client.bucket(bucket_name)
+            blobs = bucket.list_blobs(prefix=prefix, max_results=max_results, page_token=page_token)
+            
+            url_prefix = f"gs://{bucket_name}/"
+            page = next(blobs.pages, None)
+            objects = [self._blob_to_dict(blob, url_prefix) for blob in page] if page is not None else []
+            
+            logger.info("Listed object page in bucket", 
+                       bucket_name=bucket_name,
+                       prefix=prefix,
+                       object_count=len(objects),
+                       has_more=bool(blobs.next_page_token))
+            
+            return objects, blobs.next_page_token
+            
+        except Exception as e:
+            logger.error("Failed to list object page", 
+                        bucket_name=bucket_name,
+                        prefix=prefix,
+                        error=str(e))
+            return [], None
+
     async def delete_object(self, bucket_name: str, object_name: str) -> bool:
         """Delete an object from the storage bucket"""
         try:
@@ -553,6 +657,39 @@ class StorageManager:
                         error=str(e))
             return False
 
+    async def delete_objects(self, bucket_name: str, object_names: List[str]) -> Tuple[List[str], List[str]]:
+        """Delete several objects from the storage bucket in one pass.
+
+        Returns the lists of deleted and failed object names. A failure (including an
+        already-missing object) is recorded for that object only; the rest are still attempted.
+        """
+        bucket = self.client.bucket(bucket_name)
+
+        def _delete_all() -> Tuple[List[str], List[str]]:
+            deleted: List[str] = []
+            failed: List[str] = []
+            for name in object_names:
+                try:
+                    bucket.blob(name).delete()
+                    deleted.append(name)
+                except Exception as e:
+                    logger.warning("Failed to delete object",
+                                   bucket_name=bucket_name,
+                                   object_name=name,
+                                   error=str(e))
+                    failed.append(name)
+            return deleted, failed
+
+        # Up to one HTTP request per object; keep them off the event loop
+        deleted, failed = await asyncio.get_event_loop().run_in_executor(None, _delete_all)
+        
+        logger.info("Deleted objects from bucket", 
+                   bucket_name=bucket_name,
+                   deleted_count=len(deleted),
+                   failed_count=len(failed))
+        
+        return deleted, failed
+
     async def get_object_info(self, bucket_name: str, object_name: str) -> Optional[Dict]:
         """Get information about a specific object"""
         try:
@@ -584,3 +721,13 @@ class StorageManager:
                         object_name=object_name,
                         error=str(e))
             return None
+
+# Global storage manager instance
+_storage_manager = None
+
+def get_storage_manager() -> StorageManager:
+    """Get the global storage manager, so every caller shares one GCS client and its connection pool"""
+    global _storage_manager
+    if _storage_manager is None:
+        _storage_manager = StorageManager()
+    return _storage_manager
@@ -74,6 +74,10 @@ class BucketOperationRequest(BaseModel):
     force: bool = False  # Force operation even with data
     backup_location: Optional[str] = None
 
+class BulkDeleteRequest(BaseModel):
+    """Request model for deleting several objects in one call"""
+    file_paths: List[str] = Field(..., min_items=1, max_items=1000)
+
 class StorageListResponse(BaseModel):
     """Response model for storage listing"""
     storages: List[UserStorage]
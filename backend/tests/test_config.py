@@ -17,3 +17,13 @@ def test_development_mode():
     """Test development mode settings"""
     settings = Settings(dev_mode=True)
     assert settings.dev_mode is True
+
+def test_admin_emails_resolved_once(monkeypatch):
+    """Test that admin emails are merged, de-duplicated and cached"""
+    settings = Settings(admin_emails=["admin@example.com"])
+    monkeypatch.setenv("ADMIN_EMAILS", "Admin@Example.com, ops@example.com")
+    emails = settings.get_admin_emails()
+    assert emails == ["admin@example.com", "ops@example.com"]
+    
+    monkeypatch.setenv("ADMIN_EMAILS", "other@example.com")
+    assert settings.get_admin_emails() is emails
@@ -0,0 +1,86 @@
+import gzip
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import HTTPException
+from file_api import MAX_FILE_SIZE, _decompress_gzip, _looks_like_json, update_user_file
+from file_models import FileType, UserFile, UserFileUpdate
+
+def test_decompress_gzip_roundtrip():
+    """Test that gzip uploads are decompressed back to the original bytes"""
+    payload = b'{"key": "value"}'
+    assert _decompress_gzip(gzip.compress(payload)) == payload
+
+def test_decompress_gzip_rejects_oversized_content():
+    """Test that content inflating past the size limit is rejected"""
+    with pytest.raises(HTTPException) as exc_info:
+        _decompress_gzip(gzip.compress(b" " * (MAX_FILE_SIZE + 1)))
+    assert exc_info.value.status_code == 400
+
+def test_decompress_gzip_rejects_invalid_data():
+    """Test that non-gzip data is rejected"""
+    with pytest.raises(HTTPException):
+        _decompress_gzip(b"not gzip")
+
+def test_decompress_gzip_rejects_truncated_data():
+    """Test that a gzip stream cut off before its end is rejected"""
+    compressed = gzip.compress(b'{"key": "value"}' * 100)
+    with pytest.raises(HTTPException) as exc_info:
+        _decompress_gzip(compressed[:len(compressed) // 2])
+    assert exc_info.value.status_code == 400
+
+def test_looks_like_json_accepts_objects_and_arrays():
+    """Test that JSON objects and arrays pass the pre-check"""
+    assert _looks_like_json(b'  \n{"type": "service_account"}')
+    assert _looks_like_json(b'[1, 2, 3]')
+
+def test_looks_like_json_accepts_non_ascii_text():
+    """Test that UTF-8 JSON with non-ASCII text passes the pre-check"""
+    content = json.dumps({"title": "Космология " * 50}, ensure_ascii=False).encode("utf-8")
+    assert _looks_like_json(content)
+
+def test_looks_like_json_rejects_garbage():
+    """Test that binary and non-container content fails the pre-check"""
+    assert not _looks_like_json(b'')
+    assert not _looks_like_json(b'hello world')
+    assert not _looks_like_json(b'{' + bytes(range(0, 9)) * 50)
+
+def _legacy_file():
+    return UserFile(
+        id="file-1",
+        user_id="user-1",
+        file_name="config.json",
+        file_type=FileType.CUSTOM_JSON,
+        encrypted_content=b"",
+        environment_variable_name="my-config",
+        container_path="/mnt/user-files/config.json",
+        file_size=2,
+        created_at=datetime(2024, 1, 1),
+    )
+
+@pytest.mark.asyncio
+async def test_update_legacy_named_file_keeps_its_name():
+    """Test that a file stored under a non-shell-safe name can still be edited"""
+    db = Mock()
+    db.get_user_file = AsyncMock(return_value=_legacy_file())
+    db.update_user_file = AsyncMock(return_value=True)
+    with patch("file_api.get_database", return_value=db):
+        await update_user_file(
+            "file-1",
+            UserFileUpdate(environment_variable_name="my-config", container_path="/mnt/user-files/new.json"),
+            {"sub": "user-1"}
+        )
+    db.update_user_file.assert_awaited_once_with(
+        "user-1", "file-1", container_path="/mnt/user-files/new.json"
+    )
+
+@pytest.mark.asyncio
+async def test_update_rejects_changing_to_invalid_env_var_name():
+    """Test that a changed environment variable name must be shell-safe"""
+    db = Mock()
+    db.get_user_file = AsyncMock(return_value=_legacy_file())
+    with patch("file_api.get_database", return_value=db):
+        with pytest.raises(HTTPException) as exc_info:
+            await update_user_file("file-1", UserFileUpdate(environment_variable_name="other-name"), {"sub": "user-1"})
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,47 @@
+import pytest
+from file_models import FileType, UserFileRequest, UserFileUpdate
+
+def test_env_var_name_accepts_shell_safe_names():
+    """Test that upper-case shell-safe names are accepted"""
+    request = UserFileRequest(
+        file_name="config.json",
+        file_type=FileType.CUSTOM_JSON,
+        content='{"a": 1}',
+        environment_variable_name="  MY_CONFIG_1 "
+    )
+    assert request.environment_variable_name == "MY_CONFIG_1"
+
+@pytest.mark.parametrize("name", ["1ABC", "my-var", "lower", "A" * 65])
+def test_env_var_name_rejects_invalid_names(name):
+    """Test that names which are not shell-safe are rejected"""
+    with pytest.raises(ValueError):
+        UserFileRequest(
+            file_name="config.json",
+            file_type=FileType.CUSTOM_JSON,
+            content='{"a": 1}',
+            environment_variable_name=name
+        )
+
+def test_update_keeps_legacy_env_var_names():
+    """Test that updates accept names stored before the shell-safe rule existed"""
+    assert UserFileUpdate(environment_variable_name=" my-var ").environment_variable_name == "my-var"
+
+def test_content_must_be_valid_json():
+    """Test that invalid JSON content is rejected"""
+    with pytest.raises(ValueError):
+        UserFileRequest(
+            file_name="config.json",
+            file_type=FileType.CUSTOM_JSON,
+            content='{"a": ',
+            environment_variable_name="MY_CONFIG"
+        )
+
+def test_gcp_service_account_requires_fields():
+    """Test that GCP service account keys are checked for required fields"""
+    with pytest.raises(ValueError, match="Missing required GCP service account fields"):
+        UserFileRequest(
+            file_name="key.json",
+            file_type=FileType.GCP_SERVICE_ACCOUNT,
+            content='{"type": "service_account"}',
+            environment_variable_name="IGNORED"
+        )
@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import Mock, patch
+from google.api_core import exceptions as gcp_exceptions
+from storage_manager import StorageManager
+
+@pytest.fixture
+def mock_storage_manager():
+    """Create a storage manager with a mocked GCS client"""
+    with patch('storage_manager.storage'):
+        sm = StorageManager()
+        sm.client = Mock()
+        return sm
+
+@pytest.mark.asyncio
+async def test_delete_objects_continues_past_missing_object(mock_storage_manager):
+    """Test that a missing object is reported as failed without aborting the batch"""
+    attempted = []
+
+    def make_blob(name):
+        blob = Mock()
+        def delete():
+            attempted.append(name)
+            if name == "b":
+                raise gcp_exceptions.NotFound("missing")
+        blob.delete.side_effect = delete
+        return blob
+
+    mock_storage_manager.client.bucket.return_value.blob.side_effect = make_blob
+
+    deleted, failed = await mock_storage_manager.delete_objects("bucket", ["a", "b", "c"])
+
+    assert attempted == ["a", "b", "c"]
+    assert deleted == ["a", "c"]
+    assert failed == ["b"]
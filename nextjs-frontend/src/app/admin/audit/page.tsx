@@ -3,7 +3,7 @@
 import MainLayout from '@/components/layout/MainLayout';
 import { useAdmin } from '@/contexts/AdminContext';
 import { useRouter } from 'next/navigation';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { 
   Card, 
   Table, 
@@ -38,6 +38,73 @@ interface AuditLog {
   status: 'success' | 'failed' | 'warning';
 }
 
+const AUDIT_COLUMNS = [
+  {
+    title: 'Timestamp',
+    dataIndex: 'timestamp',
+    key: 'timestamp',
+    render: (timestamp: string) => (
+      <Space>
+        <ClockCircleOutlined />
+        {new Date(timestamp).toLocaleString()}
+      </Space>
+    ),
+    sorter: (a: AuditLog, b: AuditLog) => 
+      new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime(),
+    defaultSortOrder: 'descend' as const
+  },
+  {
+    title: 'User',
+    dataIndex: 'user',
+    key: 'user',
+    render: (user: string) => (
+      <Space>
+        <UserOutlined />
+        {user}
+      </Space>
+    )
+  },
+  {
+    title: 'Action',
+    dataIndex: 'action',
+    key: 'action',
+    render: (action: string) => (
+      <Tag color="blue">{action.replace(/_/g, ' ')}</Tag>
+    )
+  },
+  {
+    title: 'Resource',
+    dataIndex: 'resource',
+    key: 'resource',
+    render: (resource: string) => (
+      <code className="bg-gray-100 px-2 py-1 rounded text-xs">
+        {resource}
+      </code>
+    )
+  },
+  {
+    title: 'Details',
+    dataIndex: 'details',
+    key: 'details',
+    ellipsis: true
+  },
+  {
+    title: 'IP Address',
+    dataIndex: 'ip_address',
+    key: 'ip_address'
+  },
+  {
+    title: 'Status',
+    dataIndex: 'status',
+    key: 'status',
+    render: (status: string) => {
+      const color = status === 'success' ? 'green' : 
+                   status === 'failed' ? 'red' : 'orange';
+      return <Tag color={color}>{status.toUpperCase()}</Tag>;
+    }
+  }
+];
+
 function AuditLogsContent() {
   const { currentRole, canSwitchToAdmin } = useAdmin();
   const router = useRouter();
@@ -122,76 +189,11 @@ function AuditLogsContent() {
     }, 1000);
   }, []);
 
-  const filteredLogs = filterStatus === 'all' 
-    ? logs 
-    : logs.filter(log => log.status === filterStatus);
+  const filteredLogs = useMemo(
+    () => filterStatus === 'all' ? logs : logs.filter(log => log.status === filterStatus),
+    [logs, filterStatus]
+  );
 
-  const columns = [
-    {
-      title: 'Timestamp',
-      dataIndex: 'timestamp',
-      key: 'timestamp',
-      render: (timestamp: string) => (
-        <Space>
-          <ClockCircleOutlined />
-          {new Date(timestamp).toLocaleString()}
-        </Space>
-      ),
-      sorter: (a: AuditLog, b: AuditLog) => 
-        new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime(),
-      defaultSortOrder: 'descend' as const
-    },
-    {
-      title: 'User',
-      dataIndex: 'user',
-      key: 'user',
-      render: (user: string) => (
-        <Space>
-          <UserOutlined />
-          {user}
-        </Space>
-      )
-    },
-    {
-      title: 'Action',
-      dataIndex: 'action',
-      key: 'action',
-      render: (action: string) => (
-        <Tag color="blue">{action.replace(/_/g, ' ')}</Tag>
-      )
-    },
-    {
-      title: 'Resource',
-      dataIndex: 'resource',
-      key: 'resource',
-      render: (resource: string) => (
-        <code className="bg-gray-100 px-2 py-1 rounded text-xs">
-          {resource}
-        </code>
-      )
-    },
-    {
-      title: 'Details',
-      dataIndex: 'details',
-      key: 'details',
-      ellipsis: true
-    },
-    {
-      title: 'IP Address',
-      dataIndex: 'ip_address',
-      key: 'ip_address'
-    },
-    {
-      title: 'Status',
-      dataIndex: 'status',
-      key: 'status',
-      render: (status: string) => {
-        const color = status === 'success' ? 'green' : 
-                     status === 'failed' ? 'red' : 'orange';
-        return <Tag color={color}>{status.toUpperCase()}</Tag>;
-      }
-    }
-  ];
 
   if (!canSwitchToAdmin || currentRole !== 'admin') {
     return null; // Will redirect
@@ -258,7 +260,7 @@ function AuditLogsContent() {
       {/* Audit Log Table */}
       <Card title={`Audit Logs (${filteredLogs.length} entries)`} className="glass-card">
         <Table
-          columns={columns}
+          columns={AUDIT_COLUMNS}
           dataSource={filteredLogs}
           rowKey="id"
           loading={loading}
@@ -26,6 +26,92 @@ import {
 
 const { Title } = Typography;
 
+// Shared gauge definitions; each render only supplies the current value
+const RESOURCE_GAUGES = [
+  {
+    key: 'cpuUsage',
+    title: 'CPU Usage',
+    threshold: 80,
+    color: '#1890ff',
+    description: 'Current CPU utilization across all nodes',
+  },
+  {
+    key: 'memoryUsage',
+    title: 'Memory Usage',
+    threshold: 85,
+    color: '#52c41a',
+    description: 'Current memory utilization across all nodes',
+  },
+] as const;
+
+// Placeholder activity until this page is backed by the API; static, so built once
+const RECENT_ACTIVITY = [
+  {
+    key: '1',
+    user: 'user@example.com',
+    action: 'Created Environment',
+    resource: 'jupyter-env-001',
+    timestamp: '2 minutes ago',
+    status: 'success'
+  },
+  {
+    key: '2',
+    user: '22yash.tiwari@gmail.com',
+    action: 'Deleted Environment',
+    resource: 'tensorflow-env-005',
+    timestamp: '15 minutes ago',
+    status: 'success'
+  },
+  {
+    key: '3',
+    user: 'researcher@example.com',
+    action: 'Environment Failed',
+    resource: 'pytorch-env-003',
+    timestamp: '1 hour ago',
+    status: 'error'
+  }
+];
+
+const ACTIVITY_COLUMNS = [
+  {
+    title: 'User',
+    dataIndex: 'user',
+    key: 'user'
+  },
+  {
+    title: 'Action',
+    dataIndex: 'action',
+    key: 'action'
+  },
+  {
+    title: 'Resource',
+    dataIndex: 'resource',
+    key: 'resource',
+    render: (text: string) => <code className="bg-gray-100 px-2 py-1 rounded">{text}</code>
+  },
+  {
+    title: 'Status',
+    dataIndex: 'status',
+    key: 'status',
+    render: (status: string) => (
+      <Tag color={status === 'success' ? 'green' : 'red'}>
+        {status.toUpperCase()}
+      </Tag>
+    )
+  },
+  {
+    title: 'Time',
+    dataIndex: 'timestamp',
+    key: 'timestamp',
+    render: (text: string) => (
+      <Space>
+        <ClockCircleOutlined />
+        {text}
+      </Space>
+    )
+  }
+];
+
 function SystemMonitoringContent() {
   const { currentRole, canSwitchToAdmin } = useAdmin();
   const router = useRouter();
@@ -60,72 +146,6 @@ function SystemMonitoringContent() {
     }, 1000);
   }, []);
 
-  const recentActivity = [
-    {
-      key: '1',
-      user: 'user@example.com',
-      action: 'Created Environment',
-      resource: 'jupyter-env-001',
-      timestamp: '2 minutes ago',
-      status: 'success'
-    },
-    {
-      key: '2',
-      user: '22yash.tiwari@gmail.com',
-      action: 'Deleted Environment',
-      resource: 'tensorflow-env-005',
-      timestamp: '15 minutes ago',
-      status: 'success'
-    },
-    {
-      key: '3',
-      user: 'researcher@example.com',
-      action: 'Environment Failed',
-      resource: 'pytorch-env-003',
-      timestamp: '1 hour ago',
-      status: 'error'
-    }
-  ];
-
-  const activityColumns = [
-    {
-      title: 'User',
-      dataIndex: 'user',
-      key: 'user'
-    },
-    {
-      title: 'Action',
-      dataIndex: 'action',
-      key: 'action'
-    },
-    {
-      title: 'Resource',
-      dataIndex: 'resource',
-      key: 'resource',
-      render: (text: string) => <code className="bg-gray-100 px-2 py-1 rounded">{text}</code>
-    },
-    {
-      title: 'Status',
-      dataIndex: 'status',
-      key: 'status',
-      render: (status: string) => (
-        <Tag color={status === 'success' ? 'green' : 'red'}>
-          {status.toUpperCase()}
-        </Tag>
-      )
-    },
-    {
-      title: 'Time',
-      dataIndex: 'timestamp',
-      key: 'timestamp',
-      render: (text: string) => (
-        <Space>
-          <ClockCircleOutlined />
-          {text}
-        </Space>
-      )
-    }
-  ];
 
   if (!canSwitchToAdmin || currentRole !== 'admin') {
     return null; // Will redirect
@@ -195,37 +215,31 @@ function SystemMonitoringContent() {
 
       {/* Resource Usage */}
       <Row gutter={[16, 16]} className="mb-6">
-        <Col xs={24} lg={12}>
-          <Card title="CPU Usage" className="glass-card">
-            <Progress
-              percent={systemStats.cpuUsage}
-              status={systemStats.cpuUsage > 80 ? 'exception' : 'active'}
-              strokeColor={systemStats.cpuUsage > 80 ? '#ff4d4f' : '#1890ff'}
-            />
-            <p className="mt-2 text-gray-600">
-              Current CPU utilization across all nodes
-            </p>
-          </Card>
-        </Col>
-        <Col xs={24} lg={12}>
-          <Card title="Memory Usage" className="glass-card">
-            <Progress
-              percent={systemStats.memoryUsage}
-              status={systemStats.memoryUsage > 85 ? 'exception' : 'active'}
-              strokeColor={systemStats.memoryUsage > 85 ? '#ff4d4f' : '#52c41a'}
-            />
-            <p className="mt-2 text-gray-600">
-              Current memory utilization across all nodes
-            </p>
-          </Card>
-        </Col>
+        {RESOURCE_GAUGES.map(gauge => {
+          const value = systemStats[gauge.key];
+          const overThreshold = value > gauge.threshold;
+          return (
+            <Col xs={24} lg={12} key={gauge.key}>
+              <Card title={gauge.title} className="glass-card">
+                <Progress
+                  percent={value}
+                  status={overThreshold ? 'exception' : 'active'}
+                  strokeColor={overThreshold ? '#ff4d4f' : gauge.color}
+                />
+                <p className="mt-2 text-gray-600">
+                  {gauge.description}
+                </p>
+              </Card>
+            </Col>
+          );
+        })}
       </Row>
 
       {/* Recent Activity */}
       <Card title="Recent Activity" className="glass-card">
         <Table
-          columns={activityColumns}
-          dataSource={recentActivity}
+          columns={ACTIVITY_COLUMNS}
+          dataSource={RECENT_ACTIVITY}
           pagination={false}
           loading={loading}
           size="small"
@@ -16,6 +16,65 @@ import {
 
 const { Title, Paragraph } = Typography;
 
+// Static card definitions, built once rather than on every render
+const ADMIN_STATS = [
+  {
+    title: 'Total Users',
+    value: 0, // Will be populated from API
+    icon: <UsergroupAddOutlined className="text-primary" />,
+    color: 'var(--primary-500)',
+  },
+  {
+    title: 'Applications',
+    value: 0, // Will be populated from API
+    icon: <AppstoreOutlined className="text-success" />,
+    color: 'var(--success-500)',
+  },
+  {
+    title: 'Active Environments',
+    value: 0, // Will be populated from API
+    icon: <DashboardOutlined className="text-warning" />,
+    color: 'var(--warning-500)',
+  },
+  {
+    title: 'System Health',
+    value: '100%',
+    icon: <SettingOutlined className="text-info" />,
+    color: 'var(--info-500)',
+  },
+];
+
+const QUICK_ACTIONS = [
+  {
+    title: 'User Management',
+    description: 'Manage user roles and permissions',
+    icon: <UsergroupAddOutlined className="text-primary" />,
+    action: '/admin/users',
+    className: 'glass-card hover:shadow-lg transition-all',
+  },
+  {
+    title: 'Application Manager',
+    description: 'Add and manage container images',
+    icon: <AppstoreOutlined className="text-success" />,
+    action: '/admin/applications',
+    className: 'glass-card hover:shadow-lg transition-all',
+  },
+  {
+    title: 'System Monitoring',
+    description: 'Monitor system performance and logs',
+    icon: <DashboardOutlined className="text-warning" />,
+    action: '/admin/monitoring',
+    className: 'glass-card hover:shadow-lg transition-all',
+  },
+  {
+    title: 'Audit Logs',
+    description: 'View system and user activity logs',
+    icon: <FileTextOutlined className="text-info" />,
+    action: '/admin/audit',
+    className: 'glass-card hover:shadow-lg transition-all',
+  },
+];
+
 function AdminDashboardContent() {
   const { currentRole, canSwitchToAdmin } = useAdmin();
   const router = useRouter();
@@ -32,64 +91,6 @@ function AdminDashboardContent() {
     return null;
   }
 
-  const adminStats = [
-    {
-      title: 'Total Users',
-      value: 0, // Will be populated from API
-      icon: <UsergroupAddOutlined className="text-primary" />,
-      color: 'var(--primary-500)',
-    },
-    {
-      title: 'Applications',
-      value: 0, // Will be populated from API
-      icon: <AppstoreOutlined className="text-success" />,
-      color: 'var(--success-500)',
-    },
-    {
-      title: 'Active Environments',
-      value: 0, // Will be populated from API
-      icon: <DashboardOutlined className="text-warning" />,
-      color: 'var(--warning-500)',
-    },
-    {
-      title: 'System Health',
-      value: '100%',
-      icon: <SettingOutlined className="text-info" />,
-      color: 'var(--info-500)',
-    },
-  ];
-
-  const quickActions = [
-    {
-      title: 'User Management',
-      description: 'Manage user roles and permissions',
-      icon: <UsergroupAddOutlined className="text-primary" />,
-      action: '/admin/users',
-      className: 'glass-card hover:shadow-lg transition-all',
-    },
-    {
-      title: 'Application Manager',
-      description: 'Add and manage container images',
-      icon: <AppstoreOutlined className="text-success" />,
-      action: '/admin/applications',
-      className: 'glass-card hover:shadow-lg transition-all',
-    },
-    {
-      title: 'System Monitoring',
-      description: 'Monitor system performance and logs',
-      icon: <DashboardOutlined className="text-warning" />,
-      action: '/admin/monitoring',
-      className: 'glass-card hover:shadow-lg transition-all',
-    },
-    {
-      title: 'Audit Logs',
-      description: 'View system and user activity logs',
-      icon: <FileTextOutlined className="text-info" />,
-      action: '/admin/audit',
-      className: 'glass-card hover:shadow-lg transition-all',
-    },
-  ];
-
   return (
     <MainLayout>
       <div className="space-y-6">
@@ -120,7 +121,7 @@ function AdminDashboardContent() {
 
         {/* Admin Statistics */}
         <Row gutter={[24, 24]}>
-          {adminStats.map((stat, index) => (
+          {ADMIN_STATS.map((stat, index) => (
             <Col xs={24} sm={12} md={6} key={index}>
               <Card className="glass-card text-center">
                 <Statistic
@@ -148,7 +149,7 @@ function AdminDashboardContent() {
             Admin Tools
           </Title>
           <Row gutter={[24, 24]}>
-            {quickActions.map((action, index) => (
+            {QUICK_ACTIONS.map((action, index) => (
               <Col xs={24} sm={12} md={6} key={index}>
                 <Card
                   className={action.className}
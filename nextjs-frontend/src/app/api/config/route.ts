@@ -4,39 +4,43 @@ import { NextResponse } from 'next/server';
 export const dynamic = 'force-dynamic';
 export const revalidate = 0;
 
+// Browsers may reuse the config for a few minutes; a redeploy still propagates quickly
+const CONFIG_MAX_AGE_SECONDS = 300;
+
+type RuntimeConfig = {
+  apiUrl: string;
+  apiDomain: string;
+  domain: string;
+  nextAuthUrl: string;
+  nodeEnv: string;
+  debug: string;
+};
+
+// process.env is fixed for the life of the server process, so resolve it on the first request only
+let runtimeConfig: RuntimeConfig | null = null;
+
+function getRuntimeConfig(): RuntimeConfig {
+  if (!runtimeConfig) {
+    // Use server-side env vars first, then NEXT_PUBLIC_ vars, then defaults
+    runtimeConfig = {
+      apiUrl: process.env['API_URL'] || process.env['NEXT_PUBLIC_API_URL'] || 'http://localhost:8000',
+      apiDomain: process.env['NEXT_PUBLIC_API_DOMAIN'] || 'api.localhost',
+      domain: process.env['NEXT_PUBLIC_DOMAIN'] || 'localhost',
+      nextAuthUrl: process.env['NEXTAUTH_URL'] || 'http://localhost:3001',
+      nodeEnv: process.env['NODE_ENV'] || 'development',
+      debug: 'v2-runtime-env-vars'  // Version marker
+    };
+  }
+  return runtimeConfig;
+}
+
 export async function GET() {
-  // Read environment variables at runtime using process.env directly
-  const timestamp = new Date().toISOString();
-  
-  // Force fresh environment variable reading with explicit property access
-  // Use server-side env vars first, then NEXT_PUBLIC_ vars, then defaults
-  const apiUrl = process.env['API_URL'] || process.env['NEXT_PUBLIC_API_URL'] || 'http://localhost:8000';
-  const apiDomain = process.env['NEXT_PUBLIC_API_DOMAIN'] || 'api.localhost';
-  const domain = process.env['NEXT_PUBLIC_DOMAIN'] || 'localhost';
-  const nextAuthUrl = process.env['NEXTAUTH_URL'] || 'http://localhost:3001';
-  const nodeEnv = process.env['NODE_ENV'] || 'development';
-  
-  // Create debug object
-  const envVars = {
-    API_URL: process.env['API_URL'],
-    NEXT_PUBLIC_API_URL: process.env['NEXT_PUBLIC_API_URL'],
-    NEXT_PUBLIC_API_DOMAIN: process.env['NEXT_PUBLIC_API_DOMAIN'],
-    NEXT_PUBLIC_DOMAIN: process.env['NEXT_PUBLIC_DOMAIN'],
-    NEXTAUTH_URL: process.env['NEXTAUTH_URL'],
-    NODE_ENV: nodeEnv
-  };
-  
-  
   const config = {
-    apiUrl,
-    apiDomain,
-    domain, 
-    nextAuthUrl,
-    nodeEnv,
-    timestamp,
-    debug: 'v2-runtime-env-vars'  // Version marker
+    ...getRuntimeConfig(),
+    timestamp: new Date().toISOString(),
   };
-  
-  
-  return NextResponse.json(config);
-}
\ No newline at end of file
+
+  return NextResponse.json(config, {
+    headers: { 'Cache-Control': `private, max-age=${CONFIG_MAX_AGE_SECONDS}` },
+  });
+}
@@ -2,6 +2,120 @@
 
 import { useEffect, useState } from 'react';
 
+// NEXT_PUBLIC_ values are inlined at build time, so this never changes after load
+const CLIENT_ENV: Record<string, string | undefined> = {
+  NODE_ENV: process.env.NODE_ENV,
+  // Only NEXT_PUBLIC_ variables are available client-side
+  NEXT_PUBLIC_API_URL: process.env.NEXT_PUBLIC_API_URL,
+  NEXT_PUBLIC_API_DOMAIN: process.env.NEXT_PUBLIC_API_DOMAIN,
+  NEXT_PUBLIC_DOMAIN: process.env.NEXT_PUBLIC_DOMAIN,
+};
+
+// Flat key/value table for the small, fixed-shape objects shown on this page
+function ConfigTable({ values }: { values: Record<string, unknown> }) {
+  return (
+    <table style={{ borderCollapse: 'collapse', marginBottom: '16px' }}>
+      <tbody>
+        {Object.entries(values).map(([key, value]) => (
+          <tr key={key}>
+            <td style={{ padding: '2px 16px 2px 0', fontWeight: 'bold' }}>{key}</td>
+            <td style={{ padding: '2px 0' }}>
+              {value === undefined ? 'undefined' : typeof value === 'object' ? JSON.stringify(value) : String(value)}
+            </td>
+          </tr>
+        ))}
+      </tbody>
+    </table>
+  );
+}
+
+// Nearest-rank percentile of an ascending-sorted sample
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return NaN;
+  const rank = Math.ceil((p / 100) * sorted.length);
+  return sorted[Math.min(Math.max(rank, 1), sorted.length) - 1];
+}
+
+// Fires `total` GET /health requests, at most `concurrency` in flight, and summarizes latency in ms
+async function runHealthBurst(total: number, concurrency: number): Promise<Record<string, string | number>> {
+  const { envValidator } = await import('@/lib/env-validator');
+  const url = await envValidator.getApiUrlAsync('/health');
+  const latencies: number[] = [];
+  let failed = 0;
+  let issued = 0;
+
+  const worker = async () => {
+    while (issued < total) {
+      issued++;
+      const start = performance.now();
+      try {
+        const response = await fetch(url, { cache: 'no-store' });
+        await response.arrayBuffer();
+        if (response.ok) {
+          latencies.push(performance.now() - start);
+        } else {
+          failed++;
+        }
+      } catch {
+        failed++;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(concurrency, total) }, worker));
+
+  latencies.sort((a, b) => a - b);
+  const format = (ms: number) => (Number.isNaN(ms) ? 'n/a' : `${ms.toFixed(1)} ms`);
+  return {
+    url,
+    requests: total,
+    concurrency,
+    failed,
+    p50: format(percentile(latencies, 50)),
+    p90: format(percentile(latencies, 90)),
+    p95: format(percentile(latencies, 95)),
+    p99: format(percentile(latencies, 99)),
+    max: format(latencies.length ? latencies[latencies.length - 1] : NaN),
+  };
+}
+
+function HealthBurst() {
+  const [total, setTotal] = useState(50);
+  const [concurrency, setConcurrency] = useState(10);
+  const [running, setRunning] = useState(false);
+  const [summary, setSummary] = useState<Record<string, string | number> | null>(null);
+
+  const run = async () => {
+    setRunning(true);
+    try {
+      setSummary(await runHealthBurst(total, concurrency));
+    } catch (err) {
+      console.error('Burst test error:', err);
+      setSummary({ error: err instanceof Error ? err.message : String(err) });
+    } finally {
+      setRunning(false);
+    }
+  };
+
+  return (
+    <div>
+      <label>
+        Requests{' '}
+        <input type="number" min={1} max={500} value={total}
+               onChange={(e) => setTotal(Math.min(500, Math.max(1, Number(e.target.value) || 1)))} />
+      </label>{' '}
+      <label>
+        Concurrency{' '}
+        <input type="number" min={1} max={50} value={concurrency}
+               onChange={(e) => setConcurrency(Math.min(50, Math.max(1, Number(e.target.value) || 1)))} />
+      </label>{' '}
+      <button onClick={run} disabled={running}>
+        {running ? 'Running...' : 'Burst /health'}
+      </button>
+      {summary && <ConfigTable values={summary} />}
+    </div>
+  );
+}
+
 export default function DebugPage() {
   const [config, setConfig] = useState<any>(null);
   const [error, setError] = useState<string | null>(null);
@@ -33,17 +147,11 @@ export default function DebugPage() {
       <h1>Debug Page</h1>
       
       <h2>Environment Variables (Client-side)</h2>
-      <pre>{JSON.stringify({
-        NODE_ENV: process.env.NODE_ENV,
-        // Only NEXT_PUBLIC_ variables are available client-side
-        NEXT_PUBLIC_API_URL: process.env.NEXT_PUBLIC_API_URL,
-        NEXT_PUBLIC_API_DOMAIN: process.env.NEXT_PUBLIC_API_DOMAIN,
-        NEXT_PUBLIC_DOMAIN: process.env.NEXT_PUBLIC_DOMAIN,
-      }, null, 2)}</pre>
+      <ConfigTable values={CLIENT_ENV} />
 
       <h2>Runtime Config from /api/config</h2>
       {error && <div style={{ color: 'red' }}>Error: {error}</div>}
-      {config && <pre>{JSON.stringify(config, null, 2)}</pre>}
+      {config && <ConfigTable values={config} />}
       {!config && !error && <div>Loading...</div>}
 
       <h2>API Client Test</h2>
@@ -59,6 +167,9 @@ export default function DebugPage() {
       }}>
         Test envValidator.getApiUrlAsync()
       </button>
+
+      <h2>API Latency Burst</h2>
+      <HealthBurst />
     </div>
   );
 }
\ No newline at end of file
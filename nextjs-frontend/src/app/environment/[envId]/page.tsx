@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useParams, useRouter } from 'next/navigation';
 import {
   Card,
@@ -13,8 +13,7 @@ import {
   Tag,
   Divider,
   Modal,
-  message,
-  Progress
+  message
 } from 'antd';
 import {
   ReloadOutlined,
@@ -23,11 +22,10 @@ import {
   InfoCircleOutlined,
   LinkOutlined,
   PlayCircleOutlined,
-  RocketOutlined,
-  CheckCircleOutlined
+  RocketOutlined
 } from '@ant-design/icons';
-import { useQuery } from '@tanstack/react-query';
-import { apiClient } from '@/lib/api-client';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
+import { environmentQueryOptions } from '@/lib/environment-queries';
 import { formatDateTime, getStatusColor } from '@/lib/utils';
 import type { Environment } from '@/types';
 import MainLayout from '@/components/layout/MainLayout';
@@ -42,11 +40,10 @@ export default function EnvironmentAccessPage() {
   const [iframeError, setIframeError] = useState(false);
   const [fullscreen, setFullscreen] = useState(false);
   const [isLoading, setIsLoading] = useState(true);
-  const [loadingProgress, setLoadingProgress] = useState(0);
-  const [loadingMessage, setLoadingMessage] = useState('Initializing environment...');
 
   // Extract envId after hooks are initialized
   const envId = params?.envId as string;
+  const queryClient = useQueryClient();
 
   // Debug logging
 
@@ -57,25 +54,7 @@ export default function EnvironmentAccessPage() {
     error,
     refetch
   } = useQuery({
-    queryKey: ['environment', envId],
-    queryFn: async () => {
-      if (!envId) {
-        throw new Error('Environment ID is required');
-      }
-
-      try {
-        const response = await apiClient.getEnvironmentById(envId);
-
-        if (response.status === 'success' && response.environment) {
-          return response.environment;
-        }
-        throw new Error(response.message || 'Environment not found');
-      }
-      catch (error) {
-        console.error('Failed to fetch environment:', error);
-        throw error;
-      }
-    },
+    ...environmentQueryOptions(envId, queryClient),
     refetchInterval: (query) => {
       // In modern TanStack Query, the function receives the query object.
       const data = query.state.data;
@@ -85,40 +64,24 @@ export default function EnvironmentAccessPage() {
 
   });
 
-  // Enhanced loading simulation with progress
-  useEffect(() => {
-    if (!environment?.url) return;
-    
-    setIsLoading(true);
-    setLoadingProgress(0);
-    setLoadingMessage('Connecting to environment...');
-
-    const loadingSteps = [
-      { progress: 20, message: 'Establishing connection...' },
-      { progress: 40, message: 'Loading application...' },
-      { progress: 60, message: 'Initializing interface...' },
-      { progress: 80, message: 'Preparing workspace...' },
-      { progress: 95, message: 'Almost ready...' },
-      { progress: 100, message: 'Environment ready!' }
-    ];
+  // Keep the overlay up until the application actually answers: the pod must be running and the iframe loaded
+  const isStarting = environment?.status === 'pending';
+  const showLoadingOverlay = isStarting || isLoading;
+  const loadingMessage = isStarting ? 'Waiting for the environment to start...' : 'Loading application...';
 
-    let currentStep = 0;
-    const stepInterval = setInterval(() => {
-      if (currentStep < loadingSteps.length) {
-        const step = loadingSteps[currentStep];
-        setLoadingProgress(step.progress);
-        setLoadingMessage(step.message);
-        currentStep++;
-        
-        if (currentStep === loadingSteps.length) {
-          setTimeout(() => setIsLoading(false), 500);
-        }
-      } else {
-        clearInterval(stepInterval);
-      }
-    }, 800);
+  // A pod that was still starting served an error page into the iframe; reload it once the status poll reports running
+  const previousStatus = useRef(environment?.status);
+  useEffect(() => {
+    if (previousStatus.current === 'pending' && environment?.status === 'running') {
+      setIframeKey(prev => prev + 1);
+    }
+    previousStatus.current = environment?.status;
+  }, [environment?.status]);
 
-    return () => clearInterval(stepInterval);
+  useEffect(() => {
+    if (environment?.url) {
+      setIsLoading(true);
+    }
   }, [environment?.url, iframeKey]);
 
   // Handle iframe reload
@@ -126,7 +89,6 @@ export default function EnvironmentAccessPage() {
     setIframeKey(prev => prev + 1);
     setIframeError(false);
     setIsLoading(true);
-    setLoadingProgress(0);
   };
 
   // Handle external link
@@ -363,7 +325,7 @@ export default function EnvironmentAccessPage() {
             bodyStyle={{ padding: 0, height: '100%', position: 'relative' }}
           >
             {/* Loading Overlay */}
-            {isLoading && (
+            {showLoadingOverlay && (
               <div 
                 style={{
                   position: 'absolute',
@@ -386,7 +348,7 @@ export default function EnvironmentAccessPage() {
                   </div>
                   
                   <Title level={2} style={{ color: 'var(--text-primary)', marginBottom: '16px' }}>
-                    {loadingProgress === 100 ? 'Ready!' : 'Loading Environment'}
+                    Loading Environment
                   </Title>
                   
                   <Text style={{ 
@@ -398,32 +360,7 @@ export default function EnvironmentAccessPage() {
                     {loadingMessage}
                   </Text>
                   
-                  <div style={{ marginBottom: '24px' }}>
-                    <Progress
-                      percent={loadingProgress}
-                      strokeColor={{
-                        '0%': 'var(--primary-400)',
-                        '50%': 'var(--primary-500)',
-                        '100%': 'var(--success-500)',
-                      }}
-                      trailColor="var(--glass-border)"
-                      size="default"
-                      showInfo={false}
-                      style={{ marginBottom: '16px' }}
-                    />
-                    <Text style={{ color: 'var(--text-tertiary)', fontSize: '14px' }}>
-                      {loadingProgress}% Complete
-                    </Text>
-                  </div>
-                  
-                  {loadingProgress === 100 && (
-                    <div style={{ display: 'flex', alignItems: 'center', justifyContent: 'center', gap: '8px' }}>
-                      <CheckCircleOutlined style={{ color: 'var(--success-500)', fontSize: '16px' }} />
-                      <Text style={{ color: 'var(--success-600)', fontWeight: '500' }}>
-                        Environment is ready!
-                      </Text>
-                    </div>
-                  )}
+                  <Spin size="large" />
                 </div>
               </div>
             )}
@@ -486,13 +423,14 @@ export default function EnvironmentAccessPage() {
                   width: '100%',
                   height: '100%',
                   border: 'none',
-                  opacity: isLoading ? 0 : 1,
+                  opacity: showLoadingOverlay ? 0 : 1,
                   transition: 'opacity 0.3s ease-in-out'
                 }}
                 title={`Environment ${environment.env_id || environment.id}`}
                 onError={handleIframeError}
                 onLoad={() => {
                   setIframeError(false);
+                  setIsLoading(false);
                 }}
                 sandbox="allow-same-origin allow-scripts allow-popups allow-forms allow-downloads"
                 allow="fullscreen; clipboard-read; clipboard-write"
@@ -14,6 +14,24 @@ export const metadata = {
 // Force dynamic rendering for all pages
 export const dynamic = 'force-dynamic';
 
+// Applies the stored theme (light by default) before hydration to avoid a flash.
+// Every page response inlines this, so whitespace is collapsed once at module load.
+// Keep it free of line comments: they would swallow the rest of the collapsed script.
+const THEME_INIT_SCRIPT = `
+  (function() {
+    function getInitialTheme() {
+      try {
+        const storedTheme = window.localStorage.getItem('theme');
+        if (storedTheme === 'dark' || storedTheme === 'light') return storedTheme;
+      } catch (e) {}
+      return 'light';
+    }
+    const theme = getInitialTheme();
+    document.documentElement.setAttribute('data-theme', theme);
+    document.documentElement.className = theme;
+    document.documentElement.style.setProperty('--initial-theme', theme);
+  })();
+`.replace(/\s+/g, ' ').trim();
 
 export default function RootLayout({
   children,
@@ -23,26 +41,7 @@ export default function RootLayout({
   return (
     <html lang="en" suppressHydrationWarning>
       <body className={inter.className}>
-        <script
-          dangerouslySetInnerHTML={{
-            __html: `
-              (function() {
-                function getInitialTheme() {
-                  try {
-                    const storedTheme = window.localStorage.getItem('theme');
-                    if (storedTheme === 'dark' || storedTheme === 'light') return storedTheme;
-                  } catch (e) {}
-                  return 'light'; // Default to light theme
-                }
-                const theme = getInitialTheme();
-                document.documentElement.setAttribute('data-theme', theme);
-                document.documentElement.className = theme;
-                // Also set a CSS custom property for immediate access
-                document.documentElement.style.setProperty('--initial-theme', theme);
-              })();
-            `,
-          }}
-        />
+        <script dangerouslySetInnerHTML={{ __html: THEME_INIT_SCRIPT }} />
         <Providers>
           {children}
         </Providers>
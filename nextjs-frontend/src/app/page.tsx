@@ -1,8 +1,7 @@
 'use client';
 
-import { useSession } from 'next-auth/react';
+import { useMemo } from 'react';
 import { useRouter } from 'next/navigation';
-import { useEffect, useState } from 'react';
 import { Card, Row, Col, Statistic, Typography, Space, Button, Alert, Spin } from 'antd';
 import {
   RocketOutlined,
@@ -14,69 +13,38 @@ import {
 } from '@ant-design/icons';
 import MainLayout from '@/components/layout/MainLayout';
 import ProtectedRoute from '@/components/auth/ProtectedRoute';
-import apiClient from '@/lib/api-client';
-import { Environment, StorageItem } from '@/types';
+import { useDashboardData } from '@/lib/dashboard-queries';
 
 const { Title, Text, Paragraph } = Typography;
 
+// Static, so built once rather than on every poll-driven render
+const QUICK_ACTIONS = [
+  {
+    title: 'Launch Environment',
+    description: 'Start a new computational environment',
+    icon: <PlayCircleOutlined />,
+    action: '/environments',
+  },
+  {
+    title: 'Manage Storage',
+    description: 'Upload, download, and organize files',
+    icon: <DatabaseOutlined />,
+    action: '/storage',
+  },
+  {
+    title: 'System Settings',
+    description: 'Configure platform preferences',
+    icon: <SettingOutlined />,
+    action: '/settings',
+  },
+];
+
 function DashboardContent() {
-  const { data: session } = useSession();
   const router = useRouter();
-  const [environments, setEnvironments] = useState<Environment[]>([]);
-  const [storages, setStorages] = useState<StorageItem[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState<string | null>(null);
-
-  // Fetch dashboard data
-  useEffect(() => {
-    const fetchDashboardData = async () => {
-      if (!session) return;
-
-      try {
-        // Only show loading spinner on initial load
-        if (environments.length === 0 && storages.length === 0) {
-          setLoading(true);
-        }
-
-        const [envResponse, storageResponse] = await Promise.all([
-          apiClient.listEnvironments(),
-          apiClient.listUserStorages()
-        ]);
-
-
-        // Handle environment response - now properly structured
-        if (envResponse.status === 'success' && envResponse.environments) {
-          setEnvironments(envResponse.environments);
-        }
-
-        // Handle storage response - now properly structured
-        if (storageResponse.status === 'success' && storageResponse.storages) {
-          setStorages(storageResponse.storages);
-        }
-      } catch (error) {
-        console.error('Error fetching dashboard data:', error);
-        setError(error instanceof Error ? error.message : 'Failed to load dashboard data');
-        // Set empty arrays as fallback to prevent UI issues
-        setEnvironments([]);
-        setStorages([]);
-      } finally {
-        setLoading(false);
-      }
-    };
-
-    fetchDashboardData();
-
-    // Auto-refresh dashboard data every 30 seconds in background
-    const refreshInterval = setInterval(() => {
-      fetchDashboardData();
-    }, 30000); // 30 seconds
-
-    // Cleanup interval on unmount
-    return () => clearInterval(refreshInterval);
-  }, [session]);
+  const { environments, storages, loading, error } = useDashboardData();
 
   // Calculate statistics from real data
-  const stats = [
+  const stats = useMemo(() => [
     {
       title: 'Total Environments',
       value: environments.length,
@@ -95,28 +63,7 @@ function DashboardContent() {
       icon: <DatabaseOutlined className="text-blue-500" />,
       color: '#1890ff',
     },
-  ];
-
-  const quickActions = [
-    {
-      title: 'Launch Environment',
-      description: 'Start a new computational environment',
-      icon: <PlayCircleOutlined />,
-      action: '/environments',
-    },
-    {
-      title: 'Manage Storage',
-      description: 'Upload, download, and organize files',
-      icon: <DatabaseOutlined />,
-      action: '/storage',
-    },
-    {
-      title: 'System Settings',
-      description: 'Configure platform preferences',
-      icon: <SettingOutlined />,
-      action: '/settings',
-    },
-  ];
+  ], [environments, storages]);
 
   if (loading) {
     return (
@@ -182,7 +129,7 @@ function DashboardContent() {
             Quick Actions
           </Title>
           <Row gutter={[24, 24]}>
-            {quickActions.map((action, index) => (
+            {QUICK_ACTIONS.map((action, index) => (
               <Col xs={24} sm={12} md={8} key={index}>
                 <Card
                   className="bg-background-secondary border-border-primary hover:shadow-lg transition-all hover:border-primary cursor-pointer h-full"
@@ -1,13 +1,22 @@
 'use client';
 
 import React, { useState } from 'react';
-import { Tabs, Card, Typography } from 'antd';
+import dynamic from 'next/dynamic';
+import { Tabs, Card, Typography, Spin } from 'antd';
 import { UserOutlined, CodeOutlined, FileOutlined } from '@ant-design/icons';
 import MainLayout from '@/components/layout/MainLayout';
 import ProtectedRoute from '@/components/auth/ProtectedRoute';
 import ProfileSettings from '@/components/settings/ProfileSettings';
-import EnvironmentVariables from '@/components/settings/EnvironmentVariables';
-import EnvironmentFiles from '@/components/settings/EnvironmentFiles';
+
+// Secondary tabs are only fetched when first opened (antd renders tab panes lazily)
+const EnvironmentVariables = dynamic(() => import('@/components/settings/EnvironmentVariables'), {
+  ssr: false,
+  loading: () => <Spin size="small" />,
+});
+const EnvironmentFiles = dynamic(() => import('@/components/settings/EnvironmentFiles'), {
+  ssr: false,
+  loading: () => <Spin size="small" />,
+});
 
 
 const { Title, Text } = Typography;
@@ -13,11 +13,12 @@ import {
 } from '@ant-design/icons';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
 import type { ApplicationImage, StorageItem, StorageSelection } from '@/types';
 import React, { useState, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
 import { useCommonNotifications } from '@/contexts/NotificationContext';
-import { getImageUrlSync } from '@/lib/image-utils';
+import { getImageUrlSync, getClientApiUrl } from '@/lib/image-utils';
 
 const { Title, Paragraph, Text } = Typography;
 
@@ -60,28 +61,16 @@ function ApplicationStoreContent() {
 
   // Pre-fetch API config to ensure images load correctly
   useEffect(() => {
-    const preloadApiConfig = async () => {
-      try {
-        const response = await fetch('/api/config');
-        if (response.ok) {
-          const config = await response.json();
-          // Store in window for immediate access
-          if (typeof window !== 'undefined') {
-            (window as any).__RUNTIME_CONFIG__ = config;
-          }
-          // Trigger image re-render after config is loaded
-          setImageKey(prev => prev + 1);
-        }
-      } catch (error) {
-        console.warn('Failed to preload API config:', error);
-      }
-    };
-    preloadApiConfig();
+    // Shares the API client's config request rather than issuing another one
+    getClientApiUrl().then(() => {
+      // Trigger image re-render after config is loaded
+      setImageKey(prev => prev + 1);
+    });
   }, []);
 
   // Fetch real applications from API
   const { data: applications, isLoading, error } = useQuery({
-    queryKey: ['applications'],
+    queryKey: queryKeys.applications,
     queryFn: async () => {
       const response = await apiClient.listApplications();
 
@@ -113,11 +102,9 @@ function ApplicationStoreContent() {
 
   // Fetch storage options (same pattern as environment page)
   const { data: storageOptions } = useQuery({
-    queryKey: ['storages'],
-    queryFn: async () => {
-      const response = await apiClient.listUserStorages();
-      return response.storages || [];
-    }
+    queryKey: queryKeys.userStorages,
+    queryFn: () => apiClient.listUserStorages(),
+    select: (response: any) => response.storages || [],
   });
 
   // Auto-select default storage option when modal opens
@@ -146,8 +133,6 @@ function ApplicationStoreContent() {
       setLaunchStep('Validating configuration...');
       setLaunchProgress(25);
       
-      await new Promise(resolve => setTimeout(resolve, 300));
-      
       setLaunchStep('Launching environment...');
       setLaunchProgress(75);
       
@@ -171,16 +156,14 @@ function ApplicationStoreContent() {
         );
       }
       
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.environments });
       setLaunchModalVisible(false);
       form.resetFields();
       setLaunchProgress(0);
       setLaunchStep('');
       
       // Redirect to environments page using Next.js router
-      setTimeout(() => {
-        router.push('/environments');
-      }, 1500);
+      router.push('/environments');
     },
     onError: (error: any) => {
       setLaunchStep('Launch failed!');
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, memo } from 'react';
 import { 
   Card, 
   Button, 
@@ -34,7 +34,9 @@ import {
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import type { Environment } from '@/types';
 import { apiClient } from '@/lib/api-client';
-import { formatDateTime, getStatusColor, capitalize, getDisplayId } from '@/lib/utils';
+import { queryKeys } from '@/lib/query-keys';
+import { environmentQueryOptions, removeEnvironmentFromCache } from '@/lib/environment-queries';
+import { formatDateTime, getStatusColor, capitalize, getDisplayId, formatUptime } from '@/lib/utils';
 
 const { Title, Text } = Typography;
 
@@ -53,18 +55,8 @@ export default function EnvironmentDetails({ envId }: EnvironmentDetailsProps) {
     error,
     refetch 
   } = useQuery({
-    queryKey: ['environment', envId],
-    queryFn: async () => {
-      try {
-        const response = await apiClient.getEnvironmentById(envId);
-        return response.environment || response.data || response;
-      } catch (error) {
-        console.error('Failed to fetch environment details:', error);
-        throw error;
-      }
-    },
+    ...environmentQueryOptions(envId, queryClient),
     refetchInterval: 15000, // Refresh every 15 seconds
-    refetchIntervalInBackground: true,
     retry: 3,
     retryDelay: 1000,
   });
@@ -75,8 +67,8 @@ export default function EnvironmentDetails({ envId }: EnvironmentDetailsProps) {
       return await apiClient.restartEnvironment(envId);
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['environment', envId] });
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.environment(envId) });
+      queryClient.invalidateQueries({ queryKey: queryKeys.environments });
     }
   });
 
@@ -86,8 +78,8 @@ export default function EnvironmentDetails({ envId }: EnvironmentDetailsProps) {
       return await apiClient.stopEnvironment(envId);
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['environment', envId] });
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      removeEnvironmentFromCache(queryClient, envId);
+      queryClient.invalidateQueries({ queryKey: queryKeys.environment(envId) });
     }
   });
 
@@ -257,10 +249,7 @@ function EnvironmentOverview({ environment }: EnvironmentOverviewProps) {
           <Card>
             <Statistic
               title="Uptime"
-              value={envData?.created_at ? 
-                Math.floor((Date.now() - new Date(envData.created_at).getTime()) / (1000 * 60 * 60 * 24)) 
-                : 0}
-              suffix="days"
+              value={envData?.created_at ? formatUptime(envData.created_at) : 'N/A'}
             />
           </Card>
         </Col>
@@ -375,14 +364,17 @@ interface EnvironmentLogsProps {
   envId: string;
 }
 
-function EnvironmentLogs({ envId }: EnvironmentLogsProps) {
-  const [logs, setLogs] = useState<string[]>([
-    '[2024-08-23 10:30:15] Environment initialization started',
-    '[2024-08-23 10:30:20] Allocating resources...',
-    '[2024-08-23 10:30:25] Setting up networking...',
-    '[2024-08-23 10:30:30] Installing dependencies...',
-    '[2024-08-23 10:30:45] Environment ready for use',
-  ]);
+// Placeholder log, joined once into the single text block the log view renders
+const SAMPLE_LOG_TEXT = [
+  '[2024-08-23 10:30:15] Environment initialization started',
+  '[2024-08-23 10:30:20] Allocating resources...',
+  '[2024-08-23 10:30:25] Setting up networking...',
+  '[2024-08-23 10:30:30] Installing dependencies...',
+  '[2024-08-23 10:30:45] Environment ready for use',
+].join('\n');
+
+// Memoized so the 15s environment poll doesn't re-render the log view
+const EnvironmentLogs = memo(function EnvironmentLogs({ envId }: EnvironmentLogsProps) {
 
   return (
     <Card title="Environment Logs" 
@@ -397,16 +389,13 @@ function EnvironmentLogs({ envId }: EnvironmentLogsProps) {
             </Space>
           }
     >
-      <div className="bg-black text-green-400 p-4 rounded font-mono text-sm max-h-96 overflow-y-auto">
-        {logs.map((log, index) => (
-          <div key={index} className="mb-1">
-            {log}
-          </div>
-        ))}
-      </div>
+      {/* One text node for the whole log rather than an element per line */}
+      <pre className="bg-black text-green-400 p-4 rounded font-mono text-sm max-h-96 overflow-y-auto whitespace-pre-wrap m-0">
+        {SAMPLE_LOG_TEXT}
+      </pre>
     </Card>
   );
-}
+});
 
 // Environment Configuration Component
 interface EnvironmentConfigurationProps {
@@ -452,7 +441,8 @@ interface EnvironmentVariablesProps {
   envId: string;
 }
 
-function EnvironmentVariables({ envId }: EnvironmentVariablesProps) {
+// Only depends on envId, so the environment poll can skip it
+const EnvironmentVariables = memo(function EnvironmentVariables({ envId }: EnvironmentVariablesProps) {
   const mockEnvVars = [
     { key: 'PYTHON_PATH', value: '/usr/local/bin/python3' },
     { key: 'NODE_ENV', value: 'production' },
@@ -484,14 +474,15 @@ function EnvironmentVariables({ envId }: EnvironmentVariablesProps) {
       </div>
     </Card>
   );
-}
+});
 
 // Environment Monitoring Component  
 interface EnvironmentMonitoringProps {
   environment: Environment;
 }
 
-function EnvironmentMonitoring({ environment }: EnvironmentMonitoringProps) {
+// Re-renders only when the polled environment data actually changes
+const EnvironmentMonitoring = memo(function EnvironmentMonitoring({ environment }: EnvironmentMonitoringProps) {
   return (
     <div className="space-y-6">
       <Row gutter={16}>
@@ -557,4 +548,4 @@ function EnvironmentMonitoring({ environment }: EnvironmentMonitoringProps) {
       </Card>
     </div>
   );
-}
+});
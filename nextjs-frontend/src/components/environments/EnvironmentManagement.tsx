@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import { useRouter, useSearchParams } from 'next/navigation';
 import {
   Card,
@@ -46,11 +46,12 @@ import {
 } from '@ant-design/icons';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import type { Environment, StorageSelection, StorageItem, ApplicationImage } from '@/types';
+import type { ColumnsType } from 'antd/es/table';
 import { apiClient } from '@/lib/api-client';
-import { formatDateTime, getStatusColor, capitalize, getDisplayId } from '@/lib/utils';
+import { queryKeys } from '@/lib/query-keys';
+import { environmentsQueryOptions, removeEnvironmentFromCache } from '@/lib/environment-queries';
+import { formatDateTime, getStatusColor, capitalize, getDisplayId, parseTimestamp } from '@/lib/utils';
 import { useCommonNotifications } from '@/contexts/NotificationContext';
-import StorageManagement from '@/components/storage/StorageManagement';
-import MonitoringDashboard from '@/components/monitoring/MonitoringDashboard';
 
 const { Title, Text } = Typography;
 const { Option } = Select;
@@ -87,6 +88,34 @@ const PRESET_CONFIGS = {
   }
 };
 
+// Badges for the known statuses are static, so rows look them up instead of rebuilding them
+const STATUS_BADGES: Record<string, React.ReactNode> = {
+  running: (
+    <span className="status-badge running flex items-center gap-2">
+      <CheckCircleOutlined style={{ fontSize: '12px' }} />
+      Running
+    </span>
+  ),
+  pending: (
+    <span className="status-badge pending flex items-center gap-2">
+      <LoadingOutlined spin style={{ fontSize: '12px' }} />
+      Starting
+    </span>
+  ),
+  failed: (
+    <span className="status-badge failed flex items-center gap-2">
+      <ExclamationCircleOutlined style={{ fontSize: '12px' }} />
+      Failed
+    </span>
+  ),
+  stopped: (
+    <span className="status-badge stopped flex items-center gap-2">
+      <StopOutlined style={{ fontSize: '12px' }} />
+      Stopped
+    </span>
+  ),
+};
+
 export default function EnvironmentManagement() {
   const router = useRouter();
   const searchParams = useSearchParams();
@@ -114,65 +143,25 @@ export default function EnvironmentManagement() {
     error,
     refetch 
   } = useQuery({
-    queryKey: ['environments'],
-    queryFn: async () => {
-      try {
-        const response = await apiClient.listEnvironments();
-
-        
-        // Debug pending environments
-        const envs = response.environments || [];
-        const pendingEnvs = envs.filter(env => env.status === 'pending');
-        if (pendingEnvs.length > 0) {
-          pendingEnvs.map(env => ({
-            id: env.id,
-            env_id: env.env_id,
-            status: env.status,
-            created_at: env.created_at
-          }));
-          
-          // Check for environments stuck in pending for more than 5 minutes
-          const now = new Date();
-          const stuckEnvs = pendingEnvs.filter(env => {
-            const createdTime = new Date(env.created_at);
-            const diffMinutes = (now.getTime() - createdTime.getTime()) / (1000 * 60);
-            return diffMinutes > 5;
-          });
-          
-          if (stuckEnvs.length > 0) {
-            console.warn('Environments stuck in pending state for >5 minutes:', stuckEnvs);
-          }
-        }
-        
-        return envs;
-      } catch (error) {
-        console.error('Failed to fetch environments:', error);
-        throw error;
-      }
-    },
-    refetchInterval: (data) => {
-      // Only refetch frequently if there are pending environments
-      // Ensure data is an array before calling .some()
-      const hasPendingEnvs = Array.isArray(data) && data.some(env => env.status === 'pending');
+    ...environmentsQueryOptions(),
+    refetchInterval: (query) => {
+      // Only refetch frequently if there are pending environments.
+      // TanStack Query v5 passes the query here, not its data.
+      const hasPendingEnvs = query.state.data?.some(env => env.status === 'pending');
       return hasPendingEnvs ? 5000 : 30000; // 5s if pending, 30s otherwise
     },
-    refetchIntervalInBackground: true,
-    retry: 3,
-    retryDelay: 1000,
   });
 
   // Fetch storage options
   const { data: storageOptions } = useQuery({
-    queryKey: ['storages'],
-    queryFn: async () => {
-      const response = await apiClient.listUserStorages();
-      return response.storages || [];
-    }
+    queryKey: queryKeys.userStorages,
+    queryFn: () => apiClient.listUserStorages(),
+    select: (response: any) => response.storages || [],
   });
 
   // Fetch available applications
   const { data: applications } = useQuery({
-    queryKey: ['applications'],
+    queryKey: queryKeys.applications,
     queryFn: async () => {
       const response = await apiClient.listApplications();
       
@@ -207,8 +196,6 @@ export default function EnvironmentManagement() {
       setLaunchStep('Validating configuration...');
       setLaunchProgress(25);
       
-      await new Promise(resolve => setTimeout(resolve, 300));
-      
       setLaunchStep('Launching environment...');
       setLaunchProgress(75);
       
@@ -245,7 +232,7 @@ export default function EnvironmentManagement() {
         }
       }
       
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.environments });
       setLaunchModalVisible(false);
       form.resetFields();
       setLaunchProgress(0);
@@ -284,9 +271,8 @@ export default function EnvironmentManagement() {
         'Environment Restarting',
         'Environment is restarting. Please check the Monitoring tab for status updates.'
       );
-      // Force immediate refresh
-      await refetch();
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      // Refetches the list once, along with any other view of it
+      await queryClient.invalidateQueries({ queryKey: queryKeys.environments });
     },
     onError: (error: any) => {
       notifyError(
@@ -302,14 +288,12 @@ export default function EnvironmentManagement() {
       const result = await apiClient.stopEnvironment(envId);
       return result;
     },
-    onSuccess: async () => {
+    onSuccess: (_result, envId) => {
       notifySuccess(
         'Environment Stopping',
         'Environment is stopping. Please refresh to see updated status.'
       );
-      // Force immediate refresh
-      await refetch();
-      queryClient.invalidateQueries({ queryKey: ['environments'] });
+      removeEnvironmentFromCache(queryClient, envId);
     },
     onError: (error: any) => {
       notifyError(
@@ -359,41 +343,58 @@ export default function EnvironmentManagement() {
     launchMutation.mutate(config);
   };
 
-  const handleRestart = (envId: string) => {
+  const { mutate: restartEnvironment } = restartMutation;
+  const handleRestart = useCallback((envId: string) => {
     Modal.confirm({
       title: 'Restart Environment',
       content: 'Are you sure you want to restart this environment? This will stop and recreate the environment.',
       icon: <ExclamationCircleOutlined />,
       okText: 'Restart',
       okType: 'danger',
-      onOk: () => restartMutation.mutate(envId),
+      onOk: () => restartEnvironment(envId),
     });
-  };
+  }, [restartEnvironment]);
 
-  const handleStop = (envId: string) => {
+  const { mutate: stopEnvironment } = stopMutation;
+  const handleStop = useCallback((envId: string) => {
     Modal.confirm({
       title: 'Stop Environment',
       content: 'Are you sure you want to stop this environment? This will gracefully shutdown the environment.',
       icon: <ExclamationCircleOutlined />,
       okText: 'Stop',
       okType: 'danger',
-      onOk: () => stopMutation.mutate(envId),
+      onOk: () => stopEnvironment(envId),
     });
-  };
+  }, [stopEnvironment]);
 
 
+  // Normalize rows once per fetched list; search and status filtering then reuse the same row objects
+  const environmentRows = useMemo(
+    () => (environments || []).map(env => ({
+      ...env,
+      key: env.env_id || env.id,
+      // Ensure both id and env_id are available
+      env_id: env.env_id || env.id,
+      id: env.id || env.env_id
+    })),
+    [environments]
+  );
+
   // Filter environments based on search and status
-  const filteredEnvironments = (environments || []).filter((env) => {
-    const matchesSearch = !searchText || 
-      env.id.toLowerCase().includes(searchText.toLowerCase()) ||
-      (env.env_id && env.env_id.toLowerCase().includes(searchText.toLowerCase()));
-    
-    const matchesStatus = statusFilter === 'all' || env.status === statusFilter;
-    
-    return matchesSearch && matchesStatus;
-  }) || [];
+  const filteredEnvironments = useMemo(() => {
+    const needle = searchText.toLowerCase();
+    return environmentRows.filter((env) => {
+      const matchesSearch = !needle || 
+        env.id.toLowerCase().includes(needle) ||
+        env.env_id.toLowerCase().includes(needle);
+      
+      const matchesStatus = statusFilter === 'all' || env.status === statusFilter;
+      
+      return matchesSearch && matchesStatus;
+    });
+  }, [environmentRows, searchText, statusFilter]);
 
-  const columns = [
+  const columns = useMemo<ColumnsType<Environment>>(() => [
     {
       title: 'Environment',
       dataIndex: 'application_name',
@@ -445,49 +446,12 @@ export default function EnvironmentManagement() {
         { text: 'Failed', value: 'failed' },
       ],
       onFilter: (value: any, record: Environment) => record.status === value,
-      render: (status: string) => {
-        const getStatusBadge = (status: string) => {
-          switch (status) {
-            case 'running':
-              return (
-                <span className="status-badge running flex items-center gap-2">
-                  <CheckCircleOutlined style={{ fontSize: '12px' }} />
-                  Running
-                </span>
-              );
-            case 'pending':
-              return (
-                <span className="status-badge pending flex items-center gap-2">
-                  <LoadingOutlined spin style={{ fontSize: '12px' }} />
-                  Starting
-                </span>
-              );
-            case 'failed':
-              return (
-                <span className="status-badge failed flex items-center gap-2">
-                  <ExclamationCircleOutlined style={{ fontSize: '12px' }} />
-                  Failed
-                </span>
-              );
-            case 'stopped':
-              return (
-                <span className="status-badge stopped flex items-center gap-2">
-                  <StopOutlined style={{ fontSize: '12px' }} />
-                  Stopped
-                </span>
-              );
-            default:
-              return (
-                <span className="status-badge stopped flex items-center gap-2">
-                  <StopOutlined style={{ fontSize: '12px' }} />
-                  {capitalize(status)}
-                </span>
-              );
-          }
-        };
-        
-        return getStatusBadge(status);
-      },
+      render: (status: string) => STATUS_BADGES[status] ?? (
+        <span className="status-badge stopped flex items-center gap-2">
+          <StopOutlined style={{ fontSize: '12px' }} />
+          {capitalize(status)}
+        </span>
+      ),
     },
     {
       title: 'CPU',
@@ -524,7 +488,7 @@ export default function EnvironmentManagement() {
         </Text>
       ),
       sorter: (a: Environment, b: Environment) =>
-        new Date(a.created_at).getTime() - new Date(b.created_at).getTime(),
+        parseTimestamp(a.created_at) - parseTimestamp(b.created_at),
     },
     {
       title: 'Actions',
@@ -586,12 +550,94 @@ export default function EnvironmentManagement() {
         </Space>
       ),
     },
-  ];
+  ], [router, handleRestart, handleStop, restartMutation.isPending, stopMutation.isPending]);
 
-  const runningCount = filteredEnvironments.filter(env => env.status === 'running').length;
+  const { runningCount, pendingCount, stoppedCount } = useMemo(() => {
+    const counts = { runningCount: 0, pendingCount: 0, stoppedCount: 0 };
+    for (const env of filteredEnvironments) {
+      if (env.status === 'running') counts.runningCount++;
+      else if (env.status === 'pending') counts.pendingCount++;
+      else if (env.status === 'stopped' || env.status === 'failed') counts.stoppedCount++;
+    }
+    return counts;
+  }, [filteredEnvironments]);
   const totalCount = filteredEnvironments.length;
-  const pendingCount = filteredEnvironments.filter(env => env.status === 'pending').length;
-  const stoppedCount = filteredEnvironments.filter(env => env.status === 'stopped' || env.status === 'failed').length;
+
+  const statCards = useMemo(() => [
+    {
+      key: 'total',
+      label: 'Total',
+      value: totalCount,
+      tone: 'primary',
+      color: 'var(--interactive-primary)',
+      icon: <RocketOutlined style={{ fontSize: '18px' }} />,
+    },
+    {
+      key: 'running',
+      label: 'Running',
+      value: runningCount,
+      tone: 'success',
+      color: 'var(--success-500)',
+      icon: <PlayCircleOutlined style={{ fontSize: '18px' }} />,
+    },
+    {
+      key: 'pending',
+      label: 'Pending',
+      value: pendingCount,
+      tone: 'warning',
+      color: pendingCount > 0 ? 'var(--warning-500)' : 'var(--text-disabled)',
+      icon: pendingCount > 0
+        ? <LoadingOutlined spin style={{ fontSize: '18px' }} />
+        : <ClockCircleOutlined style={{ fontSize: '18px' }} />,
+    },
+    {
+      key: 'stopped',
+      label: 'Stopped',
+      value: stoppedCount,
+      tone: 'error',
+      color: 'var(--error-500)',
+      icon: <StopOutlined style={{ fontSize: '18px' }} />,
+    },
+  ], [totalCount, runningCount, pendingCount, stoppedCount]);
+
+  const handleSelectionChange = useCallback(
+    (keys: React.Key[]) => setSelectedRowKeys(keys as string[]),
+    []
+  );
+
+  // Ids of the selected rows still visible under the current filters, via one set lookup per row
+  const getSelectedVisibleIds = () => {
+    const selected = new Set(selectedRowKeys);
+    return filteredEnvironments.filter(env => selected.has(env.key)).map(env => env.key);
+  };
+
+  const hasFilters = !!searchText || statusFilter !== 'all';
+  const tableEmptyText = useMemo(() => (
+    <div style={{ padding: '32px', textAlign: 'center' }}>
+      <div className="icon-container primary mb-4" style={{ width: '48px', height: '48px', margin: '0 auto 16px' }}>
+        <RocketOutlined style={{ fontSize: '24px' }} />
+      </div>
+      <Title level={4} style={{ color: 'var(--text-secondary)', margin: '0 0 8px 0' }}>
+        {hasFilters ? 'No Results Found' : 'No Environments'}
+      </Title>
+      <Text style={{ color: 'var(--text-tertiary)', fontSize: '14px', display: 'block', marginBottom: '16px' }}>
+        {hasFilters
+          ? 'Try adjusting your search or filters'
+          : "Launch your first environment to get started"
+        }
+      </Text>
+      {!hasFilters && (
+        <Tooltip title="Launch Environment">
+          <Button 
+            type="primary" 
+            icon={<RocketOutlined />}
+            onClick={() => setLaunchModalVisible(true)}
+            className="glass-button"
+          />
+        </Tooltip>
+      )}
+    </div>
+  ), [hasFilters]);
   
   // Calculate available slots based on a reasonable limit (e.g., 10 max environments per user)
   const MAX_ENVIRONMENTS = 10;
@@ -648,78 +694,25 @@ export default function EnvironmentManagement() {
           {/* Compact Statistics Row */}
           <div className="mb-4">
             <Row gutter={[12, 12]}>
-              <Col xs={12} sm={6} lg={6}>
-                <Card className="glass-card" bodyStyle={{ padding: '16px' }}>
-                  <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>
-                    <div className="icon-container primary" style={{ width: '36px', height: '36px', minWidth: '36px' }}>
-                      <RocketOutlined style={{ fontSize: '18px' }} />
-                    </div>
-                    <div>
-                      <div style={{ fontSize: '20px', fontWeight: 'bold', color: 'var(--interactive-primary)', lineHeight: 1 }}>
-                        {totalCount}
-                      </div>
-                      <div style={{ fontSize: '12px', color: 'var(--text-secondary)', lineHeight: 1.2 }}>
-                        Total
-                      </div>
-                    </div>
-                  </div>
-                </Card>
-              </Col>
-              <Col xs={12} sm={6} lg={6}>
-                <Card className="glass-card" bodyStyle={{ padding: '16px' }}>
-                  <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>
-                    <div className="icon-container success" style={{ width: '36px', height: '36px', minWidth: '36px' }}>
-                      <PlayCircleOutlined style={{ fontSize: '18px' }} />
-                    </div>
-                    <div>
-                      <div style={{ fontSize: '20px', fontWeight: 'bold', color: 'var(--success-500)', lineHeight: 1 }}>
-                        {runningCount}
-                      </div>
-                      <div style={{ fontSize: '12px', color: 'var(--text-secondary)', lineHeight: 1.2 }}>
-                        Running
-                      </div>
-                    </div>
-                  </div>
-                </Card>
-              </Col>
-              <Col xs={12} sm={6} lg={6}>
-                <Card className="glass-card" bodyStyle={{ padding: '16px' }}>
-                  <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>
-                    <div className="icon-container warning" style={{ width: '36px', height: '36px', minWidth: '36px' }}>
-                      {pendingCount > 0 ? (
-                        <LoadingOutlined spin style={{ fontSize: '18px' }} />
-                      ) : (
-                        <ClockCircleOutlined style={{ fontSize: '18px' }} />
-                      )}
-                    </div>
-                    <div>
-                      <div style={{ fontSize: '20px', fontWeight: 'bold', color: pendingCount > 0 ? 'var(--warning-500)' : 'var(--text-disabled)', lineHeight: 1 }}>
-                        {pendingCount}
+              {statCards.map(stat => (
+                <Col xs={12} sm={6} lg={6} key={stat.key}>
+                  <Card className="glass-card" bodyStyle={{ padding: '16px' }}>
+                    <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>
+                      <div className={`icon-container ${stat.tone}`} style={{ width: '36px', height: '36px', minWidth: '36px' }}>
+                        {stat.icon}
                       </div>
-                      <div style={{ fontSize: '12px', color: 'var(--text-secondary)', lineHeight: 1.2 }}>
-                        Pending
+                      <div>
+                        <div style={{ fontSize: '20px', fontWeight: 'bold', color: stat.color, lineHeight: 1 }}>
+                          {stat.value}
+                        </div>
+                        <div style={{ fontSize: '12px', color: 'var(--text-secondary)', lineHeight: 1.2 }}>
+                          {stat.label}
+                        </div>
                       </div>
                     </div>
-                  </div>
-                </Card>
-              </Col>
-              <Col xs={12} sm={6} lg={6}>
-                <Card className="glass-card" bodyStyle={{ padding: '16px' }}>
-                  <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>
-                    <div className="icon-container error" style={{ width: '36px', height: '36px', minWidth: '36px' }}>
-                      <StopOutlined style={{ fontSize: '18px' }} />
-                    </div>
-                    <div>
-                      <div style={{ fontSize: '20px', fontWeight: 'bold', color: 'var(--error-500)', lineHeight: 1 }}>
-                        {stoppedCount}
-                      </div>
-                      <div style={{ fontSize: '12px', color: 'var(--text-secondary)', lineHeight: 1.2 }}>
-                        Stopped
-                      </div>
-                    </div>
-                  </div>
-                </Card>
-              </Col>
+                  </Card>
+                </Col>
+              ))}
             </Row>
           </div>
 
@@ -756,63 +749,13 @@ export default function EnvironmentManagement() {
 
           {/* Environments Table */}
           <Card className="glass-card" bodyStyle={{ padding: '0' }}>
-            <Table
+            <EnvironmentsTable
               columns={columns}
-              dataSource={filteredEnvironments.map(env => ({
-                ...env,
-                key: env.env_id || env.id,
-                // Ensure both id and env_id are available
-                env_id: env.env_id || env.id,
-                id: env.id || env.env_id
-              }))}
+              dataSource={filteredEnvironments}
               loading={isLoading}
-              size="small"
-              scroll={{ x: 'max-content' }}
-              pagination={{
-                pageSize: 10,
-                size: 'small',
-                showSizeChanger: false,
-                showQuickJumper: false,
-                showTotal: (total, range) =>
-                  `${range[0]}-${range[1]} of ${total}`,
-              }}
-              rowSelection={{
-                selectedRowKeys,
-                onChange: (keys: React.Key[]) => setSelectedRowKeys(keys as string[]),
-                selections: [
-                  Table.SELECTION_ALL,
-                  Table.SELECTION_INVERT,
-                  Table.SELECTION_NONE,
-                ],
-              }}
-              locale={{
-                emptyText: (
-                  <div style={{ padding: '32px', textAlign: 'center' }}>
-                    <div className="icon-container primary mb-4" style={{ width: '48px', height: '48px', margin: '0 auto 16px' }}>
-                      <RocketOutlined style={{ fontSize: '24px' }} />
-                    </div>
-                    <Title level={4} style={{ color: 'var(--text-secondary)', margin: '0 0 8px 0' }}>
-                      {searchText || statusFilter !== 'all' ? 'No Results Found' : 'No Environments'}
-                    </Title>
-                    <Text style={{ color: 'var(--text-tertiary)', fontSize: '14px', display: 'block', marginBottom: '16px' }}>
-                      {searchText || statusFilter !== 'all' 
-                        ? 'Try adjusting your search or filters'
-                        : "Launch your first environment to get started"
-                      }
-                    </Text>
-                    {!searchText && statusFilter === 'all' && (
-                      <Tooltip title="Launch Environment">
-                        <Button 
-                          type="primary" 
-                          icon={<RocketOutlined />}
-                          onClick={() => setLaunchModalVisible(true)}
-                          className="glass-button"
-                        />
-                      </Tooltip>
-                    )}
-                  </div>
-                ),
-              }}
+              selectedRowKeys={selectedRowKeys}
+              onSelectionChange={handleSelectionChange}
+              emptyText={tableEmptyText}
             />
             
             {/* Compact Bulk Actions */}
@@ -828,10 +771,7 @@ export default function EnvironmentManagement() {
                         size="small"
                         icon={<StopOutlined />}
                         onClick={() => {
-                          const selectedEnvs = filteredEnvironments.filter(env => 
-                            selectedRowKeys.includes(env.env_id || env.id)
-                          );
-                          selectedEnvs.forEach(env => handleStop(env.env_id || env.id));
+                          getSelectedVisibleIds().forEach(envId => handleStop(envId));
                           setSelectedRowKeys([]);
                         }}
                         loading={stopMutation.isPending}
@@ -843,10 +783,7 @@ export default function EnvironmentManagement() {
                         size="small"
                         icon={<RedoOutlined />}
                         onClick={() => {
-                          const selectedEnvs = filteredEnvironments.filter(env => 
-                            selectedRowKeys.includes(env.env_id || env.id)
-                          );
-                          selectedEnvs.forEach(env => handleRestart(env.env_id || env.id));
+                          getSelectedVisibleIds().forEach(envId => handleRestart(envId));
                           setSelectedRowKeys([]);
                         }}
                         loading={restartMutation.isPending}
@@ -905,6 +842,53 @@ export default function EnvironmentManagement() {
 
 
 
+// Memoized so it only re-renders when its own inputs change
+interface EnvironmentsTableProps {
+  columns: ColumnsType<Environment>;
+  dataSource: Environment[];
+  loading: boolean;
+  selectedRowKeys: string[];
+  onSelectionChange: (keys: React.Key[]) => void;
+  emptyText: React.ReactNode;
+}
+
+const EnvironmentsTable = React.memo(function EnvironmentsTable({
+  columns,
+  dataSource,
+  loading,
+  selectedRowKeys,
+  onSelectionChange,
+  emptyText,
+}: EnvironmentsTableProps) {
+  return (
+    <Table
+      columns={columns}
+      dataSource={dataSource}
+      loading={loading}
+      size="small"
+      scroll={{ x: 'max-content' }}
+      pagination={{
+        pageSize: 10,
+        size: 'small',
+        showSizeChanger: false,
+        showQuickJumper: false,
+        showTotal: (total, range) =>
+          `${range[0]}-${range[1]} of ${total}`,
+      }}
+      rowSelection={{
+        selectedRowKeys,
+        onChange: onSelectionChange,
+        selections: [
+          Table.SELECTION_ALL,
+          Table.SELECTION_INVERT,
+          Table.SELECTION_NONE,
+        ],
+      }}
+      locale={{ emptyText }}
+    />
+  );
+});
+
 // Environment Details Modal Component
 interface EnvironmentDetailsModalProps {
   visible: boolean;
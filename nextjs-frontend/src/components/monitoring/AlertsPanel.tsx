@@ -3,24 +3,24 @@
 import React, { useMemo } from 'react';
 import {
   Card,
-  Alert,
+  Table,
   Typography,
   Space,
   Tag,
-  Button,
   Row,
   Col,
   Badge,
   Empty,
 } from 'antd';
+import type { ColumnsType } from 'antd/es/table';
 import {
   ExclamationCircleOutlined,
   WarningOutlined,
   InfoCircleOutlined,
   CheckCircleOutlined,
-  CloseOutlined,
   BellOutlined,
 } from '@ant-design/icons';
+import { parseTimestamp } from '@/lib/utils';
 import type { Environment } from '@/types';
 
 const { Title, Text } = Typography;
@@ -40,10 +40,102 @@ interface AlertItem {
   severity: 'high' | 'medium' | 'low';
 }
 
+const getAlertIcon = (type: string) => {
+  switch (type) {
+    case 'error':
+      return <ExclamationCircleOutlined className="text-red-500" />;
+    case 'warning':
+      return <WarningOutlined className="text-yellow-500" />;
+    case 'info':
+      return <InfoCircleOutlined className="text-blue-500" />;
+    case 'success':
+      return <CheckCircleOutlined className="text-green-500" />;
+    default:
+      return <InfoCircleOutlined />;
+  }
+};
+
+const getSeverityColor = (severity: string) => {
+  switch (severity) {
+    case 'high':
+      return 'red';
+    case 'medium':
+      return 'orange';
+    case 'low':
+      return 'blue';
+    default:
+      return 'default';
+  }
+};
+
+const formatTimestamp = (timestamp: Date) => {
+  return timestamp.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+};
+
+// Rendered as one virtualized table rather than a full Alert component per entry
+const ALERT_COLUMNS: ColumnsType<AlertItem> = [
+  {
+    key: 'type',
+    width: 40,
+    render: (_, alert) => getAlertIcon(alert.type),
+  },
+  {
+    title: 'Alert',
+    key: 'title',
+    render: (_, alert) => (
+      <Space direction="vertical" size={0}>
+        <Space>
+          <Text strong>{alert.title}</Text>
+          <Tag color={getSeverityColor(alert.severity)}>
+            {alert.severity.toUpperCase()}
+          </Tag>
+          <Tag>{alert.environmentName}</Tag>
+        </Space>
+        <Text type="secondary">{alert.message}</Text>
+      </Space>
+    ),
+  },
+  {
+    title: 'Time',
+    key: 'timestamp',
+    width: 90,
+    render: (_, alert) => (
+      <Text type="secondary" className="text-xs">
+        {formatTimestamp(alert.timestamp)}
+      </Text>
+    ),
+  },
+];
+
+// Mock usage is drawn once per environment per minute, so every environment poll
+// in between reuses the same numbers instead of re-rolling the alerts
+const MOCK_USAGE_TTL_MS = 60 * 1000;
+const mockUsageCache = new Map<string, { cpu: number; memory: number }>();
+let mockUsageBucket = -1;
+
+function getMockUsage(envId: string, now: number) {
+  const bucket = Math.floor(now / MOCK_USAGE_TTL_MS);
+  if (bucket !== mockUsageBucket) {
+    mockUsageCache.clear();
+    mockUsageBucket = bucket;
+  }
+
+  let usage = mockUsageCache.get(envId);
+  if (!usage) {
+    usage = {
+      cpu: Math.floor(Math.random() * 100),
+      memory: Math.floor(Math.random() * 100),
+    };
+    mockUsageCache.set(envId, usage);
+  }
+  return usage;
+}
+
 export default function AlertsPanel({ environments }: AlertsPanelProps) {
   // Generate alerts based on environment states
   const alerts = useMemo<AlertItem[]>(() => {
     const alertList: AlertItem[] = [];
+    const now = Date.now();
     
     environments.forEach((env) => {
       const envName = env.env_id?.substring(0, 8) || env.id?.substring(0, 8) || 'Unknown';
@@ -64,10 +156,7 @@ export default function AlertsPanel({ environments }: AlertsPanelProps) {
       
       // Long-running pending environments
       if (env.status === 'pending') {
-        const createdAt = new Date(env.created_at);
-        const now = new Date();
-        const timeDiff = now.getTime() - createdAt.getTime();
-        const minutesDiff = Math.floor(timeDiff / (1000 * 60));
+        const minutesDiff = Math.floor((now - parseTimestamp(env.created_at)) / (1000 * 60));
         
         if (minutesDiff > 10) {
           alertList.push({
@@ -85,8 +174,7 @@ export default function AlertsPanel({ environments }: AlertsPanelProps) {
       
       // Mock resource usage alerts (in real implementation, these would come from actual metrics)
       if (env.status === 'running') {
-        const mockCpuUsage = Math.floor(Math.random() * 100);
-        const mockMemoryUsage = Math.floor(Math.random() * 100);
+        const { cpu: mockCpuUsage, memory: mockMemoryUsage } = getMockUsage(env.id, now);
         
         if (mockCpuUsage > 90) {
           alertList.push({
@@ -117,9 +205,7 @@ export default function AlertsPanel({ environments }: AlertsPanelProps) {
       
       // Long-running environment info
       if (env.status === 'running') {
-        const createdAt = new Date(env.created_at);
-        const now = new Date();
-        const hoursDiff = Math.floor((now.getTime() - createdAt.getTime()) / (1000 * 60 * 60));
+        const hoursDiff = Math.floor((now - parseTimestamp(env.created_at)) / (1000 * 60 * 60));
         
         if (hoursDiff > 24) {
           alertList.push({
@@ -146,45 +232,16 @@ export default function AlertsPanel({ environments }: AlertsPanelProps) {
     });
   }, [environments]);
 
-  const getAlertIcon = (type: string) => {
-    switch (type) {
-      case 'error':
-        return <ExclamationCircleOutlined className="text-red-500" />;
-      case 'warning':
-        return <WarningOutlined className="text-yellow-500" />;
-      case 'info':
-        return <InfoCircleOutlined className="text-blue-500" />;
-      case 'success':
-        return <CheckCircleOutlined className="text-green-500" />;
-      default:
-        return <InfoCircleOutlined />;
+  // Alert statistics, counted in a single pass
+  const alertStats = useMemo(() => {
+    const stats = { total: alerts.length, error: 0, warning: 0, info: 0 };
+    for (const alert of alerts) {
+      if (alert.type === 'error') stats.error++;
+      else if (alert.type === 'warning') stats.warning++;
+      else if (alert.type === 'info') stats.info++;
     }
-  };
-
-  const getSeverityColor = (severity: string) => {
-    switch (severity) {
-      case 'high':
-        return 'red';
-      case 'medium':
-        return 'orange';
-      case 'low':
-        return 'blue';
-      default:
-        return 'default';
-    }
-  };
-
-  const formatTimestamp = (timestamp: Date) => {
-    return timestamp.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-  };
-
-  // Alert statistics
-  const alertStats = {
-    total: alerts.length,
-    error: alerts.filter(a => a.type === 'error').length,
-    warning: alerts.filter(a => a.type === 'warning').length,
-    info: alerts.filter(a => a.type === 'info').length,
-  };
+    return stats;
+  }, [alerts]);
 
   if (alerts.length === 0) {
     return (
@@ -239,43 +296,16 @@ export default function AlertsPanel({ environments }: AlertsPanelProps) {
         </Space>
       }
     >
-      <div className="space-y-4 max-h-96 overflow-y-auto">
-        {alerts.map((alert) => (
-          <Alert
-            key={alert.id}
-            type={alert.type}
-            showIcon
-            icon={getAlertIcon(alert.type)}
-            message={
-              <div className="flex justify-between items-start">
-                <div>
-                  <Space>
-                    <Text strong>{alert.title}</Text>
-                    <Tag color={getSeverityColor(alert.severity)}>
-                      {alert.severity.toUpperCase()}
-                    </Tag>
-                    <Tag>
-                      {alert.environmentName}
-                    </Tag>
-                  </Space>
-                </div>
-                <Text type="secondary" className="text-xs">
-                  {formatTimestamp(alert.timestamp)}
-                </Text>
-              </div>
-            }
-            description={alert.message}
-            action={
-              <Space>
-                <Button size="small" type="text" icon={<CloseOutlined />}>
-                  Dismiss
-                </Button>
-              </Space>
-            }
-            className="mb-2"
-          />
-        ))}
-      </div>
+      <Table
+        columns={ALERT_COLUMNS}
+        dataSource={alerts}
+        rowKey="id"
+        showHeader={false}
+        pagination={false}
+        size="small"
+        virtual
+        scroll={{ y: 384 }}
+      />
 
       {/* Alert Summary */}
       {alerts.length > 5 && (
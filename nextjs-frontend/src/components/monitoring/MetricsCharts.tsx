@@ -29,6 +29,96 @@ interface MetricsChartsProps {
   healthData?: any;
 }
 
+const CHART_HEIGHT = 300;
+
+const STATUS_COLORS = {
+  running: '#52c41a',
+  pending: '#faad14',
+  failed: '#ff4d4f',
+  stopped: '#8c8c8c',
+};
+
+interface SimpleLineChartProps {
+  data: any[];
+  dataKey: string;
+  color?: string;
+  label: string;
+  unit?: string;
+}
+
+// Simple SVG chart component; defined at module level and memoized so a parent
+// re-render with the same data doesn't rebuild the SVG
+const SimpleLineChart = React.memo(function SimpleLineChart({ 
+  data, 
+  dataKey, 
+  color = '#1890ff',
+  label,
+  unit = '%'
+}: SimpleLineChartProps) {
+  const { minValue, maxValue, avgValue, points } = useMemo(() => {
+    const values = data.map(d => d[dataKey]);
+    // Min, max and sum in one pass; spreading into Math.max/min also breaks on very long series
+    let min = Infinity;
+    let max = -Infinity;
+    let sum = 0;
+    for (const value of values) {
+      if (value < min) min = value;
+      if (value > max) max = value;
+      sum += value;
+    }
+    const range = max - min || 1;
+    const lastIndex = Math.max(data.length - 1, 1);
+
+    return {
+      minValue: min,
+      maxValue: max,
+      avgValue: Math.round(sum / data.length),
+      points: values.map((value, index) => {
+        const x = (index / lastIndex) * 100;
+        const y = 100 - ((value - min) / range) * 100;
+        return `${x},${y}`;
+      }).join(' '),
+    };
+  }, [data, dataKey]);
+
+  return (
+    <div className="space-y-2">
+      <div className="flex justify-between items-center">
+        <Text strong>{label}</Text>
+        <Tag color={color}>
+          {data[data.length - 1]?.[dataKey] || 0}{unit}
+        </Tag>
+      </div>
+      <div className="relative bg-gray-50 rounded p-2" style={{ height: CHART_HEIGHT / 4 }}>
+        <svg width="100%" height="100%" className="absolute inset-0">
+          <polyline
+            fill="none"
+            stroke={color}
+            strokeWidth="2"
+            points={points}
+            vectorEffect="non-scaling-stroke"
+          />
+          <defs>
+            <linearGradient id={`gradient-${dataKey}`} x1="0%" y1="0%" x2="0%" y2="100%">
+              <stop offset="0%" stopColor={color} stopOpacity="0.3" />
+              <stop offset="100%" stopColor={color} stopOpacity="0.1" />
+            </linearGradient>
+          </defs>
+          <polygon
+            fill={`url(#gradient-${dataKey})`}
+            points={`0,100 ${points} 100,100`}
+          />
+        </svg>
+      </div>
+      <div className="flex justify-between text-xs text-gray-500">
+        <span>Min: {minValue}{unit}</span>
+        <span>Max: {maxValue}{unit}</span>
+        <span>Avg: {avgValue}{unit}</span>
+      </div>
+    </div>
+  );
+});
+
 export default function MetricsCharts({ environments, timeRange, healthData }: MetricsChartsProps) {
 
   // Show message about real-time metrics
@@ -53,71 +143,12 @@ export default function MetricsCharts({ environments, timeRange, healthData }: M
     }];
   }, [healthData, environments, timeRange]);
 
-  const chartHeight = 300;
-
-  // Simple SVG chart component
-  const SimpleLineChart = ({ 
-    data, 
-    dataKey, 
-    color = '#1890ff',
-    label,
-    unit = '%'
-  }: {
-    data: any[];
-    dataKey: string;
-    color?: string;
-    label: string;
-    unit?: string;
-  }) => {
-    const maxValue = Math.max(...data.map(d => d[dataKey]));
-    const minValue = Math.min(...data.map(d => d[dataKey]));
-    const range = maxValue - minValue || 1;
+  const statusCounts = useMemo(() => environments.reduce((acc, env) => {
+    acc[env.status] = (acc[env.status] || 0) + 1;
+    return acc;
+  }, {} as Record<string, number>), [environments]);
 
-    const points = data.map((item, index) => {
-      const x = (index / (data.length - 1)) * 100;
-      const y = 100 - ((item[dataKey] - minValue) / range) * 100;
-      return `${x},${y}`;
-    }).join(' ');
-
-    return (
-      <div className="space-y-2">
-        <div className="flex justify-between items-center">
-          <Text strong>{label}</Text>
-          <Tag color={color}>
-            {data[data.length - 1]?.[dataKey] || 0}{unit}
-          </Tag>
-        </div>
-        <div className="relative bg-gray-50 rounded p-2" style={{ height: chartHeight / 4 }}>
-          <svg width="100%" height="100%" className="absolute inset-0">
-            <polyline
-              fill="none"
-              stroke={color}
-              strokeWidth="2"
-              points={points}
-              vectorEffect="non-scaling-stroke"
-            />
-            <defs>
-              <linearGradient id={`gradient-${dataKey}`} x1="0%" y1="0%" x2="0%" y2="100%">
-                <stop offset="0%" stopColor={color} stopOpacity="0.3" />
-                <stop offset="100%" stopColor={color} stopOpacity="0.1" />
-              </linearGradient>
-            </defs>
-            <polygon
-              fill={`url(#gradient-${dataKey})`}
-              points={`0,100 ${points} 100,100`}
-            />
-          </svg>
-        </div>
-        <div className="flex justify-between text-xs text-gray-500">
-          <span>Min: {minValue}{unit}</span>
-          <span>Max: {maxValue}{unit}</span>
-          <span>Avg: {Math.round(data.reduce((sum, item) => sum + item[dataKey], 0) / data.length)}{unit}</span>
-        </div>
-      </div>
-    );
-  };
-
-  const ResourceUsageChart = () => (
+  const resourceUsageChart = (
     <Card 
       title={
         <Space>
@@ -175,7 +206,7 @@ export default function MetricsCharts({ environments, timeRange, healthData }: M
     </Card>
   );
 
-  const NetworkChart = () => (
+  const networkChart = (
     <Card 
       title={
         <Space>
@@ -216,59 +247,45 @@ export default function MetricsCharts({ environments, timeRange, healthData }: M
     </Card>
   );
 
-  const EnvironmentDistribution = () => {
-    const statusCounts = environments.reduce((acc, env) => {
-      acc[env.status] = (acc[env.status] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>);
-
-    const statusColors = {
-      running: '#52c41a',
-      pending: '#faad14',
-      failed: '#ff4d4f',
-      stopped: '#8c8c8c',
-    };
-
-    return (
-      <Card 
-        title={
-          <Space>
-            <PieChartOutlined className="text-purple-500" />
-            Environment Distribution
-          </Space>
-        }
-      >
-        <div className="space-y-4">
-          {Object.entries(statusCounts).map(([status, count]) => {
-            const percentage = (count / environments.length) * 100;
-            return (
-              <div key={status} className="space-y-2">
-                <div className="flex justify-between items-center">
-                  <Space>
-                    <div 
-                      className="w-3 h-3 rounded-full"
-                      style={{ backgroundColor: statusColors[status as keyof typeof statusColors] }}
-                    />
-                    <Text className="capitalize">{status}</Text>
-                  </Space>
-                  <Text strong>{count} ({percentage.toFixed(1)}%)</Text>
-                </div>
-                <div className="w-full bg-gray-200 rounded-full h-2">
-                  <div
-                    className="h-2 rounded-full"
-                    style={{
-                      width: `${percentage}%`,
-                      backgroundColor: statusColors[status as keyof typeof statusColors]
-                    }}
+  const environmentDistribution = (
+    <Card 
+      title={
+        <Space>
+          <PieChartOutlined className="text-purple-500" />
+          Environment Distribution
+        </Space>
+      }
+    >
+      <div className="space-y-4">
+        {Object.entries(statusCounts).map(([status, count]) => {
+          const percentage = (count / environments.length) * 100;
+          return (
+            <div key={status} className="space-y-2">
+              <div className="flex justify-between items-center">
+                <Space>
+                  <div 
+                    className="w-3 h-3 rounded-full"
+                    style={{ backgroundColor: STATUS_COLORS[status as keyof typeof STATUS_COLORS] }}
                   />
-                </div>
+                  <Text className="capitalize">{status}</Text>
+                </Space>
+                <Text strong>{count} ({percentage.toFixed(1)}%)</Text>
               </div>
-            );
-          })}
-        </div>
-      </Card>
-    );
-  };
+              <div className="w-full bg-gray-200 rounded-full h-2">
+                <div
+                  className="h-2 rounded-full"
+                  style={{
+                    width: `${percentage}%`,
+                    backgroundColor: STATUS_COLORS[status as keyof typeof STATUS_COLORS]
+                  }}
+                />
+              </div>
+            </div>
+          );
+        })}
+      </div>
+    </Card>
+  );
 
   if (environments.length === 0) {
     return (
@@ -291,17 +308,17 @@ export default function MetricsCharts({ environments, timeRange, healthData }: M
   return (
     <div className="space-y-6">
       {/* Resource Usage Charts */}
-      <ResourceUsageChart />
+      {resourceUsageChart}
 
       <Row gutter={16}>
         {/* Network I/O */}
         <Col xs={24} lg={16}>
-          <NetworkChart />
+          {networkChart}
         </Col>
 
         {/* Environment Distribution */}
         <Col xs={24} lg={8}>
-          <EnvironmentDistribution />
+          {environmentDistribution}
         </Col>
       </Row>
 
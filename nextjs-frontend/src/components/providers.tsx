@@ -1,12 +1,29 @@
 'use client';
 
-import { SessionProvider } from 'next-auth/react';
-import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
-import { useState } from 'react';
+import { SessionProvider, useSession } from 'next-auth/react';
+import { QueryClient, QueryClientProvider, useQueryClient } from '@tanstack/react-query';
+import { useEffect, useRef, useState } from 'react';
 import { ThemeProvider } from '@/contexts/ThemeContext';
 import { NotificationProvider } from '@/contexts/NotificationContext';
 import { AdminProvider } from '@/contexts/AdminContext';
 
+// Query keys are not user-scoped, so drop every cached response when the signed-in user changes
+function UserScopedQueryCache() {
+  const { data: session } = useSession();
+  const queryClient = useQueryClient();
+  const userEmail = session?.user?.email ?? null;
+  const previousUser = useRef(userEmail);
+
+  useEffect(() => {
+    if (previousUser.current !== userEmail) {
+      queryClient.clear();
+      previousUser.current = userEmail;
+    }
+  }, [userEmail, queryClient]);
+
+  return null;
+}
+
 export function Providers({ children }: { children: React.ReactNode }) {
   const [queryClient] = useState(() => new QueryClient({
     defaultOptions: {
@@ -20,6 +37,7 @@ export function Providers({ children }: { children: React.ReactNode }) {
   return (
     <SessionProvider>
       <QueryClientProvider client={queryClient}>
+        <UserScopedQueryCache />
         <ThemeProvider>
           <NotificationProvider>
             <AdminProvider>
@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState } from 'react';
+import React, { useCallback, useMemo, useState } from 'react';
 import { 
   Card, 
   Table, 
@@ -34,6 +34,8 @@ import {
 } from '@ant-design/icons';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
+import { formatBytes, parseTimestamp } from '@/lib/utils';
 import { UserFile } from '@/types';
 import type { ColumnsType } from 'antd/es/table';
 import type { UploadFile } from 'antd/es/upload/interface';
@@ -42,6 +44,33 @@ const { Title, Paragraph, Text } = Typography;
 const { TextArea } = Input;
 const { Option } = Select;
 
+// Shell-safe environment variable names (mirrors the backend validator)
+const ENV_VAR_PATTERN = /^[A-Z_][A-Z0-9_]{0,63}$/;
+
+const PREVIEW_MAX_KEYS = 20;
+const PREVIEW_MAX_CHARS = 500;
+
+// Build a short preview from the first few top-level keys instead of pretty-printing the whole file
+const buildJsonPreview = (json: any): string => {
+  const source = json && typeof json === 'object' && !Array.isArray(json)
+    ? Object.fromEntries(Object.entries(json).slice(0, PREVIEW_MAX_KEYS))
+    : json;
+  const text = JSON.stringify(source, null, 2) ?? '';
+  return text.length > PREVIEW_MAX_CHARS ? `${text.substring(0, PREVIEW_MAX_CHARS)}...` : text;
+};
+
+const getFileTypeColor = (fileType: string) => {
+  switch (fileType) {
+    case 'custom_json': return 'blue';
+    case 'gcp_service_account': return 'green';
+    default: return 'default';
+  }
+};
+
+const getFileTypeIcon = (fileType: string) => {
+  return <FileOutlined />;
+};
+
 export default function EnvironmentFiles() {
   const [form] = Form.useForm();
   const [editForm] = Form.useForm();
@@ -57,7 +86,7 @@ export default function EnvironmentFiles() {
 
   // Fetch user files
   const { data: filesData, isLoading, error } = useQuery({
-    queryKey: ['userFiles'],
+    queryKey: queryKeys.userFiles,
     queryFn: async () => {
       const response = await apiClient.listUserFiles();
       // API returns array directly for user files
@@ -91,7 +120,7 @@ export default function EnvironmentFiles() {
       return response;
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['userFiles'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.userFiles });
       message.success('File uploaded successfully!');
       setIsModalVisible(false);
       form.resetFields();
@@ -132,7 +161,7 @@ export default function EnvironmentFiles() {
       return response;
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['userFiles'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.userFiles });
       message.success('File updated successfully!');
       setIsEditModalVisible(false);
       setEditingRecord(null);
@@ -150,7 +179,7 @@ export default function EnvironmentFiles() {
       return response;
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['userFiles'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.userFiles });
       message.success('File deleted successfully!');
     },
     onError: (error: Error) => {
@@ -185,7 +214,18 @@ export default function EnvironmentFiles() {
     },
   });
 
-  const files: UserFile[] = filesData || [];
+  const files: UserFile[] = useMemo(() => filesData || [], [filesData]);
+
+  // Index files by env var and container path for O(1) duplicate checks
+  const { filesByEnvVar, filesByContainerPath } = useMemo(() => {
+    const byEnvVar = new Map<string, UserFile>();
+    const byContainerPath = new Map<string, UserFile>();
+    for (const f of files) {
+      if (f.environment_variable_name) byEnvVar.set(f.environment_variable_name, f);
+      if (f.container_path) byContainerPath.set(f.container_path, f);
+    }
+    return { filesByEnvVar: byEnvVar, filesByContainerPath: byContainerPath };
+  }, [files]);
 
   // Filter files based on search
   const filteredFiles = files.filter(file =>
@@ -231,7 +271,7 @@ export default function EnvironmentFiles() {
          
           
           setIsGcpKey(isGcp);
-          setFilePreview(JSON.stringify(jsonContent, null, 2));
+          setFilePreview(buildJsonPreview(jsonContent));
           
           // Auto-update form if GCP key is detected
           if (isGcp) {
@@ -289,8 +329,13 @@ export default function EnvironmentFiles() {
       return;
     }
     
+    if (!ENV_VAR_PATTERN.test(trimmedEnvVar)) {
+      message.error('Environment variable name must use A-Z, 0-9 and _ and not start with a digit');
+      return;
+    }
+    
     // Check for duplicate environment variable names
-    const existingEnvVar = files.find(f => f.environment_variable_name === trimmedEnvVar);
+    const existingEnvVar = filesByEnvVar.get(trimmedEnvVar);
     if (existingEnvVar) {
       console.error('Duplicate environment variable:', trimmedEnvVar);
       message.error(`Environment variable "${trimmedEnvVar}" already exists for file "${existingEnvVar.file_name}"`);
@@ -309,7 +354,7 @@ export default function EnvironmentFiles() {
 
     // Check for duplicate container paths
     if (finalContainerPath) {
-      const existingPath = files.find(f => f.container_path === finalContainerPath);
+      const existingPath = filesByContainerPath.get(finalContainerPath);
       if (existingPath) {
         console.error('Duplicate container path:', finalContainerPath);
         message.error(`Container path "${finalContainerPath}" already exists for file "${existingPath.file_name}"`);
@@ -329,14 +374,14 @@ export default function EnvironmentFiles() {
     uploadMutation.mutate(uploadData);
   };
 
-  const handleEdit = (record: UserFile) => {
+  const handleEdit = useCallback((record: UserFile) => {
     setEditingRecord(record);
     editForm.setFieldsValue({
       environment_variable_name: record.environment_variable_name,
       container_path: record.container_path,
     });
     setIsEditModalVisible(true);
-  };
+  }, [editForm]);
 
   const handleUpdate = (values: {
     environment_variable_name?: string;
@@ -346,12 +391,14 @@ export default function EnvironmentFiles() {
 
     const trimmedEnvVar = values.environment_variable_name?.trim();
     
-    // Check for duplicate environment variable names (excluding current file)
-    if (trimmedEnvVar) {
-      const existingEnvVar = files.find(f => 
-        f.environment_variable_name === trimmedEnvVar && f.id !== editingRecord.id
-      );
-      if (existingEnvVar) {
+    // Only a changed name is validated, so files saved under older, looser names stay editable
+    if (trimmedEnvVar && trimmedEnvVar !== editingRecord.environment_variable_name) {
+      if (!ENV_VAR_PATTERN.test(trimmedEnvVar)) {
+        message.error('Environment variable name must use A-Z, 0-9 and _ and not start with a digit');
+        return;
+      }
+      const existingEnvVar = filesByEnvVar.get(trimmedEnvVar);
+      if (existingEnvVar && existingEnvVar.id !== editingRecord.id) {
         message.error(`Environment variable "${trimmedEnvVar}" already exists for file "${existingEnvVar.file_name}"`);
         return;
       }
@@ -359,10 +406,8 @@ export default function EnvironmentFiles() {
 
     // Check for duplicate container paths (excluding current file)
     if (values.container_path?.trim()) {
-      const existingPath = files.find(f => 
-        f.container_path === values.container_path && f.id !== editingRecord.id
-      );
-      if (existingPath) {
+      const existingPath = filesByContainerPath.get(values.container_path);
+      if (existingPath && existingPath.id !== editingRecord.id) {
         message.error(`Container path "${values.container_path}" already exists for file "${existingPath.file_name}"`);
         return;
       }
@@ -375,35 +420,7 @@ export default function EnvironmentFiles() {
     });
   };
 
-  const handleDelete = (fileId: string) => {
-    deleteMutation.mutate(fileId);
-  };
-
-  const handleDownload = (fileId: string) => {
-    downloadMutation.mutate(fileId);
-  };
-
-  const getFileTypeColor = (fileType: string) => {
-    switch (fileType) {
-      case 'custom_json': return 'blue';
-      case 'gcp_service_account': return 'green';
-      default: return 'default';
-    }
-  };
-
-  const getFileTypeIcon = (fileType: string) => {
-    return <FileOutlined />;
-  };
-
-  const formatFileSize = (bytes: number) => {
-    if (bytes === 0) return '0 B';
-    const k = 1024;
-    const sizes = ['B', 'KB', 'MB', 'GB'];
-    const i = Math.floor(Math.log(bytes) / Math.log(k));
-    return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-  };
-
-  const columns: ColumnsType<UserFile> = [
+  const columns: ColumnsType<UserFile> = useMemo(() => [
     {
       title: 'File Name',
       dataIndex: 'file_name',
@@ -432,27 +449,17 @@ export default function EnvironmentFiles() {
       onFilter: (value, record) => record.file_type === value,
     },
     {
-      title: 'Environment Variable',
-      dataIndex: 'environment_variable_name',
-      key: 'environment_variable_name',
-      render: (name) => name ? (
-        <Text code style={{ color: 'var(--success-600)', fontFamily: 'monospace', fontSize: '12px' }}>
-          {name}
-        </Text>
-      ) : (
-        <Text style={{ color: 'var(--text-secondary)', fontStyle: 'italic' }}>Not set</Text>
-      ),
-    },
-    {
-      title: 'Container Path',
-      dataIndex: 'container_path',
-      key: 'container_path',
-      render: (path) => path ? (
-        <Text code style={{ color: 'var(--warning-600)', fontFamily: 'monospace', fontSize: '12px' }}>
-          {path}
-        </Text>
-      ) : (
-        <Text style={{ color: 'var(--text-secondary)', fontStyle: 'italic' }}>Default</Text>
+      title: 'Mount',
+      key: 'mount',
+      render: (_, record) => (
+        <div style={{ fontFamily: 'monospace', fontSize: '12px', lineHeight: 1.6 }}>
+          <div style={{ color: record.environment_variable_name ? 'var(--success-600)' : 'var(--text-secondary)' }}>
+            {record.environment_variable_name || <i>Env var not set</i>}
+          </div>
+          <div style={{ color: record.container_path ? 'var(--warning-600)' : 'var(--text-secondary)' }}>
+            {record.container_path || <i>Default path</i>}
+          </div>
+        </div>
       ),
     },
     {
@@ -461,7 +468,7 @@ export default function EnvironmentFiles() {
       key: 'file_size',
       render: (size) => (
         <Text style={{ color: 'var(--text-secondary)' }}>
-          {formatFileSize(size)}
+          {formatBytes(size)}
         </Text>
       ),
       sorter: (a, b) => a.file_size - b.file_size,
@@ -475,7 +482,7 @@ export default function EnvironmentFiles() {
           {new Date(date).toLocaleDateString()}
         </Text>
       ),
-      sorter: (a, b) => new Date(a.created_at).getTime() - new Date(b.created_at).getTime(),
+      sorter: (a, b) => parseTimestamp(a.created_at) - parseTimestamp(b.created_at),
     },
     {
       title: 'Actions',
@@ -487,7 +494,7 @@ export default function EnvironmentFiles() {
               type="text"
               size="small"
               icon={<DownloadOutlined />}
-              onClick={() => handleDownload(record.id)}
+              onClick={() => downloadMutation.mutate(record.id)}
               loading={downloadMutation.isPending}
             />
           </Tooltip>
@@ -502,7 +509,7 @@ export default function EnvironmentFiles() {
           <Popconfirm
             title="Delete file"
             description={`Are you sure you want to delete "${record.file_name}"?`}
-            onConfirm={() => handleDelete(record.id)}
+            onConfirm={() => deleteMutation.mutate(record.id)}
             okText="Delete"
             cancelText="Cancel"
             okButtonProps={{ danger: true }}
@@ -517,9 +524,12 @@ export default function EnvironmentFiles() {
         </Space>
       ),
     },
-  ];
+  ], [downloadMutation.isPending, downloadMutation.mutate, deleteMutation.mutate, handleEdit]);
 
-  const totalSize = files.reduce((sum, file) => sum + file.file_size, 0);
+  const { totalSize, fileTypeCount } = useMemo(() => ({
+    totalSize: files.reduce((sum, file) => sum + file.file_size, 0),
+    fileTypeCount: new Set(files.map(f => f.file_type)).size,
+  }), [files]);
 
   return (
     <div className="space-y-4">
@@ -570,7 +580,7 @@ export default function EnvironmentFiles() {
               <UploadOutlined style={{ fontSize: '24px' }} />
             </div>
             <Title level={2} style={{ margin: 0, color: 'var(--success-600)' }}>
-              {formatFileSize(totalSize)}
+              {formatBytes(totalSize)}
             </Title>
             <Text style={{ color: 'var(--text-secondary)' }}>Total Size</Text>
           </Card>
@@ -582,7 +592,7 @@ export default function EnvironmentFiles() {
               <InfoCircleOutlined style={{ fontSize: '24px' }} />
             </div>
             <Title level={2} style={{ margin: 0, color: 'var(--warning-600)' }}>
-              {Array.from(new Set(files.map(f => f.file_type))).length}
+              {fileTypeCount}
             </Title>
             <Text style={{ color: 'var(--text-secondary)' }}>File Types</Text>
           </Card>
@@ -686,7 +696,7 @@ export default function EnvironmentFiles() {
                   maxHeight: '128px', 
                   color: 'var(--text-secondary)' 
                 }}>
-                  {filePreview.substring(0, 500)}{filePreview.length > 500 ? '...' : ''}
+                  {filePreview}
                 </pre>
               </div>
             )}
@@ -778,7 +788,7 @@ export default function EnvironmentFiles() {
               <br />
               <Text style={{ color: 'var(--text-secondary)', fontSize: '14px' }}>
                 Type: {editingRecord.file_type.toUpperCase()} • 
-                Size: {formatFileSize(editingRecord.file_size)}
+                Size: {formatBytes(editingRecord.file_size)}
               </Text>
             </div>
           )}
@@ -29,6 +29,7 @@ import {
 } from '@ant-design/icons';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
 import type { ColumnsType } from 'antd/es/table';
 
 const { Title, Text } = Typography;
@@ -50,7 +51,7 @@ export default function EnvironmentVariables() {
 
   // Fetch environment variables
   const { data: envVarsData, isLoading } = useQuery({
-    queryKey: ['userEnvVars'],
+    queryKey: queryKeys.userEnvVars,
     queryFn: async () => {
       const response = await apiClient.getUserEnvVars();
       if (response.status === 'error') {
@@ -73,7 +74,7 @@ export default function EnvironmentVariables() {
       return response;
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['userEnvVars'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.userEnvVars });
       message.success(`Environment variable ${editingRecord ? 'updated' : 'added'} successfully!`);
       setIsModalVisible(false);
       setEditingRecord(null);
@@ -94,7 +95,7 @@ export default function EnvironmentVariables() {
       return response;
     },
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['userEnvVars'] });
+      queryClient.invalidateQueries({ queryKey: queryKeys.userEnvVars });
       message.success('Environment variable deleted successfully!');
     },
     onError: (error: Error) => {
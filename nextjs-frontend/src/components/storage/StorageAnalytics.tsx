@@ -21,6 +21,7 @@ import {
   TrophyOutlined,
 } from '@ant-design/icons';
 import type { StorageItem } from '@/types';
+import { formatBytes } from '@/lib/utils';
 
 const { Title, Text } = Typography;
 
@@ -71,14 +72,6 @@ export default function StorageAnalytics({ storages }: StorageAnalyticsProps) {
     };
   }, [storages]);
 
-  const formatStorageSize = (bytes: number): string => {
-    if (bytes === 0) return '0 B';
-    const k = 1024;
-    const sizes = ['B', 'KB', 'MB', 'GB', 'TB'];
-    const i = Math.floor(Math.log(bytes) / Math.log(k));
-    return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
-  };
-
   const storageClassColors = {
     standard: '#1890ff',
     nearline: '#52c41a', 
@@ -135,7 +128,7 @@ export default function StorageAnalytics({ storages }: StorageAnalyticsProps) {
           <Col xs={24} sm={12} md={6}>
             <Statistic
               title="Total Storage Used"
-              value={formatStorageSize(analytics.totalSize)}
+              value={formatBytes(analytics.totalSize, 1)}
               prefix={<FileOutlined />}
               valueStyle={{ color: '#722ed1' }}
             />
@@ -170,7 +163,7 @@ export default function StorageAnalytics({ storages }: StorageAnalyticsProps) {
                           {count} workspace{count !== 1 ? 's' : ''}
                         </Tag>
                       </Space>
-                      <Text type="secondary">{formatStorageSize(sizeForClass)}</Text>
+                      <Text type="secondary">{formatBytes(sizeForClass, 1)}</Text>
                     </div>
                     <Progress
                       percent={percentage}
@@ -218,7 +211,7 @@ export default function StorageAnalytics({ storages }: StorageAnalyticsProps) {
                       {analytics.largestWorkspace.display_name || 'Unknown'}
                     </Text>
                     <Text type="secondary" className="text-sm">
-                      {formatStorageSize(analytics.largestWorkspace.size_bytes || 0)}
+                      {formatBytes(analytics.largestWorkspace.size_bytes || 0, 1)}
                     </Text>
                   </div>
                 </div>
@@ -245,7 +238,7 @@ export default function StorageAnalytics({ storages }: StorageAnalyticsProps) {
               <div>
                 <div className="flex justify-between items-center">
                   <Text strong>Average Workspace Size</Text>
-                  <Text>{formatStorageSize(analytics.totalSize / Math.max(analytics.totalStorages, 1))}</Text>
+                  <Text>{formatBytes(analytics.totalSize / Math.max(analytics.totalStorages, 1), 1)}</Text>
                 </div>
               </div>
 
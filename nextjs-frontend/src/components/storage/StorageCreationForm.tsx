@@ -25,6 +25,7 @@ import {
 } from '@ant-design/icons';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
 
 const { Title, Text, Paragraph } = Typography;
 const { Option } = Select;
@@ -61,7 +62,7 @@ export default function StorageCreationForm({ visible, onClose, onSuccess }: Sto
     onSuccess: (response) => {
       if (response.status === 'created') {
         message.success('Workspace created successfully!');
-        queryClient.invalidateQueries({ queryKey: ['user-storages'] });
+        queryClient.invalidateQueries({ queryKey: queryKeys.userStorages });
         onSuccess();
         handleReset();
       } else {
@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback, useDeferredValue, useRef } from 'react';
 import {
   Table,
   Button,
@@ -11,6 +11,7 @@ import {
   Modal,
   Typography,
   Progress,
+  Spin,
   Card,
   Row,
   Col,
@@ -45,13 +46,55 @@ import {
 } from '@ant-design/icons';
 import type { ColumnsType } from 'antd/es/table';
 import type { UploadFile, UploadProps } from 'antd/es/upload';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
+import { formatBytes, formatDateTime } from '@/lib/utils';
 
 const { Title, Text } = Typography;
 const { Dragger } = Upload;
 const { Search } = Input;
 
+// Upper bound on parallel uploads from the file manager
+const MAX_CONCURRENT_UPLOADS = Number(process.env.NEXT_PUBLIC_MAX_CONCURRENT_UPLOADS) || 4;
+// Objects requested per listing page
+const LIST_PAGE_SIZE = 500;
+
+// Images small enough to fetch ahead of time for the preview modal
+const PREVIEW_MAX_BYTES = 5 * 1024 * 1024;
+const PREVIEW_STALE_TIME = 5 * 60 * 1000;
+const PREVIEWABLE_IMAGE_RE = /\.(jpe?g|png|gif|webp)$/i;
+// Hover prefetch is limited to small images, only after the cursor settles, with few requests in flight
+const PREFETCH_MAX_BYTES = 1024 * 1024;
+const PREFETCH_HOVER_DELAY_MS = 200;
+const MAX_CONCURRENT_PREFETCHES = 2;
+
+// Extension -> icon lookup built once at module load
+const FILE_ICON_GROUPS: Array<[string[], React.ReactNode]> = [
+  [['pdf'], <FilePdfOutlined key="pdf" style={{ color: 'var(--error-600)' }} />],
+  [['doc', 'docx'], <FileWordOutlined key="word" style={{ color: 'var(--primary-600)' }} />],
+  [['xls', 'xlsx'], <FileExcelOutlined key="excel" style={{ color: 'var(--success-600)' }} />],
+  [['ppt', 'pptx'], <FilePptOutlined key="ppt" style={{ color: 'var(--warning-600)' }} />],
+  [['txt', 'md', 'readme'], <FileTextOutlined key="text" style={{ color: 'var(--text-primary)' }} />],
+  [['js', 'ts', 'py', 'json', 'html', 'css', 'jsx', 'tsx'], <CodeOutlined key="code" style={{ color: 'var(--purple-600)' }} />],
+  [['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg'], <FileImageOutlined key="image" style={{ color: 'var(--success-600)' }} />],
+  [['zip', 'rar', 'tar', 'gz', '7z'], <FileZipOutlined key="zip" style={{ color: 'var(--warning-600)' }} />],
+  [['mp4', 'avi', 'mov', 'mkv', 'webm'], <PlayCircleOutlined key="video" style={{ color: 'var(--error-600)' }} />],
+  [['mp3', 'wav', 'flac', 'aac'], <AudioOutlined key="audio" style={{ color: 'var(--primary-600)' }} />],
+];
+
+const FILE_ICONS = new Map<string, React.ReactNode>(
+  FILE_ICON_GROUPS.flatMap(([exts, icon]) => exts.map(ext => [ext, icon] as [string, React.ReactNode]))
+);
+const FOLDER_ICON = <FolderOutlined style={{ color: 'var(--primary-600)' }} />;
+const DEFAULT_FILE_ICON = <FileOutlined style={{ color: 'var(--text-secondary)' }} />;
+
+const getFileIcon = (fileName: string, isFolder?: boolean) => {
+  if (isFolder) return FOLDER_ICON;
+  const ext = fileName.split('.').pop()?.toLowerCase() || '';
+  return FILE_ICONS.get(ext) ?? DEFAULT_FILE_ICON;
+};
+
 interface FileObject {
   name: string;
   size: number;
@@ -60,6 +103,34 @@ interface FileObject {
   isFolder?: boolean;
 }
 
+// Display fields derived once per listing rather than inside every cell render
+interface FileRow extends FileObject {
+  baseName: string;
+  folderPath: string;
+  nameLower: string;
+  sizeLabel: string;
+  createdMs: number;
+  createdLabel: string;
+}
+
+const toFileRow = (file: FileObject): FileRow => {
+  const name = file.name || '';
+  const slash = name.lastIndexOf('/');
+  const createdMs = file.created ? new Date(file.created).getTime() : 0;
+  return {
+    ...file,
+    baseName: name.substring(slash + 1),
+    folderPath: slash >= 0 ? name.substring(0, slash + 1) : '',
+    nameLower: name.toLowerCase(),
+    sizeLabel: file.isFolder ? '-' : formatBytes(file.size),
+    createdMs: Number.isNaN(createdMs) ? 0 : createdMs,
+    createdLabel: file.created ? formatDateTime(file.created) : 'Unknown',
+  };
+};
+
+const isPreviewableImage = (file: FileObject) =>
+  !file.isFolder && file.size <= PREVIEW_MAX_BYTES && PREVIEWABLE_IMAGE_RE.test(file.name);
+
 interface StorageFileManagerProps {
   storageId: string;
   storageName: string;
@@ -71,46 +142,81 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
   const [searchTerm, setSearchTerm] = useState('');
   const [uploadVisible, setUploadVisible] = useState(false);
   const [uploadFiles, setUploadFiles] = useState<UploadFile[]>([]);
-  const [uploadProgress, setUploadProgress] = useState<Record<string, number>>({});
-  const [previewFile, setPreviewFile] = useState<FileObject | null>(null);
+  // Aggregate batch counters instead of per-file state
+  const [uploadProgress, setUploadProgress] = useState({ completed: 0, total: 0, bytesLoaded: 0, bytesTotal: 0 });
+  const [previewFile, setPreviewFile] = useState<FileRow | null>(null);
+  const [isUploading, setIsUploading] = useState(false);
   const queryClient = useQueryClient();
 
   // Fetch files for current storage and path
-  const { data: filesData, isLoading, refetch } = useQuery({
-    queryKey: ['storage-files', storageId, currentPath],
-    queryFn: () => apiClient.listStorageFiles(storageId, currentPath),
+  // Fetched a page at a time so huge buckets don't have to be listed in one response
+  const {
+    data: filesData,
+    isLoading,
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: queryKeys.storageFilesAt(storageId, currentPath),
+    queryFn: ({ pageParam }) =>
+      apiClient.listStorageFiles(storageId, currentPath, { limit: LIST_PAGE_SIZE, pageToken: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage: any) => lastPage?.next_page_token || undefined,
     enabled: !!storageId,
+    staleTime: 60 * 1000, // Listing is invalidated explicitly after uploads/deletes
   });
 
-  const files: FileObject[] = filesData?.objects || [];
+  // Drop cached listings for every path in this storage after a change, along with any
+  // cached file contents, which an upload may have overwritten
+  const invalidateFiles = () => {
+    queryClient.removeQueries({ queryKey: queryKeys.storageFileBlobs(storageId) });
+    return queryClient.invalidateQueries({ queryKey: queryKeys.storageFiles(storageId) });
+  };
+
+  // Drop unnamed and zero-size entries and precompute display fields once per listing
+  const files: FileRow[] = useMemo(
+    () => ((filesData?.pages.flatMap((page: any) => page?.objects || []) || []) as FileObject[])
+      .filter(file => !!file.name?.trim() && file.size !== 0)
+      .map(toFileRow),
+    [filesData]
+  );
 
-  // Filter files based on search term and exclude empty files
-  const filteredFiles = files.filter(file => {
-    // Filter out files with no name or no data
-    if (!file.name || file.name.trim() === '' || file.size === 0) {
-      return false;
+  // Filter files based on search term; deferred so typing stays responsive on large listings
+  const deferredSearchTerm = useDeferredValue(searchTerm);
+  const filteredFiles = useMemo(() => {
+    const needle = deferredSearchTerm.toLowerCase();
+    return needle ? files.filter(file => file.nameLower.includes(needle)) : files;
+  }, [files, deferredSearchTerm]);
+
+  // The listing API only filters by prefix, so a search has to see every page of the bucket;
+  // load the rest one page at a time while a search term is set
+  useEffect(() => {
+    if (deferredSearchTerm && hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
     }
-    
-    // Apply search filter
-    return file.name.toLowerCase().includes(searchTerm.toLowerCase());
-  });
-
-  // Upload mutation
-  const uploadMutation = useMutation({
-    mutationFn: async ({ file, path }: { file: File; path: string }) => {
-      console.log('Starting upload for file:', file.name, 'to path:', path);
-      const result = await apiClient.uploadFileToStorage(storageId, file, path);
-      console.log('Upload API result:', result);
-      return result;
-    },
-    onSuccess: (data, variables) => {
-      console.log(`File ${variables.file.name} uploaded successfully:`, data);
-      // Trigger refetch after successful upload
-      refetch();
+  }, [deferredSearchTerm, hasNextPage, isFetchingNextPage, fetchNextPage]);
+
+  // Bulk delete mutation - one request for the whole selection
+  const bulkDeleteMutation = useMutation({
+    mutationFn: (fileNames: string[]) =>
+      apiClient.deleteFilesFromStorage(storageId, fileNames),
+    onSuccess: (result: any) => {
+      const deletedCount = result?.deleted?.length ?? 0;
+      const failed: string[] = result?.failed ?? [];
+      if (deletedCount > 0) {
+        message.success(`${deletedCount} file(s) deleted successfully`);
+      }
+      if (failed.length > 0) {
+        message.error(`Failed to delete ${failed.length} file(s): ${failed.join(', ')}`);
+      } else if (result?.error) {
+        message.error(`Delete failed: ${result.error}`);
+      }
+      invalidateFiles();
+      setSelectedFiles([]);
     },
-    onError: (error: any, variables) => {
-      console.error(`File ${variables.file.name} upload failed:`, error);
-      message.error(`Failed to upload ${variables.file.name}: ${error.message || 'Unknown error'}`);
+    onError: (error: any) => {
+      message.error(`Delete failed: ${error.message}`);
     },
   });
 
@@ -120,7 +226,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
       apiClient.deleteFileFromStorage(storageId, fileName),
     onSuccess: () => {
       message.success('File deleted successfully');
-      refetch();
+      invalidateFiles();
       setSelectedFiles([]);
     },
     onError: (error: any) => {
@@ -128,104 +234,63 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
     },
   });
 
-  const formatFileSize = (bytes: number): string => {
-    if (bytes === 0) return '0 B';
-    const k = 1024;
-    const sizes = ['B', 'KB', 'MB', 'GB', 'TB'];
-    const i = Math.floor(Math.log(bytes) / Math.log(k));
-    return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-  };
 
-  const formatDate = (dateString: string): string => {
-    if (!dateString) return 'Unknown';
-    try {
-      const date = new Date(dateString);
-      return date.toLocaleDateString() + ' ' + date.toLocaleTimeString();
-    } catch {
-      return dateString;
-    }
-  };
-
-  const getFileIcon = (fileName: string, isFolder?: boolean) => {
-    if (isFolder) return <FolderOutlined style={{ color: 'var(--primary-600)' }} />;
-    
-    const ext = fileName.split('.').pop()?.toLowerCase();
+  const fetchFileBlob = useCallback(async (fileName: string): Promise<Blob> => {
+    // fileName already includes the full object path from the API
+    const response = await apiClient.downloadFileFromStorage(storageId, fileName);
     
-    // Document files
-    if (['pdf'].includes(ext || '')) {
-      return <FilePdfOutlined style={{ color: 'var(--error-600)' }} />;
-    }
-    if (['doc', 'docx'].includes(ext || '')) {
-      return <FileWordOutlined style={{ color: 'var(--primary-600)' }} />;
-    }
-    if (['xls', 'xlsx'].includes(ext || '')) {
-      return <FileExcelOutlined style={{ color: 'var(--success-600)' }} />;
-    }
-    if (['ppt', 'pptx'].includes(ext || '')) {
-      return <FilePptOutlined style={{ color: 'var(--warning-600)' }} />;
-    }
-    if (['txt', 'md', 'readme'].includes(ext || '')) {
-      return <FileTextOutlined style={{ color: 'var(--text-primary)' }} />;
-    }
-    
-    // Code files
-    if (['js', 'ts', 'py', 'json', 'html', 'css', 'jsx', 'tsx'].includes(ext || '')) {
-      return <CodeOutlined style={{ color: 'var(--purple-600)' }} />;
-    }
-    
-    // Image files
-    if (['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg'].includes(ext || '')) {
-      return <FileImageOutlined style={{ color: 'var(--success-600)' }} />;
-    }
-    
-    // Archive files
-    if (['zip', 'rar', 'tar', 'gz', '7z'].includes(ext || '')) {
-      return <FileZipOutlined style={{ color: 'var(--warning-600)' }} />;
+    // Check if response is successful (axios response)
+    if (response.status !== 200) {
+      throw new Error(`Download failed with status: ${response.status}`);
     }
     
-    // Video files
-    if (['mp4', 'avi', 'mov', 'mkv', 'webm'].includes(ext || '')) {
-      return <PlayCircleOutlined style={{ color: 'var(--error-600)' }} />;
-    }
-    
-    // Audio files
-    if (['mp3', 'wav', 'flac', 'aac'].includes(ext || '')) {
-      return <AudioOutlined style={{ color: 'var(--primary-600)' }} />;
-    }
-    
-    // Default file icon
-    return <FileOutlined style={{ color: 'var(--text-secondary)' }} />;
-  };
+    // response.data is the blob for axios with responseType: 'blob'
+    return response.data;
+  }, [storageId]);
 
-  const handleFileDoubleClick = (file: FileObject) => {
-    if (file.isFolder) {
-      const newPath = currentPath ? `${currentPath}/${file.name}` : file.name;
-      setCurrentPath(newPath);
-    } else {
-      handleDownload(file.name);
-    }
-  };
+  // Warm the cache for small images the cursor rests on so preview and download open instantly;
+  // sweeping across the list only restarts the timer instead of firing a download per row
+  const prefetchTimer = useRef<ReturnType<typeof setTimeout>>();
+  const prefetchesInFlight = useRef(0);
 
-  const handleDownload = async (fileName: string) => {
-    try {
-      console.log('Downloading file:', fileName);
-      console.log('Storage ID:', storageId);
-      console.log('Current path:', currentPath);
-      
-      // Use fileName as is, since it already includes the full path from the API
-      const fullPath = fileName;
-      console.log('Full file path:', fullPath);
-      
-      const response = await apiClient.downloadFileFromStorage(storageId, fullPath);
-      console.log('Download response:', response);
-      
-      // Check if response is successful (axios response)
-      if (response.status !== 200) {
-        throw new Error(`Download failed with status: ${response.status}`);
+  const cancelPrefetch = useCallback(() => clearTimeout(prefetchTimer.current), []);
+
+  const prefetchPreview = useCallback((file: FileRow) => {
+    cancelPrefetch();
+    if (!isPreviewableImage(file) || file.size > PREFETCH_MAX_BYTES) return;
+
+    prefetchTimer.current = setTimeout(async () => {
+      const queryKey = queryKeys.storageFileBlob(storageId, file.name);
+      if (prefetchesInFlight.current >= MAX_CONCURRENT_PREFETCHES || queryClient.getQueryData(queryKey)) {
+        return;
       }
-      
-      // response.data is the blob for axios with responseType: 'blob'
-      const blob = response.data;
+      prefetchesInFlight.current++;
+      try {
+        await queryClient.prefetchQuery({
+          queryKey,
+          queryFn: () => fetchFileBlob(file.name),
+          staleTime: PREVIEW_STALE_TIME,
+        });
+      } finally {
+        prefetchesInFlight.current--;
+      }
+    }, PREFETCH_HOVER_DELAY_MS);
+  }, [queryClient, storageId, fetchFileBlob, cancelPrefetch]);
+
+  useEffect(() => cancelPrefetch, [cancelPrefetch]);
+
+  const handleDownload = useCallback(async (file: FileObject) => {
+    const fileName = file.name;
+    try {
+      // Previewable images go through the shared cache (reusing a fresh prefetch); other files
+      // are fetched directly so large downloads aren't held in memory afterwards
+      const blob = isPreviewableImage(file)
+        ? await queryClient.fetchQuery({
+            queryKey: queryKeys.storageFileBlob(storageId, fileName),
+            queryFn: () => fetchFileBlob(fileName),
+            staleTime: PREVIEW_STALE_TIME,
+          })
+        : await fetchFileBlob(fileName);
       
       // Verify blob has content
       if (!blob || blob.size === 0) {
@@ -255,17 +320,46 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
         message.error('Download failed: ' + (error instanceof Error ? error.message : 'Unknown error'));
       }
     }
-  };
+  }, [queryClient, storageId, fetchFileBlob]);
+
+  const isImagePreview = !!previewFile && isPreviewableImage(previewFile);
+  const { data: previewBlob, isFetching: isPreviewLoading } = useQuery({
+    queryKey: queryKeys.storageFileBlob(storageId, previewFile?.name ?? ''),
+    queryFn: () => fetchFileBlob(previewFile!.name),
+    enabled: isImagePreview,
+    staleTime: PREVIEW_STALE_TIME,
+  });
+
+  const [previewUrl, setPreviewUrl] = useState<string | null>(null);
+  useEffect(() => {
+    if (!isImagePreview || !previewBlob) {
+      setPreviewUrl(null);
+      return;
+    }
+    const url = URL.createObjectURL(previewBlob);
+    setPreviewUrl(url);
+    return () => URL.revokeObjectURL(url);
+  }, [isImagePreview, previewBlob]);
+
+  const handleFileDoubleClick = useCallback((file: FileObject) => {
+    if (file.isFolder) {
+      const newPath = currentPath ? `${currentPath}/${file.name}` : file.name;
+      setCurrentPath(newPath);
+    } else {
+      handleDownload(file);
+    }
+  }, [currentPath, handleDownload]);
 
-  const handleDelete = (fileName: string) => {
+  const { mutate: deleteFile } = deleteMutation;
+  const handleDelete = useCallback((file: FileRow) => {
     Modal.confirm({
       title: 'Delete File',
-      content: `Are you sure you want to delete "${fileName.split('/').pop()}"?`,
+      content: `Are you sure you want to delete "${file.baseName}"?`,
       okText: 'Delete',
       okType: 'danger',
-      onOk: () => deleteMutation.mutate(fileName),
+      onOk: () => deleteFile(file.name),
     });
-  };
+  }, [deleteFile]);
 
   const handleBulkDelete = () => {
     if (selectedFiles.length === 0) return;
@@ -275,24 +369,13 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
       content: `Are you sure you want to delete ${selectedFiles.length} file(s)?`,
       okText: 'Delete',
       okType: 'danger',
-      onOk: async () => {
-        for (const fileName of selectedFiles) {
-          await deleteMutation.mutateAsync(fileName);
-        }
-      },
+      onOk: () => bulkDeleteMutation.mutateAsync(selectedFiles),
     });
   };
 
   const uploadProps: UploadProps = {
     multiple: true,
-    beforeUpload: (file, fileList) => {
-      console.log('beforeUpload called with file:', {
-        name: file.name,
-        size: file.size,
-        type: file.type,
-        uid: file.uid || `upload-${Date.now()}-${Math.random()}`
-      });
-      
+    beforeUpload: (file) => {
       // Create UploadFile object with originFileObj properly set
       const uploadFile: UploadFile = {
         uid: file.uid || `upload-${Date.now()}-${Math.random()}`,
@@ -303,165 +386,129 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
         originFileObj: file,
       };
       
-      console.log('Created uploadFile object:', uploadFile);
-      
-      setUploadFiles(prev => {
-        const newList = [...prev, uploadFile];
-        console.log('Updated uploadFiles list:', newList);
-        return newList;
-      });
+      setUploadFiles(prev => [...prev, uploadFile]);
       
       return false; // Prevent default upload
     },
     onRemove: (file) => {
-      console.log('onRemove called for file:', file.name);
-      setUploadFiles(prev => {
-        const newList = prev.filter(f => f.uid !== file.uid);
-        console.log('After remove, uploadFiles:', newList);
-        return newList;
-      });
+      setUploadFiles(prev => prev.filter(f => f.uid !== file.uid));
     },
     fileList: uploadFiles,
   };
 
   const handleUploadAll = async () => {
-    console.log('=== STORAGE FILES FRONTEND DEBUG ===');
-    console.log('handleUploadAll called');
-    console.log('Current uploadFiles:', uploadFiles);
-    console.log('Current path:', currentPath);
-    console.log('Storage ID:', storageId);
-
     if (uploadFiles.length === 0) {
-      console.error('No files to upload');
       message.warning('Please select files to upload');
       return;
     }
 
-    let successCount = 0;
-    let errorCount = 0;
     const totalFiles = uploadFiles.length;
     const failedFiles: string[] = [];
-
-    console.log(`Starting upload of ${totalFiles} files...`);
-
-    for (const uploadFile of uploadFiles) {
-      const file = uploadFile.originFileObj as File;
-      console.log(`Processing uploadFile:`, {
-        uid: uploadFile.uid,
-        name: uploadFile.name,
-        hasOriginFile: !!file
-      });
-
-      if (file) {
-        try {
-          console.log(`=== Uploading individual file: ${file.name} ===`);
-          console.log('File details:', {
-            name: file.name,
-            size: file.size,
-            type: file.type,
-            lastModified: file.lastModified
-          });
-          console.log('Upload parameters:', {
-            storageId,
-            currentPath,
-            file: file.name
-          });
-          
-          const result = await uploadMutation.mutateAsync({ file, path: currentPath });
-          console.log(`✅ Upload successful for ${file.name}:`, result);
-          successCount++;
-        } catch (error) {
-          console.error(`❌ Upload failed for ${file.name}:`, error);
-          errorCount++;
-          failedFiles.push(file.name);
+    let successCount = 0;
+    let nextIndex = 0;
+
+    // Each worker pulls the next pending file, so at most MAX_CONCURRENT_UPLOADS requests are in flight
+    const worker = async () => {
+      while (nextIndex < uploadFiles.length) {
+        const uploadFile = uploadFiles[nextIndex++];
+        const file = uploadFile.originFileObj as File | undefined;
+        if (!file) {
+          failedFiles.push(uploadFile.name || 'unknown file');
+        } else {
+          let fileLoaded = 0;
+          try {
+            await apiClient.uploadFileToStorage(storageId, file, currentPath, (loaded) => {
+              // Track the delta so the aggregate stays O(1) per progress event
+              const delta = Math.min(loaded, file.size) - fileLoaded;
+              fileLoaded += delta;
+              if (delta > 0) {
+                setUploadProgress(prev => ({ ...prev, bytesLoaded: prev.bytesLoaded + delta }));
+              }
+            });
+            successCount++;
+          } catch (error: any) {
+            console.error(`Upload failed for ${file.name}:`, error);
+            failedFiles.push(file.name);
+          }
         }
-      } else {
-        console.error(`No file object found for uploadFile:`, uploadFile);
-        errorCount++;
-        failedFiles.push(uploadFile.name || 'unknown file');
+        setUploadProgress(prev => ({ ...prev, completed: prev.completed + 1 }));
       }
-    }
+    };
 
-    console.log('Upload summary:', {
-      totalFiles,
-      successCount,
-      errorCount,
-      failedFiles
-    });
+    const bytesTotal = uploadFiles.reduce((sum, f) => sum + (f.size || 0), 0);
+    setUploadProgress({ completed: 0, total: totalFiles, bytesLoaded: 0, bytesTotal });
+    setIsUploading(true);
+    try {
+      await Promise.all(
+        Array.from({ length: Math.min(MAX_CONCURRENT_UPLOADS, totalFiles) }, worker)
+      );
+    } finally {
+      setIsUploading(false);
+    }
 
     // Provide detailed feedback
     if (successCount > 0) {
       message.success(`${successCount} of ${totalFiles} file(s) uploaded successfully`);
     }
-    if (errorCount > 0) {
-      message.error(`${errorCount} of ${totalFiles} file(s) failed to upload: ${failedFiles.join(', ')}`);
+    if (failedFiles.length > 0) {
+      message.error(`${failedFiles.length} of ${totalFiles} file(s) failed to upload: ${failedFiles.join(', ')}`);
     }
 
-    console.log('Refreshing file list...');
-    // Always refetch to get the latest file list
-    await refetch();
+    // Refresh the listing once for the whole batch
+    await invalidateFiles();
     
     // Close modal and clear state after all uploads are done
     setUploadFiles([]);
-    setUploadProgress({});
+    setUploadProgress({ completed: 0, total: 0, bytesLoaded: 0, bytesTotal: 0 });
     setUploadVisible(false);
-    console.log('=== END STORAGE FILES FRONTEND DEBUG ===');
   };
 
   const pathBreadcrumbs = currentPath.split('/').filter(Boolean);
 
-  const columns: ColumnsType<FileObject> = [
+  // Memoized so local UI state (modals, selection, upload progress) doesn't rebuild every cell
+  const columns: ColumnsType<FileRow> = useMemo(() => [
     {
       title: 'Name',
       dataIndex: 'name',
       key: 'name',
-      render: (name: string, record: FileObject) => {
-        const pathParts = name.split('/');
-        const fileName = pathParts.pop() || '';
-        const folderPath = pathParts.length > 0 ? pathParts.join('/') + '/' : '';
-        
-        return (
-          <div 
-            className="flex items-center space-x-2 cursor-pointer hover:text-blue-600"
-            onDoubleClick={() => handleFileDoubleClick(record)}
-          >
-            {getFileIcon(name, record.isFolder)}
-            <div className="flex flex-col">
-              <span className="font-medium">{fileName}</span>
-              {folderPath && (
-                <span className="text-xs" style={{ color: 'var(--text-secondary)' }}>
-                  <FolderOutlined style={{ fontSize: '10px', marginRight: '4px' }} />
-                  {folderPath}
-                </span>
-              )}
-            </div>
-            {record.isFolder && <Tag size="small" color="blue">Folder</Tag>}
+      render: (name: string, record: FileRow) => (
+        <div 
+          className="flex items-center space-x-2 cursor-pointer hover:text-blue-600"
+          onDoubleClick={() => handleFileDoubleClick(record)}
+        >
+          {getFileIcon(name, record.isFolder)}
+          <div className="flex flex-col">
+            <span className="font-medium">{record.baseName}</span>
+            {record.folderPath && (
+              <span className="text-xs" style={{ color: 'var(--text-secondary)' }}>
+                <FolderOutlined style={{ fontSize: '10px', marginRight: '4px' }} />
+                {record.folderPath}
+              </span>
+            )}
           </div>
-        );
-      },
+          {record.isFolder && <Tag size="small" color="blue">Folder</Tag>}
+        </div>
+      ),
       sorter: (a, b) => a.name.localeCompare(b.name),
     },
     {
       title: 'Size',
-      dataIndex: 'size',
+      dataIndex: 'sizeLabel',
       key: 'size',
-      render: (size: number, record: FileObject) => 
-        record.isFolder ? '-' : formatFileSize(size),
       sorter: (a, b) => (a.size || 0) - (b.size || 0),
       width: 100,
     },
     {
       title: 'Modified',
-      dataIndex: 'created',
+      dataIndex: 'createdLabel',
       key: 'created',
-      render: formatDate,
-      sorter: (a, b) => new Date(a.created).getTime() - new Date(b.created).getTime(),
+      sorter: (a, b) => a.createdMs - b.createdMs,
       width: 180,
     },
     {
       title: 'Actions',
       key: 'actions',
-      render: (_, record: FileObject) => (
+      render: (_, record: FileRow) => (
         <Space size="small">
           {!record.isFolder && (
             <>
@@ -470,7 +517,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
                   type="text"
                   size="small"
                   icon={<DownloadOutlined />}
-                  onClick={() => handleDownload(record.name)}
+                  onClick={() => handleDownload(record)}
                 />
               </Tooltip>
               <Tooltip title="Preview">
@@ -489,7 +536,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
               size="small"
               danger
               icon={<DeleteOutlined />}
-              onClick={() => handleDelete(record.name)}
+              onClick={() => handleDelete(record)}
             />
           </Tooltip>
           <Dropdown
@@ -508,7 +555,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
       ),
       width: 140,
     },
-  ];
+  ], [handleFileDoubleClick, handleDownload, handleDelete]);
 
   return (
     <div className="space-y-4">
@@ -570,7 +617,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
               danger 
               icon={<DeleteOutlined />}
               onClick={handleBulkDelete}
-              loading={deleteMutation.isPending}
+              loading={bulkDeleteMutation.isPending}
             >
               Delete Selected
             </Button>
@@ -602,11 +649,28 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
         }}
         onRow={(record) => ({
           onDoubleClick: () => handleFileDoubleClick(record),
+          onMouseEnter: () => prefetchPreview(record),
+          onMouseLeave: cancelPrefetch,
         })}
         scroll={{ x: 800 }}
         size="small"
       />
 
+      {hasNextPage && (
+        <div style={{ textAlign: 'center', marginTop: 12 }}>
+          <Text type="secondary" style={{ display: 'block', marginBottom: 8 }}>
+            {deferredSearchTerm
+              ? `Searching... ${files.length} files checked so far, results may be incomplete`
+              : `Showing the first ${files.length} files; search and sorting cover loaded files only`}
+          </Text>
+          {!deferredSearchTerm && (
+            <Button onClick={() => fetchNextPage()} loading={isFetchingNextPage}>
+              Load more files
+            </Button>
+          )}
+        </div>
+      )}
+
       {/* Upload Modal */}
       <Modal
         title="Upload Files"
@@ -614,7 +678,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
         onCancel={() => {
           setUploadVisible(false);
           setUploadFiles([]);
-          setUploadProgress({});
+          setUploadProgress({ completed: 0, total: 0, bytesLoaded: 0, bytesTotal: 0 });
         }}
         footer={[
           <Button 
@@ -622,7 +686,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
             onClick={() => {
               setUploadVisible(false);
               setUploadFiles([]);
-              setUploadProgress({});
+              setUploadProgress({ completed: 0, total: 0, bytesLoaded: 0, bytesTotal: 0 });
             }}
           >
             Cancel
@@ -630,7 +694,7 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
           <Button
             key="upload"
             type="primary"
-            loading={uploadMutation.isPending}
+            loading={isUploading}
             disabled={uploadFiles.length === 0}
             onClick={handleUploadAll}
           >
@@ -644,45 +708,44 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
             Upload files to: <Text code>/{currentPath || 'root'}</Text>
           </Text>
           
-          <Dragger {...uploadProps} className="upload-area" disabled={uploadMutation.isPending}>
+          <Dragger {...uploadProps} className="upload-area" disabled={isUploading}>
             <p className="ant-upload-drag-icon">
               <InboxOutlined />
             </p>
             <p className="ant-upload-text">
-              {uploadMutation.isPending 
+              {isUploading 
                 ? 'Uploading files...' 
                 : 'Click or drag files to this area to upload'
               }
             </p>
             <p className="ant-upload-hint">
-              {uploadMutation.isPending 
+              {isUploading 
                 ? 'Please wait while files are being uploaded.' 
                 : 'Support for multiple files. Files will be uploaded to the current directory.'
               }
             </p>
           </Dragger>
 
-          {/* Show selected files */}
-          {uploadFiles.length > 0 && !uploadMutation.isPending && (
-            <div className="space-y-2">
-              <Text strong>Selected Files ({uploadFiles.length}):</Text>
-              <div className="max-h-32 overflow-y-auto">
-                {uploadFiles.map((file) => (
-                  <div key={file.uid} className="flex items-center justify-between p-2 bg-gray-50 rounded">
-                    <span className="text-sm">{file.name}</span>
-                    <span className="text-xs text-gray-500">
-                      {((file.size || 0) / 1024 / 1024).toFixed(2)} MB
-                    </span>
-                  </div>
-                ))}
-              </div>
-            </div>
+          {/* The Dragger already lists each selected file; summarize the batch in one line */}
+          {uploadFiles.length > 0 && !isUploading && (
+            <Text strong>
+              Selected Files ({uploadFiles.length}): {formatBytes(uploadFiles.reduce((sum, f) => sum + (f.size || 0), 0))}
+            </Text>
           )}
 
           {/* Upload Progress */}
-          {uploadMutation.isPending && (
+          {isUploading && (
             <div className="text-center">
-              <Text type="secondary">Uploading files, please wait...</Text>
+              <Progress
+                percent={uploadProgress.bytesTotal
+                  ? Math.round((uploadProgress.bytesLoaded / uploadProgress.bytesTotal) * 100)
+                  : uploadProgress.total ? Math.round((uploadProgress.completed / uploadProgress.total) * 100) : 0}
+                status="active"
+              />
+              <Text type="secondary">
+                Uploaded {uploadProgress.completed} of {uploadProgress.total} file(s)
+                {uploadProgress.bytesTotal > 0 && ` (${formatBytes(uploadProgress.bytesLoaded)} of ${formatBytes(uploadProgress.bytesTotal)})`}...
+              </Text>
             </div>
           )}
         </div>
@@ -690,11 +753,11 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
 
       {/* File Preview Modal */}
       <Modal
-        title={`Preview: ${previewFile?.name.split('/').pop()}`}
+        title={`Preview: ${previewFile?.baseName}`}
         open={!!previewFile}
         onCancel={() => setPreviewFile(null)}
         footer={[
-          <Button key="download" onClick={() => previewFile && handleDownload(previewFile.name)}>
+          <Button key="download" onClick={() => previewFile && handleDownload(previewFile)}>
             Download
           </Button>,
           <Button key="close" onClick={() => setPreviewFile(null)}>
@@ -705,20 +768,36 @@ export default function StorageFileManager({ storageId, storageName }: StorageFi
       >
         {previewFile && (
           <div className="text-center py-8">
-            <div className="text-6xl mb-4">
-              {getFileIcon(previewFile.name)}
-            </div>
-            <Title level={4}>{previewFile.name.split('/').pop()}</Title>
+            {isImagePreview ? (
+              <div className="mb-4">
+                {previewUrl ? (
+                  <img
+                    src={previewUrl}
+                    alt={previewFile.baseName}
+                    style={{ maxWidth: '100%', maxHeight: 400, margin: '0 auto' }}
+                  />
+                ) : (
+                  <Spin spinning={isPreviewLoading} />
+                )}
+              </div>
+            ) : (
+              <div className="text-6xl mb-4">
+                {getFileIcon(previewFile.name)}
+              </div>
+            )}
+            <Title level={4}>{previewFile.baseName}</Title>
             <div className="space-y-2 text-left bg-gray-50 rounded p-4 mt-4">
-              <Text><strong>Size:</strong> {formatFileSize(previewFile.size)}</Text>
+              <Text><strong>Size:</strong> {previewFile.sizeLabel}</Text>
               <br />
-              <Text><strong>Created:</strong> {formatDate(previewFile.created)}</Text>
+              <Text><strong>Created:</strong> {previewFile.createdLabel}</Text>
               <br />
               <Text><strong>Path:</strong> {previewFile.name}</Text>
             </div>
-            <Text type="secondary" className="block mt-4">
-              Preview not available for this file type. Click Download to view the file.
-            </Text>
+            {!isImagePreview && (
+              <Text type="secondary" className="block mt-4">
+                Preview not available for this file type. Click Download to view the file.
+              </Text>
+            )}
           </div>
         )}
       </Modal>
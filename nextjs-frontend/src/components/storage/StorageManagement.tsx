@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import {
   Card,
   Button,
@@ -45,15 +45,41 @@ import {
   ThunderboltOutlined,
   SnowflakeOutlined,
 } from '@ant-design/icons';
+import dynamic from 'next/dynamic';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
+import { formatDateTime, formatStorageSize, parseTimestamp } from '@/lib/utils';
 import type { StorageItem } from '@/types';
-import StorageWorkspaceSelector from './StorageWorkspaceSelector';
-import StorageFileManager from './StorageFileManager';
-import StorageCreationForm from './StorageCreationForm';
-import StorageAnalytics from './StorageAnalytics';
+
+// The file browser only renders inside an expanded row's Files tab; load it on demand
+const StorageFileManager = dynamic(() => import('./StorageFileManager'), {
+  ssr: false,
+  loading: () => <Spin size="small" />,
+});
+
+// The creation modal's form code is only fetched the first time the user opens it
+const StorageCreationForm = dynamic(() => import('./StorageCreationForm'), { ssr: false });
 
 const { Title, Text, Paragraph } = Typography;
+
+function getStorageIcon(storage: StorageItem) {
+  switch (storage.storage_class?.toLowerCase()) {
+    case 'standard':
+      return <ThunderboltOutlined style={{ color: '#1890ff' }} />;
+    case 'nearline':
+      return <SafetyOutlined style={{ color: '#52c41a' }} />;
+    case 'coldline':
+      return <SnowflakeOutlined style={{ color: '#722ed1' }} />;
+    default:
+      return <CloudOutlined style={{ color: '#8c8c8c' }} />;
+  }
+}
+
+function copyToClipboard(text: string) {
+  navigator.clipboard.writeText(text);
+  message.success('Copied to clipboard');
+}
 const { TabPane } = Tabs;
 const { Search } = Input;
 const { Option } = Select;
@@ -68,8 +94,12 @@ type FilterStatus = 'all' | 'active' | 'inactive';
 export default function StorageManagement({ hideCreateButton = false }: StorageManagementProps) {
   const [selectedStorage, setSelectedStorage] = useState<StorageItem | null>(null);
   const [showCreateForm, setShowCreateForm] = useState(false);
-  const [showDetails, setShowDetails] = useState<Record<string, boolean>>({});
-  const [deleteConfirm, setDeleteConfirm] = useState<Record<string, boolean>>({});
+  // Stays true after the first open so the modal keeps its close animation
+  const [createFormMounted, setCreateFormMounted] = useState(false);
+  const openCreateForm = () => {
+    setCreateFormMounted(true);
+    setShowCreateForm(true);
+  };
   const [searchText, setSearchText] = useState('');
   const [sortField, setSortField] = useState<SortField>('created');
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc');
@@ -79,64 +109,70 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
 
   // Fetch user storages
   const { data: storagesResponse, isLoading, error, refetch } = useQuery({
-    queryKey: ['user-storages'],
+    queryKey: queryKeys.userStorages,
     queryFn: () => apiClient.listUserStorages(),
     refetchInterval: 30000, // Refresh every 30 seconds
   });
 
-  const storages = storagesResponse?.storages || [];
+  const storages: StorageItem[] = useMemo(() => storagesResponse?.storages || [], [storagesResponse]);
 
   // Filter and sort storages
-  const filteredStorages = storages
-    .filter(storage => {
-      const matchesSearch = !searchText || 
-        storage.display_name?.toLowerCase().includes(searchText.toLowerCase()) ||
-        storage.bucket_name?.toLowerCase().includes(searchText.toLowerCase()) ||
-        storage.storage_class?.toLowerCase().includes(searchText.toLowerCase());
-      
-      const matchesFilter = filterStatus === 'all' || 
-        (filterStatus === 'active' && storage.status === 'active') ||
-        (filterStatus === 'inactive' && storage.status !== 'active');
-      
-      return matchesSearch && matchesFilter;
-    })
-    .sort((a, b) => {
-      let aVal, bVal;
-      switch (sortField) {
-        case 'name':
-          aVal = a.display_name || a.bucket_name || '';
-          bVal = b.display_name || b.bucket_name || '';
-          break;
-        case 'size':
-          aVal = a.size_bytes || 0;
-          bVal = b.size_bytes || 0;
-          break;
-        case 'created':
-          aVal = new Date(a.created_at).getTime();
-          bVal = new Date(b.created_at).getTime();
-          break;
-        case 'status':
-          aVal = a.status === 'active' ? 1 : 0;
-          bVal = b.status === 'active' ? 1 : 0;
-          break;
-        default:
-          return 0;
-      }
-      
-      if (sortOrder === 'asc') {
-        return aVal > bVal ? 1 : -1;
-      } else {
-        return aVal < bVal ? 1 : -1;
-      }
-    });
+  const filteredStorages = useMemo(() => {
+    const search = searchText.toLowerCase();
+    return storages
+      .filter(storage => {
+        const matchesSearch = !search || 
+          storage.display_name?.toLowerCase().includes(search) ||
+          storage.bucket_name?.toLowerCase().includes(search) ||
+          storage.storage_class?.toLowerCase().includes(search);
+        
+        const matchesFilter = filterStatus === 'all' || 
+          (filterStatus === 'active' && storage.status === 'active') ||
+          (filterStatus === 'inactive' && storage.status !== 'active');
+        
+        return matchesSearch && matchesFilter;
+      })
+      .sort((a, b) => {
+        let aVal, bVal;
+        switch (sortField) {
+          case 'name':
+            aVal = a.display_name || a.bucket_name || '';
+            bVal = b.display_name || b.bucket_name || '';
+            break;
+          case 'size':
+            aVal = a.size_bytes || 0;
+            bVal = b.size_bytes || 0;
+            break;
+          case 'created':
+            aVal = parseTimestamp(a.created_at);
+            bVal = parseTimestamp(b.created_at);
+            break;
+          case 'status':
+            aVal = a.status === 'active' ? 1 : 0;
+            bVal = b.status === 'active' ? 1 : 0;
+            break;
+          default:
+            return 0;
+        }
+        
+        if (sortOrder === 'asc') {
+          return aVal > bVal ? 1 : -1;
+        } else {
+          return aVal < bVal ? 1 : -1;
+        }
+      });
+  }, [storages, searchText, filterStatus, sortField, sortOrder]);
 
-  // Analytics calculations
-  const analytics = {
-    total: storages.length,
-    active: storages.filter(s => s.status === 'active').length,
-    totalSize: storages.reduce((acc, s) => acc + (s.size_bytes || 0), 0),
-    totalObjects: storages.reduce((acc, s) => acc + (s.object_count || 0), 0),
-  };
+  // Analytics calculations, gathered in a single pass over the workspaces
+  const analytics = useMemo(() => {
+    const totals = { total: storages.length, active: 0, totalSize: 0, totalObjects: 0 };
+    for (const storage of storages) {
+      if (storage.status === 'active') totals.active++;
+      totals.totalSize += storage.size_bytes || 0;
+      totals.totalObjects += storage.object_count || 0;
+    }
+    return totals;
+  }, [storages]);
 
   // Delete storage mutation
   const deleteMutation = useMutation({
@@ -145,8 +181,13 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
     onSuccess: (data, variables) => {
       if (data.status === 'deleted') {
         message.success('Workspace deleted successfully!');
-        queryClient.invalidateQueries({ queryKey: ['user-storages'] });
-        setDeleteConfirm(prev => ({ ...prev, [variables.storageId]: false }));
+        // Drop the deleted workspace from the cached list instead of refetching it
+        queryClient.setQueryData<any>(queryKeys.userStorages, (response: any) =>
+          response && {
+            ...response,
+            storages: (response.storages || []).filter((storage: StorageItem) => storage.id !== variables.storageId),
+          }
+        );
       } else {
         message.error(data.message || 'Failed to delete workspace');
       }
@@ -156,58 +197,11 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
     },
   });
 
-  const handleDeleteStorage = (storageId: string) => {
-    deleteMutation.mutate({ storageId, force: true });
-  };
-
-  const formatStorageSize = (sizeBytes: number): string => {
-    if (sizeBytes === 0) return 'Empty';
-    const units = ['B', 'KB', 'MB', 'GB', 'TB'];
-    let size = sizeBytes;
-    let unitIndex = 0;
-    while (size >= 1024 && unitIndex < units.length - 1) {
-      size /= 1024;
-      unitIndex++;
-    }
-    return `${size.toFixed(1)} ${units[unitIndex]}`;
-  };
-
-  const formatDateTime = (dateString: string): string => {
-    if (!dateString) return 'N/A';
-    try {
-      const date = new Date(dateString);
-      return date.toLocaleDateString() + ' ' + date.toLocaleTimeString();
-    } catch {
-      return dateString;
-    }
-  };
-
-  const toggleDetails = (storageId: string) => {
-    setShowDetails(prev => ({
-      ...prev,
-      [storageId]: !prev[storageId]
-    }));
-  };
-
-  const toggleDeleteConfirm = (storageId: string) => {
-    setDeleteConfirm(prev => ({
-      ...prev,
-      [storageId]: !prev[storageId]
-    }));
-  };
-
-  const getStorageIcon = (storage: StorageItem) => {
-    switch (storage.storage_class?.toLowerCase()) {
-      case 'standard':
-        return <ThunderboltOutlined style={{ color: '#1890ff' }} />;
-      case 'nearline':
-        return <SafetyOutlined style={{ color: '#52c41a' }} />;
-      case 'coldline':
-        return <SnowflakeOutlined style={{ color: '#722ed1' }} />;
-      default:
-        return <CloudOutlined style={{ color: '#8c8c8c' }} />;
-    }
-  };
+  // Stable handlers so the memoized table skips renders caused by unrelated state (e.g. the create modal)
+  const { mutate: deleteStorage } = deleteMutation;
+  const handleDeleteStorage = useCallback((storageId: string) => {
+    deleteStorage({ storageId, force: true });
+  }, [deleteStorage]);
 
   const handleBulkAction = (action: string) => {
     const selectedStorages = filteredStorages.filter(s => selectedRowKeys.includes(s.id));
@@ -231,11 +225,6 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
     }
   };
 
-  const copyToClipboard = (text: string) => {
-    navigator.clipboard.writeText(text);
-    message.success('Copied to clipboard');
-  };
-
   if (error) {
     return (
       <Card>
@@ -289,7 +278,7 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
                 <Button
                   type="primary"
                   icon={<PlusOutlined />}
-                  onClick={() => setShowCreateForm(true)}
+                  onClick={openCreateForm}
                 />
               </Tooltip>
             </Space>
@@ -452,7 +441,7 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
               <Button 
                 type="primary" 
                 icon={<PlusOutlined />} 
-                onClick={() => setShowCreateForm(true)}
+                onClick={openCreateForm}
                 size="large"
               >
                 Create First Workspace
@@ -466,12 +455,7 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
           loading={isLoading}
           selectedRowKeys={selectedRowKeys}
           onSelectionChange={setSelectedRowKeys}
-          onToggleDetails={toggleDetails}
           onDelete={handleDeleteStorage}
-          showDetails={showDetails}
-          deleteConfirm={deleteConfirm}
-          onToggleDeleteConfirm={toggleDeleteConfirm}
-          deleteMutation={deleteMutation}
           formatStorageSize={formatStorageSize}
           formatDateTime={formatDateTime}
           getStorageIcon={getStorageIcon}
@@ -480,7 +464,7 @@ export default function StorageManagement({ hideCreateButton = false }: StorageM
       )}
 
       {/* Create Storage Form Modal */}
-      {!hideCreateButton && (
+      {!hideCreateButton && createFormMounted && (
         <StorageCreationForm
           visible={showCreateForm}
           onClose={() => setShowCreateForm(false)}
@@ -500,24 +484,18 @@ interface StorageTableProps {
   loading: boolean;
   selectedRowKeys: string[];
   onSelectionChange: (keys: string[]) => void;
-  onToggleDetails: (id: string) => void;
   onDelete: (id: string) => void;
-  showDetails: Record<string, boolean>;
-  deleteConfirm: Record<string, boolean>;
-  onToggleDeleteConfirm: (id: string) => void;
-  deleteMutation: any;
   formatStorageSize: (bytes: number) => string;
   formatDateTime: (date: string) => string;
   getStorageIcon: (storage: StorageItem) => JSX.Element;
   copyToClipboard: (text: string) => void;
 }
 
-function StorageTable({
+const StorageTable = React.memo(function StorageTable({
   storages,
   loading,
   selectedRowKeys,
   onSelectionChange,
-  onToggleDetails,
   onDelete,
   formatStorageSize,
   formatDateTime,
@@ -649,7 +627,8 @@ function StorageTable({
     <Card className="glass-card">
       <Table
         columns={columns}
-        dataSource={storages.map(s => ({ ...s, key: s.id }))}
+        dataSource={storages}
+        rowKey="id"
         loading={loading}
         rowSelection={{
           selectedRowKeys,
@@ -667,9 +646,10 @@ function StorageTable({
         expandable={{
           expandedRowKeys,
           onExpandedRowsChange: (keys) => setExpandedRowKeys(keys as string[]),
-          expandedRowRender: (record) => (
+          // antd keeps collapsed rows mounted; render nothing for them so their file listings unmount
+          expandedRowRender: (record) => expandedRowKeys.includes(record.id) && (
             <div style={{ margin: '16px 0' }}>
-              <Tabs size="small" defaultActiveKey="details">
+              <Tabs size="small" defaultActiveKey="details" destroyInactiveTabPane>
                 <Tabs.TabPane tab="Details" key="details">
                   <Row gutter={[24, 16]}>
                     <Col span={8}>
@@ -714,5 +694,5 @@ function StorageTable({
       />
     </Card>
   );
-}
+});
 
@@ -22,6 +22,7 @@ import {
   CheckCircleOutlined,
 } from '@ant-design/icons';
 import type { StorageItem } from '@/types';
+import { formatStorageSize } from '@/lib/utils';
 
 const { Title, Text, Paragraph } = Typography;
 const { Option } = Select;
@@ -57,18 +58,6 @@ export default function StorageWorkspaceSelector({
     }
   };
 
-  const formatStorageSize = (sizeBytes: number): string => {
-    if (sizeBytes === 0) return 'Empty';
-    const units = ['B', 'KB', 'MB', 'GB', 'TB'];
-    let size = sizeBytes;
-    let unitIndex = 0;
-    while (size >= 1024 && unitIndex < units.length - 1) {
-      size /= 1024;
-      unitIndex++;
-    }
-    return `${size.toFixed(1)} ${units[unitIndex]}`;
-  };
-
   const formatDateTime = (dateString: string): string => {
     if (!dateString) return 'Unknown';
     try {
@@ -1,6 +1,6 @@
 'use client';
 
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useCallback, useMemo } from 'react';
 import { useSession } from 'next-auth/react';
 
 interface AdminContextType {
@@ -17,32 +17,30 @@ const AdminContext = createContext<AdminContextType | undefined>(undefined);
 export function AdminProvider({ children }: { children: React.ReactNode }) {
   const { data: session } = useSession();
   const [currentRole, setCurrentRole] = useState<'user' | 'admin'>('user');
-  const [isAdmin, setIsAdmin] = useState(false);
 
-  // Check if user has admin role in their session
+  // Check if user has admin role in their session; derived directly instead of mirrored into state
   const canSwitchToAdmin = session?.user?.role === 'admin';
+  const isAdmin = canSwitchToAdmin;
 
+  // Depend on the role flag, not the session object, which changes identity on every session refetch
   useEffect(() => {
-    if (session?.user?.role === 'admin') {
-      setIsAdmin(true);
-    } else {
-      setIsAdmin(false);
+    if (!canSwitchToAdmin) {
       setCurrentRole('user');
     }
-  }, [session]);
+  }, [canSwitchToAdmin]);
 
-  const switchToAdmin = () => {
+  const switchToAdmin = useCallback(() => {
     if (canSwitchToAdmin) {
       setCurrentRole('admin');
       // You could also make an API call here to validate admin access
     }
-  };
+  }, [canSwitchToAdmin]);
 
-  const switchToUser = () => {
+  const switchToUser = useCallback(() => {
     setCurrentRole('user');
-  };
+  }, []);
 
-  const checkAdminStatus = async (): Promise<boolean> => {
+  const checkAdminStatus = useCallback(async (): Promise<boolean> => {
     try {
       // For now, just check if user has admin role in session
       // This can be expanded to make an actual API verification call
@@ -50,17 +48,20 @@ export function AdminProvider({ children }: { children: React.ReactNode }) {
     } catch (error) {
       return false;
     }
-  };
+  }, [canSwitchToAdmin]);
+
+  // Consumers only re-render when the role actually changes
+  const value = useMemo(() => ({
+    isAdmin,
+    canSwitchToAdmin,
+    currentRole,
+    switchToAdmin,
+    switchToUser,
+    checkAdminStatus,
+  }), [isAdmin, canSwitchToAdmin, currentRole, switchToAdmin, switchToUser, checkAdminStatus]);
 
   return (
-    <AdminContext.Provider value={{
-      isAdmin,
-      canSwitchToAdmin,
-      currentRole,
-      switchToAdmin,
-      switchToUser,
-      checkAdminStatus,
-    }}>
+    <AdminContext.Provider value={value}>
       {children}
     </AdminContext.Provider>
   );
@@ -37,6 +37,8 @@ interface NotificationContextType {
 const NotificationContext = createContext<NotificationContextType | undefined>(undefined);
 
 const STORAGE_KEY = 'cmbcluster_notifications';
+// Keep the notification history bounded so long-lived sessions don't grow state/localStorage forever
+const MAX_NOTIFICATIONS = 50;
 
 export function NotificationProvider({ children }: { children: ReactNode }) {
   const [notifications, setNotifications] = useState<NotificationItem[]>([]);
@@ -52,7 +54,7 @@ export function NotificationProvider({ children }: { children: ReactNode }) {
           ...n,
           timestamp: new Date(n.timestamp)
         }));
-        setNotifications(restored);
+        setNotifications(restored.slice(0, MAX_NOTIFICATIONS));
       }
     } catch (error) {
       console.warn('Failed to load saved notifications:', error);
@@ -79,7 +81,7 @@ export function NotificationProvider({ children }: { children: ReactNode }) {
       read: false
     };
 
-    setNotifications(prev => [notificationItem, ...prev]);
+    setNotifications(prev => [notificationItem, ...prev].slice(0, MAX_NOTIFICATIONS));
 
     // Show system notification
     const getIcon = () => {
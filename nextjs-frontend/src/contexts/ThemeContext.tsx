@@ -1,7 +1,8 @@
 'use client';
 
-import { createContext, useContext, useEffect, useState } from 'react';
+import { createContext, useCallback, useContext, useEffect, useMemo, useState } from 'react';
 import { ConfigProvider, theme } from 'antd';
+import type { ThemeConfig } from 'antd';
 
 type Theme = 'light' | 'dark';
 
@@ -12,6 +13,25 @@ interface ThemeContextType {
 
 const ThemeContext = createContext<ThemeContextType | undefined>(undefined);
 
+// Built once per theme so antd can reuse its generated CSS-in-JS styles across renders
+const buildAntdTheme = (mode: Theme): ThemeConfig => ({
+  algorithm: mode === 'dark' ? theme.darkAlgorithm : theme.defaultAlgorithm,
+  token: {
+    colorPrimary: '#4A9EFF',
+    borderRadius: 8,
+    colorBgContainer: mode === 'dark' ? '#1A1F2E' : '#ffffff',
+    colorBgElevated: mode === 'dark' ? '#252B3A' : '#ffffff',
+    colorText: mode === 'dark' ? '#FFFFFF' : '#000000',
+    colorTextSecondary: mode === 'dark' ? '#E2E8F0' : '#666666',
+    colorBorder: mode === 'dark' ? '#2D3748' : '#d9d9d9',
+  },
+});
+
+const ANTD_THEMES: Record<Theme, ThemeConfig> = {
+  light: buildAntdTheme('light'),
+  dark: buildAntdTheme('dark'),
+};
+
 export function ThemeProvider({ children }: { children: React.ReactNode }) {
   const [currentTheme, setCurrentTheme] = useState<Theme>(() => {
     // Try to get theme from document attribute set by the script
@@ -60,26 +80,18 @@ export function ThemeProvider({ children }: { children: React.ReactNode }) {
     }
   }, [currentTheme]);
 
-  const toggleTheme = () => {
+  const toggleTheme = useCallback(() => {
     setCurrentTheme((prev: Theme) => prev === 'dark' ? 'light' : 'dark');
-  };
+  }, []);
 
-  const antdTheme = {
-    algorithm: currentTheme === 'dark' ? theme.darkAlgorithm : theme.defaultAlgorithm,
-    token: {
-      colorPrimary: '#4A9EFF',
-      borderRadius: 8,
-      colorBgContainer: currentTheme === 'dark' ? '#1A1F2E' : '#ffffff',
-      colorBgElevated: currentTheme === 'dark' ? '#252B3A' : '#ffffff',
-      colorText: currentTheme === 'dark' ? '#FFFFFF' : '#000000',
-      colorTextSecondary: currentTheme === 'dark' ? '#E2E8F0' : '#666666',
-      colorBorder: currentTheme === 'dark' ? '#2D3748' : '#d9d9d9',
-    },
-  };
+  const contextValue = useMemo(
+    () => ({ theme: currentTheme, toggleTheme }),
+    [currentTheme, toggleTheme]
+  );
 
   return (
-    <ThemeContext.Provider value={{ theme: currentTheme, toggleTheme }}>
-      <ConfigProvider theme={antdTheme}>
+    <ThemeContext.Provider value={contextValue}>
+      <ConfigProvider theme={ANTD_THEMES[currentTheme]}>
         {children}
       </ConfigProvider>
     </ThemeContext.Provider>
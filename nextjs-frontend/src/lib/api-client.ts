@@ -19,12 +19,16 @@ const API_CONFIG = {
   timeout: 30000, // 30 seconds
   retries: 3,
   retryDelay: 1000, // 1 second
+  // getSession() is a round trip to /api/auth/session; reuse it across a burst of requests
+  sessionCacheMs: 5000,
 };
 
 class CMBClusterAPIClient {
   private api: AxiosInstance;
   private isRefreshing = false;
   private refreshPromise: Promise<string | null> | null = null;
+  private sessionPromise: ReturnType<typeof getSession> | null = null;
+  private sessionFetchedAt = 0;
 
   constructor() {
     this.api = axios.create({
@@ -116,12 +120,28 @@ class CMBClusterAPIClient {
     );
   }
 
+  /**
+   * Share one session lookup between requests fired together (e.g. a page's initial queries)
+   */
+  private getCachedSession(): ReturnType<typeof getSession> {
+    const now = performance.now();
+    if (!this.sessionPromise || now - this.sessionFetchedAt > API_CONFIG.sessionCacheMs) {
+      this.sessionFetchedAt = now;
+      this.sessionPromise = getSession().catch((error) => {
+        // Don't keep serving a failed lookup
+        this.sessionPromise = null;
+        throw error;
+      });
+    }
+    return this.sessionPromise;
+  }
+
   /**
    * Get backend JWT token from NextAuth session
    */
   private async getBackendToken(): Promise<string | null> {
     try {
-      const session = await getSession();
+      const session = await this.getCachedSession();
       
       // If no session, can't get token
       if (!session) {
@@ -181,8 +201,9 @@ class CMBClusterAPIClient {
   private async performTokenRefresh(): Promise<string | null> {
     try {
       // In NextAuth, token refresh happens automatically
-      // We just need to get a fresh session
-      const session = await getSession();
+      // We just need to get a fresh session, bypassing the short-lived cache
+      this.sessionPromise = null;
+      const session = await this.getCachedSession();
       return session?.accessToken || null;
     } catch (error) {
       console.error('Token refresh request failed:', error);
@@ -333,7 +354,8 @@ class CMBClusterAPIClient {
     }
   }
 
-  async getEnvironmentById(envId: string): Promise<ApiResponse<Environment>> {
+  // Callers that already hold the environments list can pass it to skip the fallback list request
+  async getEnvironmentById(envId: string, knownEnvironments?: Environment[]): Promise<ApiResponse<Environment>> {
     try {
       
       // Try direct API endpoint first
@@ -352,9 +374,9 @@ class CMBClusterAPIClient {
       }
 
       // Fallback to list approach
-      const listResponse = await this.listEnvironments();
-      if (listResponse.environments) {
-        const env = listResponse.environments.find(
+      const environments = knownEnvironments ?? (await this.listEnvironments()).environments;
+      if (environments) {
+        const env = environments.find(
           e => e.id === envId || e.env_id === envId
         );
         if (env) {
@@ -402,8 +424,8 @@ class CMBClusterAPIClient {
         throw new Error(`Failed to stop environment: ${deleteResponse.message}`);
       }
 
-      // Wait a moment for cleanup
-      await new Promise(resolve => setTimeout(resolve, 3000));
+      // Wait until the old pod no longer counts as active, otherwise create returns it as "existing"
+      await this.waitForEnvironmentInactive(envId);
 
       // Create new environment with previous config
       const createResponse = await this.createEnvironment(currentConfig);
@@ -423,6 +445,42 @@ class CMBClusterAPIClient {
     }
   }
 
+  // Poll with exponential backoff instead of sleeping for a fixed cleanup period
+  private async waitForEnvironmentInactive(envId?: string, timeoutMs: number = 30000): Promise<void> {
+    // Monotonic clock, so a system clock adjustment can't cut the wait short or stretch it
+    const deadline = performance.now() + timeoutMs;
+    let delay = 250;
+
+    while (performance.now() < deadline) {
+      if (await this.isEnvironmentInactive(envId)) {
+        return;
+      }
+      await new Promise(resolve => setTimeout(resolve, delay));
+      delay = Math.min(delay * 2, 2000);
+    }
+
+    throw new Error(
+      `Environment is still shutting down after ${Math.round(timeoutMs / 1000)}s; try restarting again shortly`
+    );
+  }
+
+  // Checks the environment being restarted; the user-wide active flag would also count their other environments
+  private async isEnvironmentInactive(envId?: string): Promise<boolean> {
+    if (!envId) {
+      const statusResponse: any = await this.getEnvironmentStatus();
+      return statusResponse?.status === 'error' || statusResponse?.active === false;
+    }
+
+    try {
+      const response = await this.api.get(`/environments/${envId}/info`);
+      const status = response.data?.environment?.status;
+      return status !== 'running' && status !== 'pending';
+    } catch (error: any) {
+      // A deleted environment no longer has a record; other failures are retried until the deadline
+      return error?.response?.status === 404;
+    }
+  }
+
   async stopEnvironment(envId?: string): Promise<ApiResponse> {
     try {
       const result = await this.deleteEnvironment(envId);
@@ -557,10 +615,24 @@ class CMBClusterAPIClient {
     }
   }
 
+  // Gzip a file in the browser; returns null when unsupported or not worth it
+  private async gzipFile(file: File): Promise<Blob | null> {
+    if (typeof CompressionStream === 'undefined') {
+      return null;
+    }
+    try {
+      const stream = file.stream().pipeThrough(new CompressionStream('gzip'));
+      const compressed = await new Response(stream).blob();
+      return compressed.size < file.size ? compressed : null;
+    } catch {
+      return null;
+    }
+  }
+
   // User file management
-  async listUserFiles(): Promise<ApiResponse<UserFile[]>> {
+  async listUserFiles(params?: { offset?: number; limit?: number }): Promise<ApiResponse<UserFile[]>> {
     try {
-      const response = await this.api.get('/user-files');
+      const response = await this.api.get('/user-files', { params });
       return await this.handleResponse(response);
     } catch (error) {
       return this.handleError(error);
@@ -595,7 +667,14 @@ class CMBClusterAPIClient {
 
       
       const formData = new FormData();
-      formData.append('file', file, file.name);
+      // JSON compresses well; send it gzipped when the browser supports it
+      const compressed = await this.gzipFile(file);
+      if (compressed) {
+        formData.append('file', compressed, file.name);
+        formData.append('content_encoding', 'gzip');
+      } else {
+        formData.append('file', file, file.name);
+      }
       formData.append('file_type', fileType);
       formData.append('environment_variable_name', envVarName.trim());
       
@@ -669,10 +748,18 @@ class CMBClusterAPIClient {
   }
 
   // Storage file operations
-  async listStorageFiles(storageId: string, prefix?: string): Promise<any> {
+  async listStorageFiles(
+    storageId: string,
+    prefix?: string,
+    page?: { limit: number; pageToken?: string }
+  ): Promise<any> {
     try {
       const params: any = {};
       if (prefix) params.prefix = prefix;
+      if (page) {
+        params.limit = page.limit;
+        if (page.pageToken) params.page_token = page.pageToken;
+      }
       const response = await this.api.get(`/storage/${storageId}/files`, { params });
       return response.data;
     } catch (error) {
@@ -680,7 +767,12 @@ class CMBClusterAPIClient {
     }
   }
 
-  async uploadFileToStorage(storageId: string, file: File, path?: string): Promise<any> {
+  async uploadFileToStorage(
+    storageId: string,
+    file: File,
+    path?: string,
+    onProgress?: (loadedBytes: number, totalBytes?: number) => void
+  ): Promise<any> {
     try {
      
 
@@ -710,6 +802,10 @@ class CMBClusterAPIClient {
       
       const response = await this.api.post(`/storage/${storageId}/upload`, formData, {
         params: params,
+        timeout: 0, // Large files can take longer than the default 30s request timeout
+        onUploadProgress: onProgress
+          ? (event) => onProgress(event.loaded, event.total)
+          : undefined,
         headers: {
           'Content-Type': undefined, // Let axios set multipart/form-data with boundary
         },
@@ -769,6 +865,17 @@ class CMBClusterAPIClient {
     }
   }
 
+  async deleteFilesFromStorage(storageId: string, fileNames: string[]): Promise<any> {
+    try {
+      const response = await this.api.post(`/storage/${storageId}/files/bulk-delete`, {
+        file_paths: fileNames
+      });
+      return await this.handleResponse(response);
+    } catch (error) {
+      return this.handleError(error);
+    }
+  }
+
   // Activity log
   async getActivityLog(limit: number = 50): Promise<ApiResponse> {
     try {
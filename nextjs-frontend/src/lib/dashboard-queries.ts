@@ -0,0 +1,41 @@
+import { useQuery } from '@tanstack/react-query';
+import { useSession } from 'next-auth/react';
+import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
+import { environmentsQueryOptions } from '@/lib/environment-queries';
+import type { StorageItem } from '@/types';
+
+// Background refresh for the dashboard counters
+const DASHBOARD_REFRESH_INTERVAL = 30 * 1000;
+
+// Shared by the home and dashboard pages so both read the same cached queries
+export function useDashboardData() {
+  const { data: session } = useSession();
+  const enabled = !!session?.user;
+
+  // Polled through React Query, sharing cached data with the environment and storage pages
+  const envQuery = useQuery({
+    ...environmentsQueryOptions(),
+    enabled,
+    refetchInterval: DASHBOARD_REFRESH_INTERVAL,
+  });
+
+  const storageQuery = useQuery({
+    queryKey: queryKeys.userStorages,
+    queryFn: () => apiClient.listUserStorages(),
+    select: (response: any) => (response.storages || []) as StorageItem[],
+    enabled,
+    refetchInterval: DASHBOARD_REFRESH_INTERVAL,
+  });
+
+  const queryError = envQuery.error || storageQuery.error;
+
+  return {
+    environments: envQuery.data ?? [],
+    storages: storageQuery.data ?? [],
+    loading: envQuery.isLoading || storageQuery.isLoading,
+    error: queryError
+      ? (queryError instanceof Error ? queryError.message : 'Failed to load dashboard data')
+      : null,
+  };
+}
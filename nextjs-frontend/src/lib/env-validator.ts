@@ -61,6 +61,7 @@ class EnvironmentValidator {
   private static instance: EnvironmentValidator;
   private config: EnvironmentConfig | null = null;
   private runtimeConfig: any = null;
+  private runtimeConfigPromise: Promise<any> | null = null;
   
   private constructor() {}
   
@@ -71,11 +72,19 @@ class EnvironmentValidator {
     return EnvironmentValidator.instance;
   }
   
-  private async fetchRuntimeConfig(): Promise<any> {
+  private fetchRuntimeConfig(): Promise<any> {
     if (this.runtimeConfig) {
-      return this.runtimeConfig;
+      return Promise.resolve(this.runtimeConfig);
     }
     
+    // Every API request resolves its base URL through here; share one in-flight fetch
+    if (!this.runtimeConfigPromise) {
+      this.runtimeConfigPromise = this.loadRuntimeConfig();
+    }
+    return this.runtimeConfigPromise;
+  }
+  
+  private async loadRuntimeConfig(): Promise<any> {
     try {
       // Only fetch on client side
       if (typeof window !== 'undefined') {
@@ -0,0 +1,50 @@
+import type { QueryClient } from '@tanstack/react-query';
+import { apiClient } from '@/lib/api-client';
+import { queryKeys } from '@/lib/query-keys';
+import type { Environment } from '@/types';
+
+// Every view of the environments list shares this definition, so one fetch serves all of them
+export function environmentsQueryOptions() {
+  return {
+    queryKey: queryKeys.environments,
+    queryFn: async (): Promise<Environment[]> => {
+      const response = await apiClient.listEnvironments();
+      // Fail the query rather than caching an empty list, so the last good list stays visible
+      if (response.status === 'error') {
+        throw new Error(response.message || response.error || 'Failed to load environments');
+      }
+      return response.environments || [];
+    },
+    // A failed list request has usually already waited out the API timeout; wait for the next poll
+    retry: false,
+  };
+}
+
+// Shared by every view of a single environment so they agree on the cached shape
+export function environmentQueryOptions(envId: string, queryClient: QueryClient) {
+  return {
+    queryKey: queryKeys.environment(envId),
+    queryFn: async (): Promise<Environment> => {
+      const response = await apiClient.getEnvironmentById(
+        envId,
+        queryClient.getQueryData<Environment[]>(queryKeys.environments)
+      );
+      if (response.status === 'success' && response.environment) {
+        return response.environment;
+      }
+      throw new Error(response.message || 'Environment not found');
+    },
+    // Show the entry from an already-cached environments list while the detail request runs
+    placeholderData: () =>
+      queryClient
+        .getQueryData<Environment[]>(queryKeys.environments)
+        ?.find(env => env.id === envId || env.env_id === envId),
+  };
+}
+
+// Stopping deletes the environment server-side, so drop it from the cached list instead of refetching
+export function removeEnvironmentFromCache(queryClient: QueryClient, envId: string) {
+  queryClient.setQueryData<Environment[]>(queryKeys.environments, (environments) =>
+    environments?.filter(env => env.id !== envId && env.env_id !== envId)
+  );
+}
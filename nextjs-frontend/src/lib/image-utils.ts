@@ -3,41 +3,15 @@ import React from 'react';
 
 /**
  * Get API base URL for client-side usage
- * This fetches the runtime config on first call and caches it
+ * Resolved through the env validator, so images share the API client's single /api/config request
  */
 let cachedApiUrl: string | null = null;
-let fetchPromise: Promise<string> | null = null;
 
-async function getClientApiUrl(): Promise<string> {
-  if (cachedApiUrl) {
-    return cachedApiUrl;
+export async function getClientApiUrl(): Promise<string> {
+  if (cachedApiUrl === null) {
+    cachedApiUrl = await getApiUrlAsync();
   }
-
-  // If fetch is already in progress, return the same promise
-  if (fetchPromise) {
-    return fetchPromise;
-  }
-
-  // Fetch runtime config from the API route
-  fetchPromise = (async () => {
-    try {
-      const response = await fetch('/api/config');
-      if (response.ok) {
-        const config = await response.json();
-        const apiUrl = config.apiUrl || '';
-        cachedApiUrl = apiUrl;
-        return apiUrl;
-      }
-    } catch (error) {
-      console.warn('Failed to fetch API config:', error);
-    }
-
-    // Fallback: return empty string and let it fail gracefully
-    cachedApiUrl = '';
-    return '';
-  })();
-
-  return fetchPromise;
+  return cachedApiUrl;
 }
 
 /**
@@ -85,23 +59,12 @@ export function getImageUrlSync(iconUrl: string | undefined | null): string {
     return iconUrl;
   }
 
-  // Get API base URL from window object if available (set by config route)
-  let apiBaseUrl = '';
-  if (typeof window !== 'undefined') {
-    // Check if we have a cached config in window
-    const windowWithConfig = window as any;
-    if (windowWithConfig.__RUNTIME_CONFIG__?.apiUrl) {
-      apiBaseUrl = windowWithConfig.__RUNTIME_CONFIG__.apiUrl;
-    }
-  }
-
   // Trigger async fetch if not available (will cache for next render)
-  if (!apiBaseUrl && !cachedApiUrl) {
+  if (cachedApiUrl === null) {
     getClientApiUrl();
   }
 
-  // Use cached value if available
-  apiBaseUrl = apiBaseUrl || cachedApiUrl || '';
+  const apiBaseUrl = cachedApiUrl || '';
 
   // If it's a relative URL starting with /data/, convert to API URL
   if (iconUrl.startsWith('/data/')) {
@@ -0,0 +1,15 @@
+// Shared React Query cache keys.
+// Components that read the same endpoint must share a key so they share one cache entry
+// (and one invalidation), instead of each building its own ad-hoc key array.
+export const queryKeys = {
+  environments: ['environments'] as const,
+  environment: (envId: string) => ['environment', envId] as const,
+  applications: ['applications'] as const,
+  userStorages: ['user-storages'] as const,
+  storageFiles: (storageId: string) => ['storage-files', storageId] as const,
+  storageFilesAt: (storageId: string, path: string) => ['storage-files', storageId, path] as const,
+  storageFileBlobs: (storageId: string) => ['storage-file-blob', storageId] as const,
+  storageFileBlob: (storageId: string, fileName: string) => ['storage-file-blob', storageId, fileName] as const,
+  userEnvVars: ['userEnvVars'] as const,
+  userFiles: ['userFiles'] as const,
+};
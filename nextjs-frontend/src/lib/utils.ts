@@ -5,27 +5,93 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
 
+const BYTE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB'];
+
 export function formatBytes(bytes: number, decimals: number = 2): string {
-  if (bytes === 0) return '0 B';
+  if (!bytes || bytes < 0) return '0 B';
 
-  const k = 1024;
   const dm = decimals < 0 ? 0 : decimals;
-  const sizes = ['B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB'];
+  // Every unit is 2^10 of the previous one, so the unit index is log2(bytes) / 10
+  const i = Math.min(Math.floor(Math.log2(Math.max(bytes, 1)) / 10), BYTE_UNITS.length - 1);
 
-  const i = Math.floor(Math.log(bytes) / Math.log(k));
+  return parseFloat((bytes / Math.pow(1024, i)).toFixed(dm)) + ' ' + BYTE_UNITS[i];
+}
 
-  return parseFloat((bytes / Math.pow(k, i)).toFixed(dm)) + ' ' + sizes[i];
+export function formatStorageSize(bytes: number): string {
+  if (!bytes) return 'Empty';
+  return formatBytes(bytes, 1);
 }
 
+// Timestamps from the API repeat across polls and re-renders; cache their formatted form
+const DATE_TIME_CACHE_LIMIT = 2000;
+const dateTimeCache = new Map<string, string>();
+
 export function formatDateTime(date: string | Date): string {
   if (!date) return 'N/A';
-  
+
+  if (typeof date === 'string') {
+    const cached = dateTimeCache.get(date);
+    if (cached !== undefined) return cached;
+  }
+
+  let formatted: string;
   try {
     const dateObj = typeof date === 'string' ? new Date(date) : date;
-    return dateObj.toLocaleDateString() + ' ' + dateObj.toLocaleTimeString();
+    formatted = dateObj.toLocaleDateString() + ' ' + dateObj.toLocaleTimeString();
   } catch {
-    return 'Invalid Date';
+    formatted = 'Invalid Date';
+  }
+
+  if (typeof date === 'string') {
+    if (dateTimeCache.size >= DATE_TIME_CACHE_LIMIT) {
+      // Evict the oldest entry (Map preserves insertion order)
+      dateTimeCache.delete(dateTimeCache.keys().next().value as string);
+    }
+    dateTimeCache.set(date, formatted);
+  }
+  return formatted;
+}
+
+// Epoch milliseconds for API timestamps; table sorters parse the same strings O(n log n) times
+const timestampCache = new Map<string, number>();
+
+export function parseTimestamp(date: string): number {
+  const cached = timestampCache.get(date);
+  if (cached !== undefined) return cached;
+
+  const ms = new Date(date).getTime();
+  if (timestampCache.size >= DATE_TIME_CACHE_LIMIT) {
+    timestampCache.delete(timestampCache.keys().next().value as string);
+  }
+  timestampCache.set(date, ms);
+  return ms;
+}
+
+// Uptime labels only change once a minute; polls within the same minute reuse them
+const MINUTE_MS = 60 * 1000;
+const uptimeCache = new Map<string, string>();
+let uptimeCacheMinute = -1;
+
+export function formatUptime(createdAt: string, now: number = Date.now()): string {
+  const minute = Math.floor(now / MINUTE_MS);
+  if (minute !== uptimeCacheMinute) {
+    uptimeCache.clear();
+    uptimeCacheMinute = minute;
+  }
+
+  const cached = uptimeCache.get(createdAt);
+  if (cached !== undefined) return cached;
+
+  const createdMs = parseTimestamp(createdAt);
+  let label = 'N/A';
+  if (!Number.isNaN(createdMs)) {
+    const totalMinutes = Math.max(0, Math.floor((now - createdMs) / MINUTE_MS));
+    const days = Math.floor(totalMinutes / (60 * 24));
+    const hours = Math.floor((totalMinutes % (60 * 24)) / 60);
+    label = days > 0 ? `${days}d ${hours}h` : `${hours}h ${totalMinutes % 60}m`;
   }
+  uptimeCache.set(createdAt, label);
+  return label;
 }
 
 export function sleep(ms: number): Promise<void> {